@@ -0,0 +1,52 @@
+"""Times the Auto-Assignment of Synthetic Tasks: `python -m benchmarks.bench_auto_assign --tasks 100000`."""
+import argparse
+import random
+import statistics
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+from src.auto_assign import balance
+
+
+def synthetic_workload(tasks: int, assignees: int, seed: int = 0) -> tuple[list, list]:
+    """Generates tasks over a year and assignees with up to 20 open tasks due within the next two months.
+
+    Returns: tuple[list, list]: The `(task_id, start_date, due_date)` and `(assignee_id, open_tasks, busy_until)` rows.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    task_rows = []
+    for task_id in range(tasks):
+        start = today + timedelta(days=rng.randint(0, 365))
+        task_rows.append((task_id, start, start + timedelta(days=rng.randint(1, 30))))
+    assignee_rows = []
+    for assignee_id in range(assignees):
+        load = rng.randint(0, 20)
+        assignee_rows.append((assignee_id, load, today + timedelta(days=rng.randint(0, 60)) if load else None))
+    return task_rows, assignee_rows
+
+
+def main() -> None:
+    """Prints the median time of distributing the tasks and the spread of the resulting load per assignee."""
+    parser = argparse.ArgumentParser(description="Time the load-balancing auto-assignment.")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--assignees", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8}{'assignees':>11}{'ms':>10}{'min load':>10}{'max load':>10}")
+    for assignees in args.assignees:
+        task_rows, assignee_rows = synthetic_workload(args.tasks, assignees)
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            assignments = balance(task_rows, assignee_rows)
+            timings.append(1000 * (time.perf_counter() - started))
+        received = Counter(assignee_id for assignee_id, _ in assignments)
+        loads = [load + received[assignee_id] for assignee_id, load, _ in assignee_rows]
+        print(f"{args.tasks:>8}{assignees:>11}{statistics.median(timings):>10.1f}{min(loads):>10}{max(loads):>10}")
+
+
+if __name__ == "__main__":
+    main()
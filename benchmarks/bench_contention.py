@@ -0,0 +1,89 @@
+"""Measures Edit Throughput With N Concurrent Editors: `python -m benchmarks.bench_contention --editors 1 4 16`."""
+import argparse
+import random
+import threading
+import time
+
+from sqlalchemy import select
+
+from src.base import db_engine
+from src.concurrency import compare_and_swap
+from src.models import Project
+
+
+def optimistic_edit(project_id: int) -> bool:
+    """Reads a project's version and budget, then writes the new budget with a compare-and-swap."""
+    with db_engine.unit_of_work() as session:
+        version, budget = session.execute(
+            select(Project.version, Project.project_budget).where(Project.id == project_id)).one()
+        return compare_and_swap(session, Project, project_id, version, {"project_budget": budget})
+
+
+def pessimistic_edit(project_id: int) -> bool:
+    """Locks a project row with SELECT ... FOR UPDATE, then writes the new budget."""
+    with db_engine.unit_of_work() as session:
+        project = session.execute(select(Project).where(Project.id == project_id).with_for_update()).scalar_one()
+        project.project_budget = project.project_budget
+        project.version = project.version + 1
+        return True
+
+
+def run(editors: int, project_ids: list[int], seconds: float, pessimistic: bool) -> tuple[int, int]:
+    """Runs the given number of editor threads for a fixed time and counts applied and stale edits.
+
+    Parameters:
+    editors : int
+        The number of concurrent editor threads.
+    project_ids : list[int]
+        The projects the editors pick from at random; fewer projects mean more contention.
+    seconds : float
+        How long the editors keep submitting.
+    pessimistic : bool
+        Use row locks instead of compare-and-swap updates.
+
+    Returns: tuple[int, int]: The number of applied and the number of stale edits.
+    """
+    edit = pessimistic_edit if pessimistic else optimistic_edit
+    deadline = time.perf_counter() + seconds
+    counts = {"applied": 0, "stale": 0}
+    lock = threading.Lock()
+
+    def editor() -> None:
+        while time.perf_counter() < deadline:
+            applied = edit(random.choice(project_ids))
+            with lock:
+                counts["applied" if applied else "stale"] += 1
+
+    threads = [threading.Thread(target=editor) for _ in range(editors)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts["applied"], counts["stale"]
+
+
+def main() -> None:
+    """Prints edit throughput and stale-edit rate for each number of concurrent editors.
+
+    The benchmark rewrites project budgets with their current values, so it leaves the data unchanged apart from
+    the version counters. Run it against a development database seeded with `src/db_seed.py`.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark concurrent project budget edits.")
+    parser.add_argument("--editors", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--rows", type=int, default=3, help="Number of projects the editors compete for.")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--pessimistic", action="store_true", help="Use SELECT ... FOR UPDATE instead.")
+    args = parser.parse_args()
+    with db_engine.unit_of_work() as session:
+        project_ids = list(session.execute(
+            select(Project.id).where(Project.deleted_at.is_(None)).order_by(Project.id).limit(args.rows)).scalars())
+    mode = "pessimistic" if args.pessimistic else "optimistic"
+    print(f"{'mode':<12}{'editors':>8}{'edits/s':>12}{'stale %':>10}")
+    for editors in args.editors:
+        applied, stale = run(editors, project_ids, args.seconds, args.pessimistic)
+        total = applied + stale
+        print(f"{mode:<12}{editors:>8}{applied / args.seconds:>12.1f}{100 * stale / max(total, 1):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
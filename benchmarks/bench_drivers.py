@@ -0,0 +1,88 @@
+"""Compares psycopg2 and psycopg 3 on the Seeding and Overview Paths: `python -m benchmarks.bench_drivers`."""
+import argparse
+import statistics
+import time
+from typing import Callable, Iterator
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.db_connection import CONNECT_ARGS, DRIVERS
+from src.db_seed import seed_project
+from src.dummy_data import generate_projects
+from src.models import Assignee
+from src.rollups import portfolio
+from src.upserts import upsert_people
+from src.views import load_views
+
+
+def driver_engine(driver: str) -> Engine:
+    """Creates an engine on the configured database that connects with the given driver."""
+    return create_engine(db_engine.engine.url.set(drivername=f"postgresql+{driver}"), connect_args=CONNECT_ARGS)
+
+
+def seeding(projects: int, tasks: int) -> Callable[[Session, int], None]:
+    """Returns a workload seeding generated projects with their tasks and assignments, like the seeding jobs.
+
+    The assignees are resolved before the clock starts, as `seed_database_parallel` does in the parent process,
+    so the timed part is the projects, tasks and assignments each driver writes.
+    """
+    def run(session: Session, run_seed: int) -> None:
+        projects_data = list(generate_projects(projects, tasks, 200, seed=run_seed))
+        assignee_ids = upsert_people(session, Assignee, (assignee for project in projects_data
+                                                         for task in project['tasks']
+                                                         for assignee in task['assignees']))
+        started = time.perf_counter()
+        for project_data in projects_data:
+            seed_project(session, project_data, assignee_ids)
+        session.info["elapsed"] = time.perf_counter() - started
+    return run
+
+
+def overview(session: Session, run_seed: int) -> None:
+    """Reads everything the Data Overview reads on a cold rerun: the views with related rows and the rollup."""
+    started = time.perf_counter()
+    load_views(session, related=True)
+    portfolio(session)
+    session.info["elapsed"] = time.perf_counter() - started
+
+
+def time_workload(engine: Engine, workload: Callable[[Session, int], None], repeat: int) -> Iterator[float]:
+    """Runs a workload `repeat` times in a transaction that is rolled back, and yields the milliseconds of each run.
+
+    Rolling back leaves the database as it was, so the seeding runs can be repeated against the reference dataset.
+    """
+    for number in range(repeat):
+        with Session(engine) as session:
+            workload(session, int(time.time()) + number)
+            session.rollback()
+        yield 1000 * session.info["elapsed"]
+
+
+def main() -> None:
+    """Prints the median and 95th percentile time of the seeding and overview paths per driver.
+
+    Each workload runs once per driver before it is timed, so both drivers see warm caches.
+    """
+    parser = argparse.ArgumentParser(description="Compare psycopg2 and psycopg 3.")
+    parser.add_argument("--drivers", nargs="+", choices=DRIVERS, default=list(DRIVERS))
+    parser.add_argument("--projects", type=int, default=20, help="Projects per seeding run.")
+    parser.add_argument("--tasks", type=int, default=50, help="Tasks per project.")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    workloads = {"seeding": seeding(args.projects, args.tasks), "overview": overview}
+
+    print(f"{'workload':<12}{'driver':<12}{'median ms':>12}{'p95 ms':>10}")
+    for name, workload in workloads.items():
+        for driver in args.drivers:
+            engine = driver_engine(driver)
+            list(time_workload(engine, workload, 1))
+            timings = sorted(time_workload(engine, workload, args.repeat))
+            p95 = timings[min(len(timings) - 1, int(0.95 * len(timings)))]
+            print(f"{name:<12}{driver:<12}{statistics.median(timings):>12.1f}{p95:>10.1f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Replays a Mix of the App's Database Operations With N Users: `python -m benchmarks.bench_load --users 8`."""
+import argparse
+import math
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.concurrency import compare_and_swap
+from src.dashboard_metrics import dashboard_metrics
+from src.jobs import enqueue_job
+from src.models import Project, Task, Assignee
+from src.purge import mark_deleted
+from src.upserts import create_project_with_manager, insert_person, assign_tasks
+from src.views import Views, cached_views
+from utils.utilities import projects_to_df, managers_to_df, tasks_to_df, assignees_to_df
+
+DEFAULT_MIX = "dashboard=30,overview=20,edit_budget=10,edit_status=15,edit_salary=10,add_project=5,add_task=5," \
+              "delete_project=5"
+DEADLOCK_CODES = ("40P01", "40001")
+LOAD_TEST_PREFIX = "Load test"
+
+Operation = Callable[[Session, random.Random], bool]
+
+
+def dashboard(session: Session, rng: random.Random) -> bool:
+    """Refreshes the Dashboard page's counts and tasks-per-assignee chart data, shared by all simulated users."""
+    dashboard_metrics.refresh(session)
+    return True
+
+
+def _load_all(session: Session) -> Views:
+    """Loads the rows the Edit Data page loads on every script run."""
+    return cached_views(session)
+
+
+def overview(session: Session, rng: random.Random) -> bool:
+    """Loads the Data Overview page's rows with their related rows and converts them to dataframes."""
+    views = cached_views(session, related=True)
+    projects_to_df(views.projects)
+    tasks_to_df(views.tasks)
+    assignees_to_df(views.assignees)
+    managers_to_df(views.managers)
+    return True
+
+
+def edit_budget(session: Session, rng: random.Random) -> bool:
+    """Loads the Edit Data page and submits a project budget edit; False means the edit was stale."""
+    projects = _load_all(session)[0]
+    project = rng.choice(projects)
+    return compare_and_swap(session, Project, project.id, project.version,
+                            {"project_budget": project.project_budget + rng.randint(-100, 100)})
+
+
+def edit_status(session: Session, rng: random.Random) -> bool:
+    """Loads the Edit Data page and submits a task status change; False means the edit was stale."""
+    task = rng.choice(_load_all(session)[2])
+    return compare_and_swap(session, Task, task.id, task.version,
+                            {"status": rng.choice(["not_started", "in_progres", "done"])})
+
+
+def edit_salary(session: Session, rng: random.Random) -> bool:
+    """Loads the Edit Data page and submits a salary change; False means the edit was stale."""
+    assignee = rng.choice(_load_all(session)[3])
+    return compare_and_swap(session, Assignee, assignee.id, assignee.version,
+                            {"salary": assignee.salary + rng.randint(-100, 100)})
+
+
+def add_project(session: Session, rng: random.Random) -> bool:
+    """Loads the Edit Data page and adds a project with a new manager."""
+    _load_all(session)
+    key = uuid.uuid4().hex[:12]
+    return create_project_with_manager(
+        session, {"project_name": f"{LOAD_TEST_PREFIX} {key}", "project_aim": "Load test", "project_budget": 1000},
+        {"firstname": "Load", "lastname": "Test", "salary": 1000, "email": f"load-{key}@example.com"}
+    ) is not None
+
+
+def add_task(session: Session, rng: random.Random) -> bool:
+    """Loads the Edit Data page, adds a task to a project and assigns it to a new and an existing assignee."""
+    projects, _, _, assignees = _load_all(session)
+    task = Task(task_name=f"{LOAD_TEST_PREFIX} task", start_date=date.today(), due_date=date.today(),
+                status="not_started", project_id=rng.choice(projects).id)
+    session.add(task)
+    session.flush()
+    key = uuid.uuid4().hex[:12]
+    new_assignee_id = insert_person(session, Assignee, {"firstname": "Load", "lastname": "Test", "salary": 1000,
+                                                        "email": f"load-{key}@example.com"})
+    assign_tasks(session, [(new_assignee_id, task.id), (rng.choice(assignees).id, task.id)])
+    return True
+
+
+def delete_project(session: Session, rng: random.Random) -> bool:
+    """Loads the Edit Data page and deletes a project created by the load test, queueing its purge."""
+    projects = [project for project in _load_all(session)[0] if project.project_name.startswith(LOAD_TEST_PREFIX)]
+    if not projects:
+        return add_project(session, rng)
+    project = rng.choice(projects)
+    if not mark_deleted(session, Project, project.id):
+        return False
+    enqueue_job(session, "purge_project", {"id": project.id})
+    return True
+
+
+OPERATIONS: dict[str, Operation] = {
+    "dashboard": dashboard,
+    "overview": overview,
+    "edit_budget": edit_budget,
+    "edit_status": edit_status,
+    "edit_salary": edit_salary,
+    "add_project": add_project,
+    "add_task": add_task,
+    "delete_project": delete_project,
+}
+
+
+def parse_mix(mix: str) -> dict[str, int]:
+    """Parses a mix such as `dashboard=30,overview=20` into operation weights.
+
+    Raises:
+    ValueError: If the mix names an unknown operation or has no positive weight.
+    """
+    weights: dict[str, int] = {}
+    for part in filter(None, (part.strip() for part in mix.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {name}. Choose from {', '.join(OPERATIONS)}.")
+        weights[name] = int(weight or 1)
+    if not any(weight > 0 for weight in weights.values()):
+        raise ValueError("The mix needs at least one operation with a positive weight.")
+    return weights
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of an already sorted list, or 0.0 for an empty list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))]
+
+
+def classify(error: Exception) -> str:
+    """Sorts a failed operation into "deadlock" for deadlocks and serialization failures, otherwise "error"."""
+    if isinstance(error, DBAPIError) and getattr(error.orig, "pgcode", None) in DEADLOCK_CODES:
+        return "deadlock"
+    return "error"
+
+
+@dataclass
+class OperationStats:
+    """Latencies and failure counts collected for one operation type."""
+
+    latencies: list[float] = field(default_factory=list)
+    stale: int = 0
+    deadlock: int = 0
+    error: int = 0
+
+    def rate(self, outcome: str) -> float:
+        """Returns the percentage of runs with the given outcome ("stale", "deadlock" or "error")."""
+        return 100 * getattr(self, outcome) / max(len(self.latencies), 1)
+
+
+def run(users: int, weights: dict[str, int], seconds: float, think_time: float,
+        seed: int) -> dict[str, OperationStats]:
+    """Runs simulated users that each pick weighted operations in their own unit of work until the time is up.
+
+    Every user is a thread with its own session, like a Streamlit script run, and waits up to `think_time`
+    seconds between operations.
+
+    Returns: dict[str, OperationStats]: The latencies in seconds and stale, deadlock and error counts per operation.
+    """
+    names, name_weights = list(weights), list(weights.values())
+    results: dict[str, OperationStats] = defaultdict(OperationStats)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def user(number: int) -> None:
+        rng = random.Random(seed + number)
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, name_weights)[0]
+            started = time.perf_counter()
+            outcome = "ok"
+            try:
+                with db_engine.unit_of_work() as session:
+                    if not OPERATIONS[name](session, rng):
+                        outcome = "stale"
+            except Exception as e:
+                outcome = classify(e)
+            elapsed = time.perf_counter() - started
+            with lock:
+                stats = results[name]
+                stats.latencies.append(elapsed)
+                if outcome != "ok":
+                    setattr(stats, outcome, getattr(stats, outcome) + 1)
+            if think_time:
+                time.sleep(rng.uniform(0, think_time))
+
+    threads = [threading.Thread(target=user, args=(number,)) for number in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return dict(results)
+
+
+def main() -> None:
+    """Prints throughput, latency percentiles and stale, deadlock and error rates per operation for each user count.
+
+    Edits rewrite existing rows with small changes, adds create rows prefixed with "Load test" and deletes only
+    remove those rows again, queueing purge jobs for the worker. Run it against a development database seeded with
+    `src/db_seed.py`, never against production data.
+    """
+    parser = argparse.ArgumentParser(description="Replay a mix of the app's operations with N simulated users.")
+    parser.add_argument("--users", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Comma separated operation=weight pairs.")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Maximum pause between operations.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    weights = parse_mix(args.mix)
+    db_engine.engine.echo = False
+
+    header = f"{'users':>6} {'operation':<15}{'ops/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}" \
+             f"{'stale %':>9}{'deadlk %':>9}{'error %':>9}"
+    print(header)
+    for users in args.users:
+        results = run(users, weights, args.seconds, args.think_time, args.seed)
+        for name, stats in sorted(results.items()):
+            latencies = sorted(stats.latencies)
+            print(f"{users:>6} {name:<15}{len(latencies) / args.seconds:>9.1f}"
+                  f"{1000 * percentile(latencies, 0.50):>9.1f}{1000 * percentile(latencies, 0.95):>9.1f}"
+                  f"{1000 * percentile(latencies, 0.99):>9.1f}"
+                  f"{stats.rate('stale'):>9.1f}{stats.rate('deadlock'):>9.1f}{stats.rate('error'):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
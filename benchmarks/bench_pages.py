@@ -0,0 +1,138 @@
+"""Renders the App's Pages Headlessly per Dataset Size: `python -m benchmarks.bench_pages --sizes 10 100 1000`."""
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from streamlit.testing.v1 import AppTest
+
+from src.base import db_engine
+from src.db_seed import drop_tables, create_database, seed_database
+from src.dummy_data import generate_projects
+from src.queries import compiled_cache_stats
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGES = ("Home.py", "pages/1_Dashboard.py", "pages/2_Data_Overview.py", "pages/3_Edit_Data.py", "pages/5_Timeline.py")
+BUDGETS_FILE = Path(__file__).resolve().parent / "page_budgets.json"
+DATASET_SEED = 35
+RERUN_TIMEOUT = 120.0
+
+
+@contextmanager
+def count_queries() -> Iterator[list[int]]:
+    """Counts the statements sent to the database while the block runs; the count is the list's only item."""
+    counter = [0]
+
+    def before_cursor_execute(*args: Any) -> None:
+        counter[0] += 1
+
+    event.listen(db_engine.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(db_engine.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def rerun(app: AppTest) -> float:
+    """Reruns the page and returns the elapsed seconds.
+
+    Raises:
+    RuntimeError: If the page raised an exception during the run.
+    """
+    started = time.perf_counter()
+    app.run(timeout=RERUN_TIMEOUT)
+    elapsed = time.perf_counter() - started
+    if app.exception:
+        raise RuntimeError(f"{app.exception[0].message}")
+    return elapsed
+
+
+def measure_page(page: str, reruns: int) -> dict[str, float]:
+    """Renders a page once to warm up, then measures its full reruns.
+
+    The latency is the median of `reruns` reruns. Queries are counted on one rerun, together with the share of
+    them whose SQL came from the compiled cache, and the memory is the peak traced by `tracemalloc` during a
+    separate rerun, so tracing does not slow down the timed ones.
+
+    Returns: dict[str, float]: The rerun latency in milliseconds, the query count, the compiled cache hit rate
+    (1.0 for a rerun without queries) and the peak memory in megabytes.
+    """
+    app = AppTest.from_file(str(ROOT / page), default_timeout=RERUN_TIMEOUT)
+    rerun(app)
+    latencies = [rerun(app) for _ in range(reruns)]
+    before = compiled_cache_stats.snapshot()
+    with count_queries() as queries:
+        rerun(app)
+    hit_rate = compiled_cache_stats.hit_rate(since=before)
+    tracemalloc.start()
+    try:
+        rerun(app)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"latency_ms": 1000 * statistics.median(latencies), "queries": queries[0],
+            "cache_hit_rate": 1.0 if hit_rate is None else hit_rate, "memory_mb": peak / 2 ** 20}
+
+
+def over_budget(page: str, measured: dict[str, float], budgets: dict[str, dict[str, float]]) -> list[str]:
+    """Lists the measurements of a page that exceed its budget, e.g. "queries 12 > 9"."""
+    budget = budgets.get(page, {})
+    return [f"{metric} {measured[metric]:.1f} > {limit}" for metric, limit in budget.items()
+            if metric in measured and measured[metric] > limit]
+
+
+def grow_dataset(seeded: int, size: int, tasks: int, assignees: int) -> None:
+    """Seeds the generated projects numbered from `seeded` up to `size`, so each dataset extends the previous one."""
+    seed_database(islice(generate_projects(size, tasks, assignees, seed=DATASET_SEED), seeded, None))
+
+
+def main() -> None:
+    """Prints rerun latency, query count and peak memory per page and dataset size, and fails on a blown budget.
+
+    The budgets in `benchmarks/page_budgets.json` apply to every dataset size, so a query count budget catches a
+    new lazy load whose queries grow with the number of rows. The datasets are generated projects added on top
+    of the existing data; pass `--reset` to start from empty tables. Run it against a development database only.
+
+    Exits with status 1 if any page exceeds its budget.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark headless page reruns against growing datasets.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Generated projects.")
+    parser.add_argument("--tasks", type=int, default=20, help="Tasks per project.")
+    parser.add_argument("--assignees", type=int, default=500, help="Size of the assignee pool.")
+    parser.add_argument("--reruns", type=int, default=5, help="Timed reruns per page.")
+    parser.add_argument("--pages", nargs="+", default=list(PAGES))
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_FILE)
+    parser.add_argument("--reset", action="store_true", help="Drop and recreate all tables first.")
+    args = parser.parse_args()
+    budgets = json.loads(args.budgets.read_text()) if args.budgets.exists() else {}
+    db_engine.engine.echo = False
+    if args.reset:
+        drop_tables()
+        create_database()
+
+    failures: list[str] = []
+    seeded = 0
+    print(f"{'projects':>9} {'page':<28}{'rerun ms':>10}{'queries':>9}{'cached':>8}{'peak MB':>9}  budget")
+    for size in sorted(args.sizes):
+        grow_dataset(seeded, size, args.tasks, args.assignees)
+        seeded = size
+        for page in args.pages:
+            measured = measure_page(page, args.reruns)
+            exceeded = over_budget(page, measured, budgets)
+            failures.extend(f"{page} at {size} projects: {item}" for item in exceeded)
+            print(f"{size:>9} {page:<28}{measured['latency_ms']:>10.1f}{measured['queries']:>9.0f}"
+                  f"{measured['cache_hit_rate']:>8.0%}{measured['memory_mb']:>9.1f}  {'; '.join(exceeded) or 'ok'}")
+    if failures:
+        print("\nBudget exceeded:\n" + "\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Times Critical-Path Scheduling of Large Projects: `python -m benchmarks.bench_schedule --tasks 10000 50000`."""
+import argparse
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from src.scheduling import Schedule
+
+
+def synthetic_project(size: int, dependencies: int, seed: int = 0) -> tuple[list[tuple[int, date, date]],
+                                                                            set[tuple[int, int]]]:
+    """Generates `size` tasks where each task depends on up to `dependencies` of the 100 tasks created before it.
+
+    The planned start dates fall within a week, so the dependencies rather than the plan decide most start dates
+    and slips travel far down the graph.
+
+    Returns: tuple[list, set]: The `(task_id, start_date, due_date)` rows and the `(task_id, depends_on_id)` pairs.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    tasks = []
+    for task_id in range(size):
+        start = today + timedelta(days=rng.randint(0, 7))
+        tasks.append((task_id, start, start + timedelta(days=rng.randint(1, 20))))
+    edges = {(task_id, rng.randrange(max(0, task_id - 100), task_id))
+             for task_id in range(1, size) for _ in range(dependencies)}
+    return tasks, edges
+
+
+def main() -> None:
+    """Prints the time of a full schedule per project size and the time and reach of single-task slips.
+
+    Each slip moves the due date of a random task back by up to ten days; the reach is the number of tasks whose
+    earliest start moved with it.
+    """
+    parser = argparse.ArgumentParser(description="Time full and incremental critical-path scheduling.")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--dependencies", type=int, default=2, help="Dependencies per task.")
+    parser.add_argument("--slips", type=int, default=200, help="Random single-task slips per project.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8}{'full ms':>10}{'slip ms':>10}{'p95 slip ms':>13}{'moved tasks':>13}")
+    for size in args.tasks:
+        tasks, edges = synthetic_project(size, args.dependencies, args.seed)
+        started = time.perf_counter()
+        schedule = Schedule(tasks, edges)
+        full = 1000 * (time.perf_counter() - started)
+        rng = random.Random(args.seed)
+        timings, moved = [], []
+        for _ in range(args.slips):
+            task_id, start, due = tasks[rng.randrange(size)]
+            tasks[task_id] = (task_id, start, due + timedelta(days=rng.randint(1, 10)))
+            started = time.perf_counter()
+            moved.append(len(schedule.update_task(*tasks[task_id])))
+            timings.append(1000 * (time.perf_counter() - started))
+        timings.sort()
+        print(f"{size:>8}{full:>10.1f}{statistics.median(timings):>10.2f}"
+              f"{timings[int(0.95 * (len(timings) - 1))]:>13.2f}{statistics.mean(moved):>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Measures Seeding Throughput per Number of Worker Processes: `python -m benchmarks.bench_seed --workers 1 2 4`."""
+import argparse
+import time
+
+from src.db_seed import seed_database, seed_database_parallel
+from src.dummy_data import generate_projects
+
+
+def main() -> None:
+    """Seeds a generated dataset once serially and once per worker count and prints the throughput of each run.
+
+    Each run uses a different generator seed, so the runs insert new projects instead of skipping the ones whose
+    managers already exist. Run it against a development database created with `src/db_seed.py`.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark serial and parallel seeding.")
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=50, help="Tasks per project.")
+    parser.add_argument("--assignees", type=int, default=2000, help="Size of the assignee pool.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+    run_seed = int(time.time())
+
+    rows = args.projects * (1 + args.tasks * 3)
+    started = time.perf_counter()
+    seed_database(generate_projects(args.projects, args.tasks, args.assignees, seed=run_seed))
+    elapsed = time.perf_counter() - started
+    print(f"{'mode':<10}{'workers':>8}{'seconds':>10}{'rows/s':>12}")
+    print(f"{'serial':<10}{1:>8}{elapsed:>10.1f}{rows / elapsed:>12.0f}")
+    for number, workers in enumerate(args.workers, start=1):
+        report = seed_database_parallel(
+            generate_projects(args.projects, args.tasks, args.assignees, seed=run_seed + number), workers=workers)
+        print(f"{'parallel':<10}{workers:>8}{report['seconds']:>10.1f}{report['rows_per_second']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
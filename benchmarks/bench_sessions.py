@@ -0,0 +1,85 @@
+"""Compares the Default and the Read-Only Unit of Work on the Read Pages: `python -m benchmarks.bench_sessions`."""
+import argparse
+import statistics
+import time
+from typing import Callable, ContextManager, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from src.base import db_engine
+from src.dashboard_metrics import MetricsRefresher
+from src.models import Task
+from src.rollups import portfolio
+from src.views import load_views
+from src.workload import load_assignees, load_assignments
+
+
+def dashboard(session: Session) -> None:
+    """Reads everything the Dashboard reads on a cold rerun: the metrics in full and the assignments."""
+    MetricsRefresher().refresh(session)
+    load_assignments(session)
+    load_assignees(session)
+
+
+def overview(session: Session) -> None:
+    """Reads everything the Data Overview reads on a cold rerun: the views with related rows and the rollup."""
+    load_views(session, related=True)
+    portfolio(session)
+
+
+def entities(session: Session) -> None:
+    """Loads every task with its assignees as ORM instances, the way the pages read before they used views."""
+    for task in session.execute(select(Task).options(selectinload(Task.assignees))).scalars():
+        _ = task.project_id, [assignee.lastname for assignee in task.assignees]
+
+
+WORKLOADS: dict[str, Callable[[Session], None]] = {
+    "dashboard": dashboard,
+    "overview": overview,
+    "entities": entities,
+}
+MODES: dict[str, Callable[[], ContextManager[Session]]] = {
+    "default": db_engine.unit_of_work,
+    "read-only": db_engine.read_only_unit_of_work,
+}
+
+
+def time_workload(workload: Callable[[Session], None], unit_of_work: Callable[[], ContextManager[Session]],
+                  repeat: int) -> Iterator[float]:
+    """Runs a workload in a fresh unit of work `repeat` times and yields the milliseconds each run took.
+
+    The time includes leaving the unit of work, where the default session commits and expires its instances.
+    """
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with unit_of_work() as session:
+            workload(session)
+        yield 1000 * (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Prints the median and 95th percentile time of each read workload in the default and the read-only session.
+
+    Each workload runs once in each session before it is timed, so both see warm caches.
+    """
+    parser = argparse.ArgumentParser(description="Compare the default and the read-only unit of work.")
+    parser.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), default=list(WORKLOADS))
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    db_engine.engine.echo = False
+
+    print(f"{'workload':<12}{'session':<12}{'median ms':>12}{'p95 ms':>10}")
+    for name in args.workloads:
+        medians = {}
+        for mode, unit_of_work in MODES.items():
+            list(time_workload(WORKLOADS[name], unit_of_work, 1))
+            timings = sorted(time_workload(WORKLOADS[name], unit_of_work, args.repeat))
+            medians[mode] = statistics.median(timings)
+            p95 = timings[min(len(timings) - 1, int(0.95 * len(timings)))]
+            print(f"{name:<12}{mode:<12}{medians[mode]:>12.1f}{p95:>10.1f}")
+        print(f"{'':<12}{'speedup':<12}{medians['default'] / medians['read-only']:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
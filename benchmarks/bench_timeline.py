@@ -0,0 +1,83 @@
+"""Times the Timeline at Several Zoom Levels on a Large Portfolio: `python -m benchmarks.bench_timeline`."""
+import argparse
+import statistics
+import time
+from datetime import timedelta
+
+from sqlalchemy import func, insert, literal, select, true
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.models import Assignee, AssigneeTask, Task
+from src.timeline import LANE_KINDS, MAX_MARKS, load_timeline, timeline_extent
+
+ZOOM_DAYS = (None, 90, 28)
+
+
+def grow_tasks(session: Session, tasks: int) -> int:
+    """Copies the existing tasks with shifted dates until the table holds at least `tasks` tasks.
+
+    Every copy stays in the project of its original and is assigned to one assignee, so the lanes of both kinds
+    fill up. The caller rolls the session back afterwards.
+
+    Returns: int: The number of tasks in the table.
+    """
+    existing = session.execute(select(func.count()).select_from(Task)).scalar_one()
+    copies = max(0, -(-tasks // existing) - 1)
+    if not copies:
+        return existing
+    last_id = session.execute(select(func.max(Task.id))).scalar_one()
+    copy = func.generate_series(1, copies).table_valued("copy").render_derived("copies")
+    shift = copy.c.copy * 7
+    session.execute(insert(Task).from_select(
+        ["task_name", "start_date", "due_date", "status", "project_id", "created_at", "version"],
+        select(Task.task_name, Task.start_date + shift, Task.due_date + shift, Task.status, Task.project_id,
+               func.now(), literal(1)).join(copy, true())))
+    assignees = (select(Assignee.id, (func.row_number().over(order_by=Assignee.id) - 1).label("number"))
+                 .where(Assignee.deleted_at.is_(None)).subquery())
+    assignee_count = select(func.count()).select_from(assignees).scalar_subquery()
+    session.execute(insert(AssigneeTask).from_select(
+        ["assignee_id", "task_id", "created_at", "version"],
+        select(assignees.c.id, Task.id, func.now(), literal(1))
+        .join(assignees, assignees.c.number == Task.id % assignee_count).where(Task.id > last_id)))
+    session.connection().exec_driver_sql("ANALYZE tasks, assignee_tasks")
+    return session.execute(select(func.count()).select_from(Task)).scalar_one()
+
+
+def main() -> None:
+    """Prints the bucket width, marks and median time of the first page of lanes of each kind per zoom level.
+
+    The zoom levels are the whole extent of the tasks and the windows of `ZOOM_DAYS` days from its start. The
+    copied tasks are written in a transaction that is rolled back and the indexes of the tables rebuilt, so the
+    database is left as it was.
+    """
+    parser = argparse.ArgumentParser(description="Time the timeline at several zoom levels.")
+    parser.add_argument("--tasks", type=int, default=100000, help="Tasks in the portfolio.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    db_engine.engine.echo = False
+
+    with Session(db_engine.engine) as session:
+        total = grow_tasks(session, args.tasks)
+        first, last = timeline_extent(session)
+        print(f"{total} tasks from {first} to {last}, at most {MAX_MARKS} marks")
+        print(f"{'lanes':<10}{'window days':>12}{'bucket days':>12}{'marks':>8}{'median ms':>11}")
+        for kind in LANE_KINDS:
+            for days in ZOOM_DAYS:
+                window = (first, last if days is None else first + timedelta(days=days - 1))
+                timings = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    timeline = load_timeline(session, kind, window)
+                    timings.append(1000 * (time.perf_counter() - started))
+                print(f"{kind:<10}{(window[1] - window[0]).days + 1:>12}{timeline.bucket_days:>12}"
+                      f"{len(timeline.marks):>8}{statistics.median(timings):>11.1f}")
+        session.rollback()
+    # The rolled-back copies still left their entries in the indexes, which would tilt the plans of other queries.
+    with db_engine.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.exec_driver_sql("REINDEX TABLE tasks")
+        connection.exec_driver_sql("REINDEX TABLE assignee_tasks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Times the Workload Analytics on Synthetic Assignments: `python -m benchmarks.bench_workload --sizes 100000`."""
+import argparse
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from src.base import db_engine
+from src.workload import ASSIGNMENT_COLUMNS, load_assignments, load_assignees, workload
+
+STATUSES = np.array(["not_started", "in_progres", "done"], dtype=object)
+BUDGET_MS = 1000.0
+
+
+def synthetic_assignments(size: int, assignees: int, seed: int = 0) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Generates `size` assignments spread over `assignees` assignees and a year of start and due dates.
+
+    Returns: tuple[pd.DataFrame, pd.DataFrame]: The frames `load_assignments` and `load_assignees` would return.
+    """
+    rng = np.random.default_rng(seed)
+    start = np.datetime64(date.today() - timedelta(days=180)) + rng.integers(0, 365, size).astype("timedelta64[D]")
+    assignments = pd.DataFrame({
+        "assignee_id": rng.integers(1, assignees + 1, size),
+        "task_id": np.arange(1, size + 1),
+        "status": STATUSES[rng.integers(0, len(STATUSES), size)],
+        "start_date": start,
+        "due_date": start + rng.integers(1, 60, size).astype("timedelta64[D]"),
+    }, columns=ASSIGNMENT_COLUMNS)
+    people = pd.DataFrame({"Full name": [f"Assignee {number}" for number in range(1, assignees + 1)],
+                           "Salary": rng.uniform(30000, 120000, assignees)},
+                          index=pd.Index(np.arange(1, assignees + 1), name="id"))
+    return assignments, people
+
+
+def main() -> None:
+    """Prints the median time of the workload summary per number of assignments and fails above the budget.
+
+    With `--database` the assignments of the configured database are timed as well, split into the query and the
+    summary.
+
+    Exits with status 1 if a synthetic summary takes longer than `--budget-ms`.
+    """
+    parser = argparse.ArgumentParser(description="Time the vectorized workload summary.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000], help="Assignments.")
+    parser.add_argument("--assignees", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="Budget for 100000 assignments.")
+    parser.add_argument("--database", action="store_true", help="Also time the configured database's data.")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'assignments':>12}{'summary ms':>12}")
+    for size in args.sizes:
+        assignments, assignees = synthetic_assignments(size, args.assignees)
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            workload(assignments, assignees)
+            timings.append(1000 * (time.perf_counter() - started))
+        elapsed = statistics.median(timings)
+        print(f"{size:>12}{elapsed:>12.1f}")
+        if size <= 100000 and elapsed > args.budget_ms:
+            failures.append(f"{size} assignments: {elapsed:.1f} ms > {args.budget_ms} ms")
+
+    if args.database:
+        db_engine.engine.echo = False
+        with db_engine.unit_of_work() as session:
+            started = time.perf_counter()
+            assignments, assignees = load_assignments(session), load_assignees(session)
+            loaded = time.perf_counter()
+            workload(assignments, assignees)
+            finished = time.perf_counter()
+        print(f"\nDatabase: {len(assignments)} assignments, query {1000 * (loaded - started):.1f} ms, "
+              f"summary {1000 * (finished - loaded):.1f} ms")
+    if failures:
+        print("\nBudget exceeded:\n" + "\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""Checks the Query Plans of All App Statements Against Fixtures: `python -m benchmarks.query_plans [--update]`."""
+import argparse
+import hashlib
+import json
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from sqlalchemy import event, select, func, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from streamlit.testing.v1 import AppTest
+
+from src.auto_assign import auto_assign_project
+from src.base import db_engine
+from src.concurrency import compare_and_swap
+from src.db_seed import seed_project, seed_database_parallel
+from src.dummy_data import generate_projects
+from src.jobs import enqueue_job, claim_next_job, requeue_stale_jobs, recent_jobs
+from src.models import Project, Manager, Task, Assignee
+from src.purge import (project_cascade_size, manager_cascade_size, assignee_cascade_size, mark_deleted, purge_project,
+                       purge_manager, purge_assignee)
+from src.timeline import LANE_KINDS, MAX_MARKS, load_timeline, timeline_extent
+from src.upserts import insert_person, upsert_people, create_project_with_manager, assign_tasks
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGES = ("pages/1_Dashboard.py", "pages/2_Data_Overview.py", "pages/3_Edit_Data.py", "pages/4_Jobs.py",
+         "pages/5_Timeline.py")
+FIXTURES_FILE = ROOT / "tests" / "fixtures" / "query_plans.json"
+MIN_TASKS = 10000
+REFERENCE_DATASET = {"projects": 1000, "tasks_per_project": 20, "assignees": 500, "seed": 37}
+EXPLAINED_KEYWORDS = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+# The catalog queries of the dialect and the IDs `src.bulk_copy.reserve_ids` draws read no app table.
+IGNORED_MARKERS = ("pg_catalog", "pg_is_in_recovery", "current_schema", "EXPLAIN", "pg_get_serial_sequence")
+PARAMETER_CAST = re.compile(r"(%\(\w+\)s)::(?:TIMESTAMP(?: WITH(?:OUT)? TIME ZONE)?|[A-Z]+(?:\(\d+\))?)(?:\[\])*")
+SHAPE_LINE = re.compile(r"^\s*(?P<node>[A-Za-z ]+?)(?: on (?P<relation>\w+))?(?: using (?P<index>\w+))?$")
+
+Statement = tuple[str, Any]
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapses whitespace, numbered bind parameters and repeated VALUES or IN groups of a statement.
+
+    Multi-row inserts and expanded IN lists render one parameter group per row, so the same statement would get
+    a different text for every batch size; normalizing makes the text a stable fixture key. The type casts psycopg 3
+    renders after bind parameters are dropped, so both drivers share the fixtures.
+    """
+    statement = re.sub(r"\s+", " ", statement).strip()
+    statement = PARAMETER_CAST.sub(r"\1", statement)
+    statement = re.sub(r"%\((\w+?)_(?:m)?\d+\)s", r"%(\1)s", statement)
+    statement = re.sub(r"(%\(\w+\)s)(?:, \1)+", r"\1", statement)
+    return re.sub(r"(\((?:[^()]|\(\w+\))*\))(?:, \1)+", r"\1", statement)
+
+
+def statement_key(statement: str) -> str:
+    """Returns a short stable key for a statement, the first 12 hex digits of its normalized text's SHA-1."""
+    return hashlib.sha1(normalize_sql(statement).encode()).hexdigest()[:12]
+
+
+def plan_shape(plan: dict[str, Any], depth: int = 0) -> list[str]:
+    """Flattens an `EXPLAIN (FORMAT JSON)` plan into indented lines of node type, relation and index.
+
+    Conflict arbiter indexes of `INSERT ... ON CONFLICT` are listed as their own "Conflict Arbiter" lines, so
+    losing the unique index behind an upsert is caught as well.
+
+    Returns: list[str]: Lines such as "  Index Scan on projects using projects_pkey", parents before children.
+    """
+    line = "  " * depth + plan["Node Type"]
+    if "Relation Name" in plan:
+        line += f" on {plan['Relation Name']}"
+    if "Index Name" in plan:
+        line += f" using {plan['Index Name']}"
+    shape = [line]
+    shape.extend("  " * (depth + 1) + f"Conflict Arbiter using {index}"
+                 for index in plan.get("Conflict Arbiter Indexes", []))
+    for child in plan.get("Plans", []):
+        shape.extend(plan_shape(child, depth + 1))
+    return shape
+
+
+def _scans(shape: list[str]) -> tuple[set[str], set[str]]:
+    """Returns the indexes a plan shape uses and the relations it reads with a sequential scan."""
+    indexes, sequential = set(), set()
+    for line in shape:
+        match = SHAPE_LINE.match(line)
+        if not match:
+            continue
+        if match["index"]:
+            indexes.add(match["index"])
+        if match["node"] == "Seq Scan" and match["relation"]:
+            sequential.add(match["relation"])
+    return indexes, sequential
+
+
+def plan_regressions(expected: list[str], actual: list[str]) -> list[str]:
+    """Compares a plan shape with its fixture and lists lost indexes and new sequential scans.
+
+    Other differences, e.g. a hash join turning into a merge join, are not regressions: they depend on statistics
+    and would make the check flaky.
+
+    Returns: list[str]: Messages such as "lost index ix_tasks_project_id" or "sequential scan on tasks".
+    """
+    expected_indexes, expected_sequential = _scans(expected)
+    actual_indexes, actual_sequential = _scans(actual)
+    return ([f"lost index {index}" for index in sorted(expected_indexes - actual_indexes)]
+            + [f"sequential scan on {relation}" for relation in sorted(actual_sequential - expected_sequential)])
+
+
+@contextmanager
+def capture_statements() -> Iterator[list[Statement]]:
+    """Records the SQL text and the first parameter set of every statement the engine runs inside the block."""
+    statements: list[Statement] = []
+
+    def before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                              executemany: bool) -> None:
+        if executemany and isinstance(parameters, (list, tuple)):
+            parameters = parameters[0]
+        statements.append((statement, parameters))
+
+    event.listen(db_engine.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db_engine.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def run_pages() -> None:
+    """Renders every page that reads from the database once, headlessly.
+
+    Raises:
+    RuntimeError: If a page raised an exception.
+    """
+    for page in PAGES:
+        app = AppTest.from_file(str(ROOT / page), default_timeout=300)
+        app.run()
+        if app.exception:
+            raise RuntimeError(f"{page}: {app.exception[0].message}")
+
+
+def run_timelines(session: Session) -> None:
+    """Reads the first timeline page of each lane kind as single tasks and, with one mark allowed, as buckets.
+
+    The Timeline page renders only the project lanes over all dates on its first run, so the other statements are
+    run here.
+    """
+    window = timeline_extent(session)
+    for kind in LANE_KINDS:
+        for max_marks in (MAX_MARKS, 1):
+            load_timeline(session, kind, window, max_marks=max_marks)
+
+
+def _ignore_progress(table: str, done: int, total: int) -> None:
+    """Discards purge progress."""
+
+
+def run_writes(session: Session) -> None:
+    """Runs each write the forms, the seeding and the purge jobs issue once on existing rows.
+
+    The session must be joined to an outer transaction that is rolled back afterwards, so nothing is kept.
+    """
+    project = session.execute(select(Project).where(Project.deleted_at.is_(None)).order_by(Project.id)
+                              .limit(1)).scalar_one()
+    task = session.execute(select(Task).where(Task.project_id == project.id).order_by(Task.id).limit(1)).scalar_one()
+    assignee = session.execute(select(Assignee).where(Assignee.deleted_at.is_(None)).order_by(Assignee.id)
+                               .limit(1)).scalar_one()
+    project_id, manager_id, assignee_id = project.id, project.manager_id, assignee.id
+    person = {"firstname": "Plan", "lastname": "Check", "salary": 1, "email": "plan.check@example.com"}
+
+    compare_and_swap(session, Project, project.id, project.version, {"project_budget": project.project_budget})
+    compare_and_swap(session, Task, task.id, task.version, {"status": task.status})
+    compare_and_swap(session, Assignee, assignee.id, assignee.version, {"salary": assignee.salary})
+    assign_tasks(session, [(assignee.id, task.id)])
+    insert_person(session, Assignee, person)
+    upsert_people(session, Assignee, [person, {"firstname": assignee.firstname, "lastname": assignee.lastname,
+                                               "salary": assignee.salary, "email": assignee.email}])
+    create_project_with_manager(session, {"project_name": "Plan check", "project_aim": "Plan check",
+                                          "project_budget": 1}, {**person, "email": "plan.manager@example.com"})
+    seed_project(session, next(generate_projects(1, tasks_per_project=3, assignees=3, seed=-1)))
+    session.add(Task(task_name="Plan check", start_date=task.start_date, due_date=task.due_date,
+                     status="not_started", project_id=project.id))
+    session.flush()
+    auto_assign_project(session, project.id)
+    session.query(Task).filter(Task.id == task.id).delete(synchronize_session='fetch')
+
+    project_cascade_size(session, project.id)
+    manager_cascade_size(session, project.manager_id)
+    assignee_cascade_size(session, assignee.id)
+    mark_deleted(session, Project, project.id)
+    enqueue_job(session, "purge_project", {"id": project.id})
+    claim_next_job(session, "plan-check")
+    requeue_stale_jobs(session)
+    recent_jobs(session)
+    purge_project(session, project_id, on_progress=_ignore_progress)
+    purge_manager(session, manager_id, on_progress=_ignore_progress)
+    purge_assignee(session, assignee_id, on_progress=_ignore_progress)
+
+
+def collect_statements() -> list[Statement]:
+    """Captures the statements of all pages and writes, rolling the writes back."""
+    with capture_statements() as statements:
+        run_pages()
+        with Session(db_engine.engine) as session:
+            run_timelines(session)
+        with db_engine.engine.connect() as connection:
+            transaction = connection.begin()
+            session = Session(bind=connection, join_transaction_mode="create_savepoint")
+            try:
+                run_writes(session)
+            finally:
+                session.close()
+                transaction.rollback()
+    return [(statement, parameters) for statement, parameters in statements
+            if statement.lstrip().upper().startswith(EXPLAINED_KEYWORDS)
+            and not any(marker in statement for marker in IGNORED_MARKERS)]
+
+
+def explain(connection: Connection, statement: str, parameters: Any) -> list[str]:
+    """Returns the plan shape of a statement without running it."""
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar_one()
+    return plan_shape(plan[0]["Plan"])
+
+
+def capture_plans() -> dict[str, dict[str, Any]]:
+    """Explains every distinct statement the app issues and returns the shapes by statement key.
+
+    Raises:
+    RuntimeError: If the database holds fewer than `MIN_TASKS` tasks; on small tables the planner prefers
+    sequential scans everywhere, so the plans would say nothing about the large dataset.
+    """
+    with db_engine.engine.connect() as connection:
+        tasks = connection.execute(select(func.count()).select_from(Task)).scalar_one()
+        if tasks < MIN_TASKS:
+            raise RuntimeError(f"The database holds {tasks} tasks; seed at least {MIN_TASKS}, e.g. with "
+                               f"`python -m benchmarks.bench_seed` or `python -m src.seed_files`.")
+    with db_engine.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        # VACUUM sets the visibility map too, so index-only scans do not depend on when autovacuum last ran.
+        connection.execute(text("VACUUM ANALYZE"))
+    plans: dict[str, dict[str, Any]] = {}
+    statements = collect_statements()
+    with db_engine.engine.connect() as connection:
+        for statement, parameters in statements:
+            key = statement_key(statement)
+            if key not in plans:
+                plans[key] = {"sql": normalize_sql(statement), "shape": explain(connection, statement, parameters)}
+        connection.rollback()
+    return plans
+
+
+def check_plans(plans: dict[str, dict[str, Any]], fixtures: dict[str, dict[str, Any]]) -> list[str]:
+    """Lists the statements without a fixture and the plans that regressed against their fixture."""
+    failures = []
+    for key, plan in sorted(plans.items()):
+        if key not in fixtures:
+            failures.append(f"{key}: no fixture for {plan['sql'][:120]}")
+            continue
+        failures.extend(f"{key}: {regression} in {plan['sql'][:120]}"
+                        for regression in plan_regressions(fixtures[key]["shape"], plan["shape"]))
+    return failures
+
+
+def main() -> None:
+    """Captures the plans of all app statements and compares them with the fixtures, or rewrites the fixtures.
+
+    Run it against a development database holding the reference dataset, which `--seed-reference` seeds into
+    freshly created tables. After an intended schema or query change, review the plans and store them with
+    `--update`. Exits with status 1 if a statement has no fixture or its plan regressed.
+    """
+    parser = argparse.ArgumentParser(description="Check the query plans of the app's statements.")
+    parser.add_argument("--update", action="store_true", help="Store the current plans as the fixtures.")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_FILE)
+    parser.add_argument("--seed-reference", action="store_true",
+                        help="Seed the reference dataset the fixtures were captured on first, into empty tables.")
+    args = parser.parse_args()
+    db_engine.engine.echo = False
+    if args.seed_reference:
+        seed_database_parallel(generate_projects(
+            REFERENCE_DATASET["projects"], REFERENCE_DATASET["tasks_per_project"], REFERENCE_DATASET["assignees"],
+            seed=REFERENCE_DATASET["seed"]))
+    plans = capture_plans()
+    if args.update:
+        args.fixtures.parent.mkdir(parents=True, exist_ok=True)
+        args.fixtures.write_text(json.dumps(plans, indent=2, sort_keys=True) + "\n")
+        print(f"Stored the plans of {len(plans)} statements in {args.fixtures}.")
+        return
+    failures = check_plans(plans, json.loads(args.fixtures.read_text()))
+    print(f"Checked the plans of {len(plans)} statements.")
+    if failures:
+        print("\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
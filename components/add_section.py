@@ -1,11 +1,9 @@
 """This File Serves New Item Section for Add Item Page."""
-from typing import List
 import streamlit as st
-from src.models import Project, Assignee
-from utils.st_utils import header_section, add_new_project, add_new_task, add_new_assignee
+from utils.st_utils import header_section, add_new_project, add_new_task, add_new_assignee, form_fragment
 
 
-def add_section(projects_from_query: List[Project], assignees_from_query: List[Assignee]) -> None:
+def add_section() -> None:
     """Creates an interactive section in the Streamlit application for adding new items to the system.
 
     This function generates a UI section in a Streamlit app that allows users to add new projects,
@@ -13,15 +11,8 @@ def add_section(projects_from_query: List[Project], assignees_from_query: List[A
     different types of items into the system. Users can add a new project, add a new task and assign it
     to a project and an assignee, add a new assignee to the system.
 
-    Parameters:
-    projects_from_query : list[Project]
-        A list of project names or objects obtained from a database query. This list is used to
-        populate the dropdown menu in the "add task" tab where the user can select a project
-        to which the new task will be assigned.
-    assignees_from_query : list[Assignee]
-        A list of assignee names or objects obtained from a database query. This list is used to
-        populate the dropdown menu in the "add task" tab where the user can select an assignee
-        to assign to the new task.
+    Each form is rendered by `form_fragment`, so submitting it reruns only that form. The projects and assignees
+    of the page run populate the dropdown menus of the "add task" tab.
 
     Returns: None: This function does not return any value. It directly modifies the Streamlit UI to provide
         interactive controls for adding new items to the system.
@@ -38,8 +29,8 @@ def add_section(projects_from_query: List[Project], assignees_from_query: List[A
         with left_column:
             tab1, tab2, tab3 = st.tabs(["add project", "add task", "add assignee"])
             with tab1:
-                add_new_project()
+                form_fragment(add_new_project)
             with tab2:
-                add_new_task(assignees_from_query, projects_from_query)
+                form_fragment(add_new_task, "assignees", "projects")
             with tab3:
-                add_new_assignee()
+                form_fragment(add_new_assignee)
@@ -1,14 +1,9 @@
 """Delete Item Section."""
-from typing import List
 import streamlit as st
-from src.models import Project, Manager, Task, Assignee
-from utils.st_utils import header_section, delete_project, delete_manager, delete_task, delete_assignee
+from utils.st_utils import header_section, delete_project, delete_manager, delete_task, delete_assignee, form_fragment
 
 
-def delete_item_section(
-        projects_from_query: List[Project], managers_from_query: List[Manager], tasks_from_query: List[Task],
-        assignees_from_query: List[Assignee]
-) -> None:
+def delete_item_section() -> None:
     """Creates an interactive section in the Streamlit application for deleting various project-related items.
 
     This function generates a section within a Streamlit app that allows users to delete different types of items
@@ -16,19 +11,8 @@ def delete_item_section(
     focused on a specific type of item. Users can select an item from a dropdown menu and submit the form to delete
     the selected item from the database.
 
-    Parameters:
-    projects_from_query : list[Project]
-        A list of project names or identifiers obtained from a database query. This list is used to populate
-        the dropdown menu where the user can select a project to delete.
-    managers_from_query : list[Manager]
-        A list of manager names or identifiers obtained from a database query. This list is used to populate
-        the dropdown menu where the user can select a manager to delete.
-    tasks_from_query : list[Task]
-        A list of task names or identifiers obtained from a database query. This list is used to populate
-        the dropdown menu where the user can select a task to delete.
-    assignees_from_query : list[Assignee]
-        A list of assignee names or identifiers obtained from a database query. This list is used to populate
-        the dropdown menu where the user can select an assignee to delete.
+    Each form is rendered by `form_fragment`, so submitting it reruns only that form, and lists the projects,
+    managers, tasks or assignees of its last run.
 
     Returns:
     None
@@ -44,10 +28,10 @@ def delete_item_section(
             st.divider()
             tab1, tab2, tab3, tab4 = st.tabs(["delete project", "delete manager", "delete task", "delete assignee"])
             with tab1:
-                delete_project(projects_from_query)
+                form_fragment(delete_project, "projects")
             with tab2:
-                delete_manager(managers_from_query)
+                form_fragment(delete_manager, "managers")
             with tab3:
-                delete_task(tasks_from_query)
+                form_fragment(delete_task, "tasks")
             with tab4:
-                delete_assignee(assignees_from_query)
+                form_fragment(delete_assignee, "assignees")
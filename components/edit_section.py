@@ -1,32 +1,22 @@
 """Edit Items Section."""
-from typing import List
 import streamlit as st
-from src.models import Project, Task, Assignee
-from utils.st_utils import header_section, edit_project_budget, assign_task_assignee, change_task_status, set_salary
+from utils.st_utils import (header_section, edit_project_budget, assign_task_assignee, change_task_status, set_salary,
+                            auto_assign_tasks, reschedule_task_dates, add_task_dependency, form_fragment)
 
 
-def edit_section(
-        projects_from_query: List[Project], tasks_from_query: List[Task], assignees_from_query: List[Assignee]
-) -> None:
+def edit_section() -> None:
     """Creates an interactive section in the Streamlit application for editing various project-related items.
 
     This function generates a section within a Streamlit app that allows users to update existing data in the system.
     The section is divided into multiple tabs, each focused on a specific type of update: editing project budgets,
     assigning task assignees, changing task statuses, and setting assignee salaries. Users can make selections
-    from dropdown menus and input fields, and submit their changes to be saved to the database.
+    from dropdown menus and input fields, and submit their changes to be saved to the database. Another tab
+    auto-assigns a project's unassigned tasks.
 
-    Parameters:
-    projects_from_query : list[Project]
-        A list of project names or identifiers obtained from a database query. This list is used to populate
-        the dropdown menus where the user can select a project to edit its budget.
-
-    tasks_from_query : list[Task]
-        A list of task names or identifiers obtained from a database query. This list is used to populate
-        the dropdown menus where the user can select a task to assign an assignee or change its status.
-
-    assignees_from_query : list[Assignee]
-        A list of assignee names or identifiers obtained from a database query. This list is used to populate
-        the dropdown menus where the user can select an assignee to assign to a task or set their salary.
+    Each form is rendered by `form_fragment`, so submitting it reruns only that form. In a full page run the forms
+    use the session and rows the page shares with `shared_form_run`; the projects, tasks and assignees populate the
+    dropdown menus. Rescheduling a task and adding a task dependency update the project's schedule kept for the
+    browser session, and show the project's new end date and critical path.
 
     Returns:
     None
@@ -40,15 +30,24 @@ def edit_section(
             header_section(
                 "Update Items",
                 'Update existing data: assign manager, change project budget, assign task assignee, '
-                'set salary, change task status and check the results in _Data Overview Page_.'
+                'auto-assign tasks, set salary, change task status, reschedule tasks, add task dependencies and check '
+                'the results in _Data Overview Page_.'
             )
         with right_column:
-            tab1, tab2, tab3, tab4 = st.tabs(["edit budget", "assign assignee", "change status", "set salary"])
+            tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["edit budget", "assign assignee", "auto-assign",
+                                                                "change status", "set salary", "reschedule",
+                                                                "add dependency"])
             with tab1:
-                edit_project_budget(projects_from_query)
+                form_fragment(edit_project_budget, "projects")
             with tab2:
-                assign_task_assignee(tasks_from_query, assignees_from_query)
+                form_fragment(assign_task_assignee, "tasks", "assignees")
             with tab3:
-                change_task_status(tasks_from_query)
+                form_fragment(auto_assign_tasks, "projects")
             with tab4:
-                set_salary(assignees_from_query)
+                form_fragment(change_task_status, "tasks")
+            with tab5:
+                form_fragment(set_salary, "assignees")
+            with tab6:
+                form_fragment(reschedule_task_dates, "tasks")
+            with tab7:
+                form_fragment(add_task_dependency, "tasks")
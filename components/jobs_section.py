@@ -0,0 +1,49 @@
+"""This File Holds Background Jobs Section."""
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from src.jobs import enqueue_job, recent_jobs
+from utils.utilities import jobs_to_df
+
+
+def jobs_section(session: Session | Session) -> None:
+    """Displays the background job queue and a form for queueing heavy operations.
+
+    This function lists the most recent jobs with their status and progress, and lets users queue seeding or a
+    purge of all deleted items. Jobs are run by a separate worker process (`python -m src.worker`), so they do not
+    block the app and survive the user's session.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+
+    Returns:
+    None
+        This function does not return any values. It directly updates the Streamlit interface with the retrieved data.
+    """
+    with st.form('queue_job', clear_on_submit=True):
+        st.write("Queue a Job:")
+        selected_kind = st.selectbox('Select a job to queue', ["seed", "purge_deleted"], index=None,
+                                     placeholder="Select a job...", label_visibility="collapsed")
+        submit_button = st.form_submit_button(label='Submit')
+        if submit_button and selected_kind:
+            try:
+                job = enqueue_job(session, selected_kind)
+                st.write(f"The job _'{selected_kind}'_ was queued with id {job.id}.")
+            except Exception as e:
+                session.rollback()
+                st.write(f"An error occurred: {e}")
+        else:
+            st.write('To succeed please select input and smash a Submit button.')
+    all_jobs = []
+    try:
+        all_jobs = recent_jobs(session)
+    except Exception as e:
+        session.rollback()
+        print(f"Error: {e}")
+    with st.container():
+        st.divider()
+        st.button("Refresh")
+        st.dataframe(jobs_to_df(all_jobs), hide_index=True, column_config={
+            "Progress": st.column_config.ProgressColumn("Progress", min_value=0.0, max_value=1.0, format="%.2f")
+        })
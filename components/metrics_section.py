@@ -1,22 +1,21 @@
 """This File Holds Overview Section."""
-from datetime import datetime, timedelta
-
 import streamlit as st
-from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
-from src.base import db_engine
-from src.models import Assignee, Project, Task
+from src.dashboard_metrics import dashboard_metrics
 from utils.st_utils import chart_section
 
 
 def metrics_section(session: Session | Session) -> None:
     """Displays a metrics section in the application interface, summarizing key statistics.
 
-    This function queries the database to retrieve and display various metrics, including the total count of
-    projects, tasks, tasks in progress, tasks completed, and assignees. It also provides the count of new
-    entries and updates within the last five days. The metrics are presented in a grid format using Streamlit's
-    `metric` component.
+    This function retrieves and displays various metrics, including the total count of projects, tasks, tasks in
+    progress, tasks completed, and assignees. It also provides the count of new entries and updates within the last
+    five days. The metrics are presented in a grid format using Streamlit's `metric` component.
+
+    The counts are kept by `dashboard_metrics` between reruns. Each rerun reads the change counters of the tables
+    and the database counts the metrics again only after one of them changed, so an unchanged database costs a
+    single query.
 
     Parameters:
     session : sqlalchemy.orm.session.Session
@@ -43,44 +42,20 @@ def metrics_section(session: Session | Session) -> None:
     - Each metric includes a label, the total count, and the count of new or updated entries in the specified
     time frame.
     """
-    five_days_ago = datetime.now() - timedelta(days=5)
-    all_assignees = []
-    number_of_projects = []
-    number_of_tasks = []
-    number_of_tasks_in_progres = []
-    number_of_tasks_done = []
-    number_of_assignees = []
-    number_of_projects_new = []
-    number_of_tasks_new = []
-    number_of_tasks_in_progres_upd = []
-    number_of_tasks_done_upd = []
-    number_of_assignees_new = []
+    metrics = None
     try:
-        all_assignees = session.query(Assignee)
-        number_of_assignees = session.query(Assignee).count()
-        number_of_assignees_new = session.query(Assignee).filter(Assignee.updated_at >= five_days_ago).count()
-        number_of_projects = session.query(Project).count()
-        number_of_projects_new = session.query(Project).filter(Project.updated_at >= five_days_ago).count()
-        number_of_tasks = session.query(Task).count()
-        number_of_tasks_new = session.query(Task).filter(Task.updated_at >= five_days_ago).count()
-        number_of_tasks_in_progres = session.query(Task).where(and_(Task.status == "in_progres",
-                                                                    Task.updated_at >= five_days_ago)).count()
-        number_of_tasks_in_progres_upd = session.query(Task).where(and_(Task.status == "in_progres",
-                                                                        Task.updated_at >= five_days_ago)).count()
-        number_of_tasks_done = session.query(Task).filter(Task.status == "done").count()
-        number_of_tasks_done_upd = session.query(Task).where(and_(Task.status == "done",
-                                                                  Task.updated_at >= five_days_ago)).count()
+        metrics = dashboard_metrics.refresh(session)
     except Exception as e:
         session.rollback()
         print(f"Error: {e}")
-    finally:
-        db_engine.close_session()
+    if metrics is None:
+        return
     with st.container():
         st.divider()
         col1, col2, col3, col4, col5 = st.columns(5)
-        col1.metric("Projects count", f"{number_of_projects}", f"{number_of_projects_new}")
-        col2.metric("Tasks count", f"{number_of_tasks}", f"{number_of_tasks_new}")
-        col3.metric("Tasks in progress", f"{number_of_tasks_in_progres}", f"{number_of_tasks_in_progres_upd}")
-        col4.metric("Tasks done", f"{number_of_tasks_done}", f"{number_of_tasks_done_upd}")
-        col5.metric("Our Team", f"{number_of_assignees}", f"{number_of_assignees_new}")
-    chart_section(all_assignees)
+        col1.metric("Projects count", f"{metrics.projects}", f"{metrics.projects_updated}")
+        col2.metric("Tasks count", f"{metrics.tasks}", f"{metrics.tasks_updated}")
+        col3.metric("Tasks in progress", f"{metrics.tasks_in_progress}", f"{metrics.tasks_in_progress_updated}")
+        col4.metric("Tasks done", f"{metrics.tasks_done}", f"{metrics.tasks_done_updated}")
+        col5.metric("Our Team", f"{metrics.assignees}", f"{metrics.assignees_updated}")
+    chart_section(metrics.chart)
@@ -1,10 +1,11 @@
 """This File Holds Overview Section."""
+import pandas as pd
 import streamlit as st
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from src.base import db_engine
-from src.models import Assignee, Project, Task, Manager
+from src.change_stamps import table_stamps
+from src.rollups import cached_portfolio
+from src.views import VIEW_MODELS, Views, cached_views
 from utils.utilities import assignees_to_df, projects_to_df, tasks_to_df, managers_to_df
 
 
@@ -29,8 +30,11 @@ def overview_section(session: Session | Session) -> None:
     Notes:
     - The function handles any exceptions that occur during database queries by rolling back the
       session and printing an error message to the console.
-    - The session is closed in the `finally` block to ensure that all resources are properly released
-      after the function completes.
+    - The rows are read by `cached_views` as immutable tuples with the names of their related tasks, assignees,
+      managers and projects, in five queries however many rows there are. One probe of the tables' change stamps
+      decides whether the rows and the portfolio need to be read again at all.
+    - The session belongs to the page's unit of work, which keeps one connection for all reads of the run and
+      closes the session when the run finishes.
     - The data is displayed in a tabbed format, with separate tabs for projects, managers, tasks, and
       assignees. Each tab contains a dataframe showing the relevant data.
 
@@ -39,25 +43,26 @@ def overview_section(session: Session | Session) -> None:
     - **Managers Tab**: Displays a dataframe of all managers, including their associated projects.
     - **Tasks Tab**: Displays a dataframe of all tasks, including their associated projects and assignees.
     - **Assignees Tab**: Displays a dataframe of all assignees, including their assigned tasks.
+    - **Portfolio Tab**: Displays the labour cost of every project against its budget, computed in the database
+      by `cached_portfolio` and recomputed only after one of the underlying rows changed.
     """
-    all_projects = []
-    all_managers = []
-    all_tasks = []
-    all_assignees = []
+    views = Views((), (), (), ())
+    portfolio = pd.DataFrame()
     try:
-        all_projects = session.execute(select(Project).order_by(Project.id)).scalars().all()
-        all_tasks = session.execute(select(Task).order_by(Task.id)).scalars().all()
-        all_assignees = session.execute(select(Assignee).order_by(Assignee.id)).scalars().all()
-        all_managers = session.execute(select(Manager).order_by(Manager.id)).scalars().all()
+        stamps = table_stamps(session, VIEW_MODELS)
+        views = cached_views(session, related=True, stamps=stamps)
+        portfolio = cached_portfolio(session, stamps)
     except Exception as e:
         session.rollback()
         print(f"Error: {e}")
-    finally:
-        db_engine.close_session()
     with st.container():
         st.divider()
-        tab1, tab2, tab3, tab4 = st.tabs(["projects", "managers", "tasks", "assignees"])
-        tab1.dataframe(projects_to_df(all_projects), hide_index=True)
-        tab2.dataframe(managers_to_df(all_managers), hide_index=True)
-        tab3.dataframe(tasks_to_df(all_tasks), hide_index=True)
-        tab4.dataframe(assignees_to_df(all_assignees), hide_index=True)
+        tab1, tab2, tab3, tab4, tab5 = st.tabs(["projects", "managers", "tasks", "assignees", "portfolio"])
+        tab1.dataframe(projects_to_df(views.projects), hide_index=True)
+        tab2.dataframe(managers_to_df(views.managers), hide_index=True)
+        tab3.dataframe(tasks_to_df(views.tasks), hide_index=True)
+        tab4.dataframe(assignees_to_df(views.assignees), hide_index=True)
+        tab5.dataframe(portfolio, hide_index=True, column_config={
+            column: st.column_config.NumberColumn(format="%.0f")
+            for column in ("Budget", "Manager cost", "Assignee cost", "Labour cost", "Remaining")
+        } | {"Budget used": st.column_config.ProgressColumn(format="%.2f", min_value=0, max_value=1)})
@@ -0,0 +1,83 @@
+"""This File Holds Timeline Section."""
+import math
+
+import altair as alt
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from src.timeline import DAYS_PER_WEEK, LANE_KINDS, LANES_PER_PAGE, MAX_MARKS, Timeline, load_timeline, timeline_extent
+
+LANE_HEIGHT = 24
+
+
+def timeline_chart(timeline: Timeline) -> alt.Chart:
+    """Draws single tasks as bars from start to due date, or weekly buckets shaded by their number of active tasks."""
+    lane = alt.Y("lane:N", sort=list(timeline.lanes), title=None)
+    chart = alt.Chart(timeline.marks).properties(height=LANE_HEIGHT * max(len(timeline.lanes), 1))
+    if timeline.bucket_days:
+        return chart.mark_rect().encode(
+            x=alt.X("start:T", title=None), x2="end:T", y=lane,
+            color=alt.Color("tasks:Q", title="Active tasks", scale=alt.Scale(scheme="blues")),
+            tooltip=["lane:N", alt.Tooltip("start:T", title="From"), alt.Tooltip("tasks:Q", title="Active tasks")])
+    return chart.mark_bar(opacity=0.7).encode(
+        x=alt.X("start:T", title=None), x2="end:T", y=lane, color=alt.Color("status:N", title="Status"),
+        tooltip=["lane:N", "task:N", "start:T", alt.Tooltip("end:T", title="due"), "status:N"])
+
+
+def timeline_section(session: Session) -> None:
+    """Displays the tasks over their start and due dates in one lane per project or per assignee.
+
+    The date range to show and the page of lanes are picked with the controls above the chart. The date slider is
+    left out when all tasks fall on one day. The page number is bounded by the number of pages of the previous
+    run, and a page past the last one, left behind when lanes were deleted, shows the first page instead.
+    `load_timeline` reads single tasks when the range holds at most `MAX_MARKS` of them on the page, and otherwise
+    active tasks counted per lane and week in the database, so the browser never receives more than `MAX_MARKS`
+    marks.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+
+    Returns: None: This function does not return any value; it directly modifies the Streamlit UI.
+    """
+    try:
+        extent = timeline_extent(session)
+    except Exception as e:
+        session.rollback()
+        print(f"Error: {e}")
+        return
+    st.divider()
+    if extent is None:
+        st.write("There are no tasks to show yet.")
+        return
+    left_column, middle_column, right_column = st.columns([1, 1, 4])
+    kind = left_column.radio("Lanes per", LANE_KINDS, horizontal=True) or LANE_KINDS[0]
+    known_pages = st.session_state.get(f"timeline_pages_{kind}")
+    page_number = int(middle_column.number_input("Lanes page", min_value=1, max_value=known_pages, value=1, step=1))
+    if known_pages is not None:
+        page_number = min(page_number, known_pages)
+    if extent[0] == extent[1]:
+        window = extent
+        right_column.caption(f"All tasks start and are due on {extent[0]:%Y-%m-%d}.")
+    else:
+        window = right_column.slider("Dates", min_value=extent[0], max_value=extent[1], value=extent,
+                                     format="YYYY-MM-DD")
+    try:
+        timeline = load_timeline(session, kind, window, page=page_number - 1)
+        if not timeline.lanes and page_number > 1:
+            page_number = 1
+            timeline = load_timeline(session, kind, window)
+    except Exception as e:
+        session.rollback()
+        print(f"Error: {e}")
+        return
+    pages = max(1, math.ceil(timeline.lane_count / LANES_PER_PAGE))
+    st.session_state[f"timeline_pages_{kind}"] = pages
+    if timeline.bucket_days:
+        st.caption(f"Lanes page {page_number} of {pages}. More than {MAX_MARKS} tasks in this range: active tasks "
+                   f"are counted per {timeline.bucket_days // DAYS_PER_WEEK} week(s). Narrow the dates to see "
+                   f"single tasks.")
+    else:
+        st.caption(f"Lanes page {page_number} of {pages}: {len(timeline.marks)} tasks.")
+    if timeline.lanes:
+        st.altair_chart(timeline_chart(timeline), use_container_width=True)
@@ -0,0 +1,31 @@
+"""This File Holds Workload Section."""
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from src.workload import load_assignments, load_assignees, workload
+
+
+def workload_section(session: Session) -> None:
+    """Displays the open work of every assignee as a sortable table.
+
+    The assignments are read in one query and summarized with vectorized grouping by `src.workload.workload`:
+    open tasks by status, overdue tasks, open tasks due in each of the coming weeks, and the booked days with
+    their estimated cost at the assignee's salary.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+
+    Returns: None: This function does not return any value; it directly modifies the Streamlit UI.
+    """
+    st.divider()
+    st.write("Workload per assignee:")
+    try:
+        summary = workload(load_assignments(session), load_assignees(session))
+    except Exception as e:
+        session.rollback()
+        print(f"Error: {e}")
+        return
+    st.dataframe(summary.sort_values(["Overdue", "Open"], ascending=False), hide_index=True,
+                 column_config={"Salary": st.column_config.NumberColumn(format="%.0f"),
+                                "Estimated cost": st.column_config.NumberColumn(format="%.2f")})
@@ -1,7 +1,8 @@
 """This File Serves Dashboard page."""
 from components.metrics_section import metrics_section
-from src.base import session
-from utils.st_utils import header_section, footer_section, chart_section
+from components.workload_section import workload_section
+from utils.st_utils import header_section, footer_section
+from utils.profiling import profiled_unit_of_work
 
 
 def main() -> None:
@@ -21,16 +22,20 @@ def main() -> None:
         such as completed tasks, active projects, and more. This section uses the SQLAlchemy
         session to query the necessary data from the database.
     - Chart Section:
-      - Calls `chart_section(session)` to visualize task distribution among team members
-        using a bar chart. This section also queries the database for relevant data.
+      - `metrics_section` ends with `chart_section(metrics.chart)` to visualize task distribution among team
+        members using a bar chart, built from the same incrementally refreshed data as the metrics.
+    - Workload Section:
+      - Calls `workload_section(session)` to display open, overdue and upcoming tasks and the estimated cost of
+        the booked work per assignee, computed with vectorized grouping over the assignments.
     - Footer Section:
       - Calls `footer_section()` to display the footer of the application, providing any
         additional information or links.
 
     Parameters: None
     Notes:
-    - The function assumes the existence of a global `session` object representing the SQLAlchemy session
-      used for database operations.
+    - The function opens a unit of work with `profiled_unit_of_work()`, so each script run gets its own
+      SQLAlchemy session that reuses one connection for all reads and commits once at the end of the run.
+      With `memory_profile=1` set, the memory each run retains is profiled and shown in the sidebar.
     - Each section function (`header_section`, `metrics_section`, `chart_section`, `footer_section`)
       is responsible for rendering a specific part of the UI and handling user interactions.
     This function serves as the entry point for the Streamlit dashboard, organizing the layout
@@ -38,7 +43,9 @@ def main() -> None:
     """
     header_section("Dashboard", "Find Inspiring Team Workflow Statistics: "
                                 "_total count of items, recent updates and deletes_.")
-    metrics_section(session)
+    with profiled_unit_of_work("Dashboard", read_only=True) as session:
+        metrics_section(session)
+        workload_section(session)
     footer_section()
 
 
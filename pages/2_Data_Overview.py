@@ -1,8 +1,8 @@
 """This File Serves Data Overview page."""
 
 from components.overview_section import overview_section
-from src.base import session
 from utils.st_utils import header_section, footer_section
+from utils.profiling import profiled_unit_of_work
 
 
 def main() -> None:
@@ -25,8 +25,9 @@ def main() -> None:
     Parameters: None
 
     Notes:
-    - The function assumes the existence of a global `session` object representing the SQLAlchemy session used for
-    database operations.
+    - The function opens a unit of work with `profiled_unit_of_work()`, so each script run gets its own SQLAlchemy
+    session that reuses one connection for all reads and commits once at the end of the run.
+    With `memory_profile=1` set, the memory each run retains is profiled and shown in the sidebar.
     - Each section function (`header_section`, `overview_section`, `footer_section`) is responsible for rendering
     a specific part of the UI and handling user interactions.
     This function serves as the entry point for the Streamlit app's data overview section, organizing the layout
@@ -34,7 +35,8 @@ def main() -> None:
     """
     header_section("Data Overview", "The section explores the content present \
                 on the system:  *projects*, **tasks**, _managers_, **assignees**.")
-    overview_section(session)
+    with profiled_unit_of_work("Data Overview", read_only=True) as session:
+        overview_section(session)
     footer_section()
 
 
@@ -1,12 +1,10 @@
 """This File Serves Edit Data page."""
-from sqlalchemy import select
-
 from components.edit_section import edit_section
 from components.add_section import add_section
 from components.delete_section import delete_item_section
-from src.base import session, db_engine
-from src.models import Assignee, Manager, Project, Task
-from utils.st_utils import header_section, footer_section
+from src.audit import enable_audit
+from utils.st_utils import header_section, footer_section, current_actor, load_form_views, shared_form_run
+from utils.profiling import profiled_unit_of_work
 
 
 def main() -> None:
@@ -23,20 +21,28 @@ def main() -> None:
       - Provides a description guiding the user to select the appropriate tab to edit
         different aspects of their projects and view the results displayed above.
     - Edit Section:
-      - Calls `edit_section(session)` to provide the UI for editing various project items.
+      - Calls `edit_section()` to provide the UI for editing various project items.
     - Add Section:
-      - Calls `add_section(session)` to provide the UI for adding new items (projects, tasks, persons)
+      - Calls `add_section()` to provide the UI for adding new items (projects, tasks, persons)
         to the system.
     - Delete Item Section:
-      - Calls `delete_item_section(session)` to provide the UI for deleting existing items from the system.
+      - Calls `delete_item_section()` to provide the UI for deleting existing items from the system.
     - Footer Section:
       - Calls `footer_section()` to display the footer of the application.
 
     Parameters: None
 
     Notes:
-    - The function assumes the existence of a global `session` object representing the SQLAlchemy session
-      used for database operations.
+    - The function opens a unit of work with `profiled_unit_of_work()`, so each script run gets its own
+      SQLAlchemy session that reuses one connection for all reads and commits once at the end of the run.
+      With `memory_profile=1` set, the memory each run retains is profiled and shown in the sidebar.
+    - The session is audited with `enable_audit`: every change the forms commit is appended to the monthly
+      partitioned `audit_events` log by a write-behind buffer, after the run's transaction has committed.
+    - The forms only need the names, IDs and versions of the rows, so they are read as immutable `src.views`
+      rows rather than ORM instances, and only read again after a row of their tables changed.
+    - Every form is a Streamlit fragment (`form_fragment`). A full run shares its session and rows with all forms
+      through `shared_form_run`; submitting a form reruns only that form in a unit of work of its own, so the
+      other forms are neither rebuilt nor re-read.
     - Each section function (`header_section`, `edit_section`, `add_section`, `delete_item_section`,
       `footer_section`) is responsible for rendering a specific part of the UI and handling user interactions.
 
@@ -46,23 +52,12 @@ def main() -> None:
     header_section("Edit Your Project's Items", "Edit different aspects of your projects "
                                                 "and choose for that the tab accordingly and check the results write "
                                                 "above.")
-    projects_from_query = []
-    managers_from_query = []
-    tasks_from_query = []
-    assignees_from_query = []
-    try:
-        projects_from_query = session.execute(select(Project).order_by(Project.id)).scalars().all()
-        managers_from_query = session.execute(select(Manager).order_by(Manager.id)).scalars().all()
-        tasks_from_query = session.execute(select(Task).order_by(Task.id)).scalars().all()
-        assignees_from_query = session.execute(select(Assignee).order_by(Assignee.id)).scalars().all()
-    except Exception as e:
-        session.rollback()
-        print(f"Error: {e}")
-    finally:
-        db_engine.close_session()
-    edit_section(projects_from_query, tasks_from_query, assignees_from_query)
-    add_section(projects_from_query, assignees_from_query)
-    delete_item_section(projects_from_query, managers_from_query, tasks_from_query, assignees_from_query)
+    with profiled_unit_of_work("Edit Data") as session:
+        enable_audit(session, current_actor())
+        with shared_form_run(session, load_form_views(session)):
+            edit_section()
+            add_section()
+            delete_item_section()
     footer_section()
 
 
@@ -0,0 +1,27 @@
+"""This File Serves Background Jobs page."""
+from components.jobs_section import jobs_section
+from utils.st_utils import header_section, footer_section
+from utils.profiling import profiled_unit_of_work
+
+
+def main() -> None:
+    """Main function to display the background job queue in the Streamlit application.
+
+    This function organizes the UI into a header, the jobs section and a footer. The jobs section lists queued,
+    running and finished jobs with their progress and allows queueing seeding or purging, which are then run
+    by the independent worker process started with `python -m src.worker`.
+
+    Parameters: None
+    Notes:
+    - The function opens a unit of work with `profiled_unit_of_work()`, so each script run gets its own
+      SQLAlchemy session that reuses one connection for all reads and commits once at the end of the run.
+      With `memory_profile=1` set, the memory each run retains is profiled and shown in the sidebar.
+    """
+    header_section("Background Jobs", "Follow heavy operations - _seeding and purges_ - run by background workers.")
+    with profiled_unit_of_work("Jobs") as session:
+        jobs_section(session)
+    footer_section()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""This File Serves Timeline page."""
+from components.timeline_section import timeline_section
+from utils.st_utils import header_section, footer_section
+from utils.profiling import profiled_unit_of_work
+
+
+def main() -> None:
+    """Main function to display the task timeline in the Streamlit application.
+
+    This function organizes the UI into a header, the timeline section and a footer. The timeline section shows
+    the tasks over their start and due dates, in one lane per project or per assignee, for the chosen dates.
+
+    Parameters: None
+    Notes:
+    - The function opens a read-only unit of work with `profiled_unit_of_work()`, so each script run gets its own
+      SQLAlchemy session that reuses one connection for all reads and never commits.
+      With `memory_profile=1` set, the memory each run retains is profiled and shown in the sidebar.
+    - Zoomed out, the tasks are counted per lane and week in the database, so large portfolios are drawn with at
+      most a few thousand marks.
+    """
+    header_section("Timeline", "Follow the tasks over time - _per project or per assignee_.")
+    with profiled_unit_of_work("Timeline", read_only=True) as session:
+        timeline_section(session)
+    footer_section()
+
+
+if __name__ == "__main__":
+    main()
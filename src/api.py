@@ -0,0 +1,262 @@
+"""Read-Only HTTP JSON API of Projects, Tasks, Assignees and Managers: `python -m src.api --port 8502`."""
+import argparse
+import hashlib
+import json
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Optional
+
+import tornado.ioloop
+import tornado.web
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.base import db_engine, TimeStampedModel
+from src.change_stamps import table_stamps
+from src.models import Project, Task, Assignee, Manager
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+DEFAULT_PORT = 8502
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+HIDDEN_FIELDS = ("deleted_at",)
+
+UnitOfWork = Callable[[], AbstractContextManager[Session]]
+
+
+@dataclass(frozen=True)
+class Resource:
+    """A table served by the API.
+
+    Attributes:
+    model : type[TimeStampedModel]
+        The model of the served table.
+    depends_on : tuple[type[TimeStampedModel], ...]
+        Further models whose changes alter the listed rows, e.g. tasks disappear with their soft-deleted project.
+    filters : tuple[str, ...]
+        The integer columns that can be filtered on with an equally named query argument.
+    """
+    model: type[TimeStampedModel]
+    depends_on: tuple[type[TimeStampedModel], ...] = ()
+    filters: tuple[str, ...] = ()
+
+    @property
+    def fields(self) -> list[str]:
+        """The column names a client can select, in table order."""
+        return [column.name for column in self.model.__table__.columns if column.name not in HIDDEN_FIELDS]
+
+
+RESOURCES = {
+    "projects": Resource(Project, filters=("manager_id",)),
+    "tasks": Resource(Task, depends_on=(Project,), filters=("project_id",)),
+    "assignees": Resource(Assignee),
+    "managers": Resource(Manager),
+}
+
+
+@dataclass(frozen=True)
+class PageQuery:
+    """The validated arguments of a list request.
+
+    Attributes:
+    after : int
+        The keyset cursor: only rows with a greater ID are listed.
+    limit : int
+        The maximum number of rows in the page.
+    fields : tuple[str, ...]
+        The selected columns, always starting with `id`.
+    filters : tuple[tuple[str, int], ...]
+        Pairs of column name and the value it must equal.
+    """
+    after: int = 0
+    limit: int = DEFAULT_LIMIT
+    fields: tuple[str, ...] = ("id",)
+    filters: tuple[tuple[str, int], ...] = ()
+
+
+def _int_argument(arguments: dict[str, list[bytes]], name: str, default: int) -> int:
+    """Reads an integer query argument.
+
+    Raises:
+    ValueError: If the argument is not an integer.
+    """
+    values = arguments.get(name)
+    if not values:
+        return default
+    try:
+        return int(values[-1])
+    except ValueError:
+        raise ValueError(f"{name} must be an integer.") from None
+
+
+def parse_query(resource: Resource, arguments: dict[str, list[bytes]]) -> PageQuery:
+    """Validates the query arguments of a list request.
+
+    `fields` is a comma separated list of column names and defaults to all of them; `id` is always included
+    because it is the pagination cursor. `limit` is capped at `MAX_LIMIT`.
+
+    Parameters:
+    resource : Resource
+        The requested resource.
+    arguments : dict[str, list[bytes]]
+        The query arguments as parsed by Tornado.
+
+    Returns: PageQuery: The validated query.
+
+    Raises:
+    ValueError: If an argument is malformed, out of range or names an unknown field.
+    """
+    after = _int_argument(arguments, "after", 0)
+    limit = _int_argument(arguments, "limit", DEFAULT_LIMIT)
+    if after < 0 or not 1 <= limit <= MAX_LIMIT:
+        raise ValueError(f"after must not be negative and limit must be between 1 and {MAX_LIMIT}.")
+    available = resource.fields
+    requested = [name.strip() for value in arguments.get("fields", []) for name in value.decode().split(",")]
+    requested = [name for name in requested if name]
+    unknown = sorted(set(requested) - set(available))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Choose from {', '.join(available)}.")
+    fields = ["id"] + [name for name in (requested or available) if name != "id"]
+    filters = tuple((name, _int_argument(arguments, name, 0)) for name in resource.filters if name in arguments)
+    return PageQuery(after, limit, tuple(dict.fromkeys(fields)), filters)
+
+
+def _visible(resource: Resource) -> list[Any]:
+    """Builds the conditions that hide soft-deleted rows, including tasks of soft-deleted projects."""
+    model = resource.model
+    conditions = [model.deleted_at.is_(None)]
+    if model is Task:
+        conditions.append(Task.project.has(Project.deleted_at.is_(None)))
+    return conditions
+
+
+def page_etag(session: Session, resource: Resource, query: PageQuery) -> str:
+    """Computes the entity tag of a page from the change stamps of the tables it is read from.
+
+    The stamps cost one primary key lookup per table, so a client that already holds the page is answered without
+    fetching or serializing any row. The stamps are read before the rows, so a write landing in between makes
+    the next request miss instead of pinning a stale page to a fresh tag.
+
+    Returns: str: A quoted strong entity tag.
+    """
+    stamps = table_stamps(session, (resource.model, *resource.depends_on))
+    key = repr((sorted(stamps.items()), query))
+    return f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+
+def fetch_page(session: Session, resource: Resource, query: PageQuery) -> dict[str, Any]:
+    """Reads one page of rows with keyset pagination.
+
+    The page is the first `limit` rows with an ID greater than the `after` cursor, in ID order, so every page is
+    an index range scan on the primary key however deep the client pages. One extra row is fetched to tell
+    whether a next page exists. Rows are read as plain tuples of the selected columns, without ORM instances.
+
+    Returns: dict[str, Any]: The rows under `data` and the cursor of the next page under `next`, or None on the
+    last page.
+    """
+    model = resource.model
+    statement = (select(*(getattr(model, name) for name in query.fields))
+                 .where(model.id > query.after, *_visible(resource),
+                        *(getattr(model, name) == value for name, value in query.filters))
+                 .order_by(model.id).limit(query.limit + 1))
+    rows = session.execute(statement).all()
+    more = len(rows) > query.limit
+    data = [dict(zip(query.fields, row)) for row in rows[:query.limit]]
+    return {"data": data, "next": data[-1]["id"] if more else None}
+
+
+def _default(value: Any) -> Any:
+    """Serializes the dates and datetimes the standard json module cannot."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(document: Any) -> bytes:
+    """Serializes a document to JSON with orjson when it is installed, otherwise with the standard json module."""
+    if orjson is not None:
+        return orjson.dumps(document)
+    return json.dumps(document, default=_default, separators=(",", ":")).encode()
+
+
+class ListHandler(tornado.web.RequestHandler):
+    """Lists the rows of a resource as JSON, answering `If-None-Match` with 304 before any row is read."""
+
+    def initialize(self, unit_of_work: UnitOfWork) -> None:
+        """Keeps the factory of the per-request sessions the application was created with."""
+        self.unit_of_work = unit_of_work
+
+    def _in_session(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Runs a function with a session of its own; reads are routed to a replica when one is configured."""
+        with self.unit_of_work() as session:
+            return function(session, *args)
+
+    async def _run(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Runs a blocking database function on the executor, so one slow query does not stall other requests."""
+        return await tornado.ioloop.IOLoop.current().run_in_executor(None, self._in_session, function, *args)
+
+    def write_error(self, status_code: int, **kwargs: Any) -> None:
+        """Answers errors with a JSON body holding the reason instead of Tornado's HTML page."""
+        self.set_header("Content-Type", "application/json")
+        self.finish(dumps({"error": self._reason}))
+
+    async def get(self, name: str) -> None:
+        """Answers a page of the named resource, or 304 when the client's `If-None-Match` matches its entity tag.
+
+        Parameters:
+        name : str
+            The name of the resource in `RESOURCES`, taken from the URL.
+
+        Raises:
+        tornado.web.HTTPError: With status 400 if the query arguments are invalid.
+        """
+        resource = RESOURCES[name]
+        try:
+            query = parse_query(resource, self.request.query_arguments)
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, reason=str(e))
+        self.set_header("Etag", await self._run(page_etag, resource, query))
+        self.set_header("Cache-Control", "no-cache")
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+        page = await self._run(fetch_page, resource, query)
+        self.set_header("Content-Type", "application/json")
+        self.write(dumps(page))
+
+
+def make_app(unit_of_work: Optional[UnitOfWork] = None) -> tornado.web.Application:
+    """Creates the API application; responses are gzip compressed for clients that accept it.
+
+    Parameters:
+    unit_of_work : Callable[[], ContextManager[Session]], optional
+        The factory of the per-request sessions, `db_engine.read_only_unit_of_work` by default.
+    """
+    return tornado.web.Application(
+        [(rf"/api/({'|'.join(RESOURCES)})", ListHandler,
+          {"unit_of_work": unit_of_work or db_engine.read_only_unit_of_work})],
+        compress_response=True,
+    )
+
+
+def main() -> None:
+    """Serves the API until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve the read-only JSON API.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+    db_engine.engine.echo = False
+    make_app().listen(args.port)
+    print(f"Serving the API on http://localhost:{args.port}/api/. Press Ctrl+C to stop.")
+    try:
+        tornado.ioloop.IOLoop.current().start()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
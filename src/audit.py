@@ -0,0 +1,327 @@
+"""Append-Only Audit Log of the Changes Made Through the Forms, Written Behind in Batches."""
+import atexit
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import event, insert, inspect, select, text
+from sqlalchemy.engine import Connection, CursorResult, Result
+from sqlalchemy.orm import Session, ORMExecuteState, UOWTransaction
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, ClauseElement
+
+from src.base import db_engine
+from src.models import AuditEvent
+
+AUDITED_TABLES = {"projects", "managers", "tasks", "assignees", "assignee_tasks"}
+UNAUDITED_COLUMNS = {"id", "created_at", "updated_at", "version"}
+ACTOR_KEY = "audit_actor"
+PENDING_KEY = "audit_events"
+FLUSH_INTERVAL = 1.0
+FLUSH_BATCH_SIZE = 500
+MAX_BUFFERED = 10000
+
+_partitions: set[date] = set()
+
+
+def enable_audit(session: Session, actor: Optional[str]) -> None:
+    """Records the changes the session commits from now on in the audit log.
+
+    Only audit sessions that own their transaction, such as the ones of `DBEngine.unit_of_work`. A session joined
+    to an outer transaction reports the release of its savepoint as a commit, so its events would be written even
+    if the outer transaction is rolled back later.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session whose changes are audited.
+    actor : str | None
+        Who makes the changes, stored with every event.
+    """
+    session.info[ACTOR_KEY] = actor
+
+
+def _plain(value: Any) -> Any:
+    """Turns a column value into something the JSON column can store."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _record(session: Session, entity: str, entity_id: Optional[int], action: str, changes: dict[str, Any]) -> None:
+    """Adds an event to the session's pending events, which are logged only if the transaction commits."""
+    session.info.setdefault(PENDING_KEY, []).append({
+        "occurred_at": datetime.now(), "actor": session.info[ACTOR_KEY], "entity": entity, "entity_id": entity_id,
+        "action": action, "changes": changes,
+    })
+
+
+def _statement_values(values: Optional[dict]) -> dict[str, Any]:
+    """Picks the plain values a DML statement writes, leaving out SQL expressions such as `version + 1`."""
+    changes = {}
+    for column, value in (values or {}).items():
+        key = getattr(column, "key", column)
+        if key in UNAUDITED_COLUMNS:
+            continue
+        if isinstance(value, BindParameter):
+            value = value.value
+        elif isinstance(value, ClauseElement):
+            continue
+        changes[key] = _plain(value)
+    return changes
+
+
+def _matched_ids(whereclause: Optional[ClauseElement], table: Any) -> list[int]:
+    """Finds the IDs an UPDATE or DELETE is restricted to by `id = :value` criteria."""
+    ids = []
+    for element in visitors.iterate(whereclause) if whereclause is not None else ():
+        if (isinstance(element, BinaryExpression) and element.operator is operators.eq
+                and getattr(getattr(element.left, "table", None), "name", None) == table.name
+                and element.left.key == "id"
+                and isinstance(element.right, BindParameter)):
+            ids.append(element.right.value)
+    return ids
+
+
+@event.listens_for(Session, "after_flush")
+def _audit_flush(session: Session, flush_context: UOWTransaction) -> None:
+    """Records the instances the unit of work inserted, updated or deleted."""
+    if ACTOR_KEY not in session.info:
+        return
+    for action, instances in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for instance in instances:
+            state = inspect(instance)
+            if state.mapper.local_table.name not in AUDITED_TABLES:
+                continue
+            changes = {}
+            for column in state.mapper.column_attrs:
+                if column.key in UNAUDITED_COLUMNS or action == "delete":
+                    continue
+                history = state.attrs[column.key].history
+                value = history.added[0] if history.added else None
+                if action == "insert" and value is None:
+                    value = state.dict.get(column.key)
+                if history.added or (action == "insert" and value is not None):
+                    changes[column.key] = _plain(value)
+            if action != "update" or changes:
+                _record(session, state.mapper.local_table.name, state.dict.get("id"), action, changes)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _audit_statement(orm_execute_state: ORMExecuteState) -> Optional[Result]:
+    """Records the rows written by ORM-enabled INSERT, UPDATE and DELETE statements.
+
+    The statement is run here so its row count and returned IDs are known. Rows an UPDATE or DELETE matches
+    through `id = :value` criteria get an event each, and so do the rows of an INSERT whose values are known and
+    that wrote all of them; any other write is recorded as one bulk event with the number of rows.
+    """
+    session = orm_execute_state.session
+    if ACTOR_KEY not in session.info or orm_execute_state.is_select:
+        return None
+    statement = orm_execute_state.statement
+    table = getattr(statement, "table", None)
+    if table is None or table.name not in AUDITED_TABLES:
+        return None
+    result = orm_execute_state.invoke_statement()
+    if orm_execute_state.is_insert:
+        ids: list[int] = []
+        if isinstance(result, CursorResult) and not result.returns_rows:
+            count = result.rowcount
+        else:
+            frozen = result.freeze()
+            ids = [row[0] for row in frozen().all()]
+            result = frozen()
+            count = len(ids)
+        if statement._multi_values:
+            rows = [_statement_values(values) for values in statement._multi_values[0]]
+        else:
+            rows = [_statement_values(statement._values)] if statement._values else []
+        if rows and len(rows) == count:
+            for entity_id, changes in zip(ids or [None] * count, rows):
+                _record(session, table.name, entity_id, "insert", changes)
+        elif ids:
+            for entity_id in ids:
+                _record(session, table.name, entity_id, "insert", {})
+        elif count:
+            _record(session, table.name, None, "insert", {"rows": count})
+        return result
+    if not result.rowcount:
+        return result
+    action = "update" if orm_execute_state.is_update else "delete"
+    changes = _statement_values(statement._values) if action == "update" else {}
+    ids = _matched_ids(statement.whereclause, table)
+    if ids and len(ids) == result.rowcount:
+        for entity_id in ids:
+            _record(session, table.name, entity_id, action, changes)
+    else:
+        _record(session, table.name, None, action, {**changes, "rows": result.rowcount})
+    return result
+
+
+@event.listens_for(Session, "after_commit")
+def _hand_over(session: Session) -> None:
+    events = session.info.pop(PENDING_KEY, None)
+    if events:
+        audit_writer.put(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+def month_of(moment: datetime) -> date:
+    """Returns the first day of the month of a date and time, the lower bound of its partition."""
+    return date(moment.year, moment.month, 1)
+
+
+def ensure_partitions(connection: Connection, months: Iterable[date]) -> None:
+    """Creates the monthly partitions of the audit log that do not exist yet.
+
+    Parameters:
+    connection : sqlalchemy.engine.Connection
+        The connection used for the DDL, in the transaction that writes the events.
+    months : Iterable[date]
+        The first days of the months to create partitions for.
+    """
+    for month in sorted(set(months)):
+        following = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {AuditEvent.__tablename__}_{month:%Y_%m} PARTITION OF "
+            f"{AuditEvent.__tablename__} FOR VALUES FROM ('{month}') TO ('{following}')"))
+
+
+def write_events(connection: Connection, events: list[dict[str, Any]]) -> None:
+    """Inserts a batch of events, creating the partitions of their months first.
+
+    The months whose partitions were already created by this process are skipped without a round trip. The
+    insert is one executemany, which SQLAlchemy sends as multi-row `INSERT ... VALUES` batches.
+
+    Parameters:
+    connection : sqlalchemy.engine.Connection
+        The connection used for the insert. The caller is responsible for committing.
+    events : list[dict[str, Any]]
+        The events, as recorded on the sessions.
+    """
+    months = {month_of(item["occurred_at"]) for item in events} - _partitions
+    ensure_partitions(connection, months)
+    connection.execute(insert(AuditEvent), events)
+
+
+def _write_committed(events: list[dict[str, Any]]) -> None:
+    with db_engine.engine.begin() as connection:
+        write_events(connection, events)
+    _partitions.update(month_of(item["occurred_at"]) for item in events)
+
+
+class AuditWriter:
+    """An in-process buffer that writes the committed events behind the forms, in batches.
+
+    A form submission only appends its events to the buffer when its transaction commits. A daemon thread writes
+    them once `batch_size` are waiting or `flush_interval` seconds have passed, in a transaction of its own, so
+    auditing adds no round trip to the submission. A failed write keeps the events for the next attempt. At most
+    `max_buffered` events wait; while the database is unreachable, the oldest ones beyond that are dropped and
+    counted in `dropped`, so the buffer stays bounded and the forms never wait for a failing write. Events still
+    waiting when the process is killed are lost; a normal exit writes them first.
+
+    Parameters:
+    write : Callable[[list[dict]], None], optional
+        Writes a batch of events, by default in a new transaction on the primary.
+    flush_interval : float
+        The longest time in seconds an event waits in the buffer.
+    batch_size : int
+        The number of waiting events that triggers a write before the interval passed.
+    max_buffered : int
+        The maximum number of waiting events; older ones are dropped beyond it.
+    """
+
+    def __init__(self, write: Optional[Callable[[list[dict[str, Any]]], None]] = None,
+                 flush_interval: float = FLUSH_INTERVAL, batch_size: int = FLUSH_BATCH_SIZE,
+                 max_buffered: int = MAX_BUFFERED) -> None:
+        self.write = write or _write_committed
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_buffered = max_buffered
+        self.buffer: list[dict[str, Any]] = []
+        self.dropped = 0
+        self.condition = threading.Condition()
+        self.write_lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+
+    def put(self, events: list[dict[str, Any]]) -> None:
+        """Queues committed events and starts the writer thread on first use."""
+        with self.condition:
+            self.buffer.extend(events)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+                self.thread.start()
+                atexit.register(self.flush)
+            self._trim()
+            if len(self.buffer) >= self.batch_size:
+                self.condition.notify()
+
+    def flush(self) -> int:
+        """Writes every waiting event now.
+
+        Returns: int: The number of events written, 0 if there were none or the write failed.
+        """
+        with self.write_lock:
+            with self.condition:
+                batch, self.buffer = self.buffer, []
+            if not batch:
+                return 0
+            try:
+                self.write(batch)
+            except Exception as e:
+                print(f"Error: {e}")
+                with self.condition:
+                    self.buffer[:0] = batch
+                    self._trim()
+                return 0
+            return len(batch)
+
+    def _trim(self) -> None:
+        """Drops the oldest waiting events beyond `max_buffered`; the caller holds the condition."""
+        excess = len(self.buffer) - self.max_buffered
+        if excess > 0:
+            del self.buffer[:excess]
+            self.dropped += excess
+            print(f"Error: the audit log is not being written, dropped {excess} events ({self.dropped} in total).")
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: len(self.buffer) >= self.batch_size, timeout=self.flush_interval)
+            self.flush()
+
+
+audit_writer = AuditWriter()
+
+
+def entity_history(session: Session, entity: str, entity_id: int, since: Optional[datetime] = None,
+                   limit: int = 100) -> list[AuditEvent]:
+    """Reads the latest events of one row, newest first.
+
+    The `(entity, entity_id, occurred_at)` index of every partition answers the query; `since` additionally
+    skips the partitions of earlier months.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    entity : str
+        The table of the row, e.g. "projects".
+    entity_id : int
+        The ID of the row.
+    since : datetime, optional
+        Only events from then on are read.
+    limit : int
+        The maximum number of events to read.
+
+    Returns: list[AuditEvent]: The events, newest first.
+    """
+    statement = select(AuditEvent).where(AuditEvent.entity == entity, AuditEvent.entity_id == entity_id)
+    if since is not None:
+        statement = statement.where(AuditEvent.occurred_at >= since)
+    return list(session.execute(
+        statement.order_by(AuditEvent.occurred_at.desc(), AuditEvent.id.desc()).limit(limit)).scalars())
@@ -0,0 +1,112 @@
+"""Load-Balancing Auto-Assignment of a Project's Unassigned Tasks."""
+import heapq
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import select, func, and_, exists
+from sqlalchemy.orm import Session
+
+from src.models import Assignee, AssigneeTask, Project, Task
+from src.upserts import bulk_assign_tasks
+
+DONE_STATUS = "done"
+
+
+def balance(tasks: Iterable[tuple[int, date, date]],
+            assignees: Iterable[tuple[int, int, Optional[date]]]) -> list[tuple[int, int]]:
+    """Distributes tasks over assignees, balancing their open-task load and avoiding overlapping dates.
+
+    The tasks are handed out by start date. Each goes to the least loaded assignee who is free by then, meaning
+    all of their open tasks are due on or before the task's start. When nobody is free, it goes to the assignee
+    who gets free first, so the overlap is as short as possible, and among those to the least loaded one.
+
+    The free and busy assignees sit in two heaps keyed by load and by the date they get free. Every assignment
+    pops one assignee and pushes it back, and every assignee moves from the busy to the free heap at most once per
+    assignment it receives, so `T` tasks over `A` assignees cost O((T + A) log A).
+
+    Parameters:
+    tasks : Iterable[tuple[int, date, date]]
+        The `(task_id, start_date, due_date)` of the tasks to assign.
+    assignees : Iterable[tuple[int, int, date | None]]
+        The `(assignee_id, open_tasks, busy_until)` of the candidates, where `busy_until` is the latest due date
+        of their open tasks, or None if they have none.
+
+    Returns: list[tuple[int, int]]: The `(assignee_id, task_id)` pairs, one per task, or none without assignees.
+    """
+    free: list[tuple[int, int]] = []
+    busy: list[tuple[int, int, int]] = []
+    for assignee_id, load, busy_until in assignees:
+        heapq.heappush(busy, (busy_until.toordinal() if busy_until else 0, load, assignee_id))
+    if not busy:
+        return []
+    assignments = []
+    for task_id, start_date, due_date in sorted(tasks, key=lambda task: (task[1], task[0])):
+        start, due = start_date.toordinal(), due_date.toordinal()
+        while busy and busy[0][0] <= start:
+            _, load, assignee_id = heapq.heappop(busy)
+            heapq.heappush(free, (load, assignee_id))
+        if free:
+            load, assignee_id = heapq.heappop(free)
+            busy_until = due
+        else:
+            busy_until, load, assignee_id = heapq.heappop(busy)
+            busy_until = max(busy_until, due)
+        heapq.heappush(busy, (busy_until, load + 1, assignee_id))
+        assignments.append((assignee_id, task_id))
+    return assignments
+
+
+def unassigned_tasks(session: Session, project_id: int) -> list[tuple[int, date, date]]:
+    """Reads the open tasks of a project that nobody is assigned to.
+
+    Returns: list[tuple[int, date, date]]: The `(task_id, start_date, due_date)` of each task.
+    """
+    return [tuple(row) for row in session.execute(
+        select(Task.id, Task.start_date, Task.due_date)
+        .where(Task.project_id == project_id, Task.status != DONE_STATUS,
+               ~exists().where(AssigneeTask.task_id == Task.id))
+    )]
+
+
+def assignee_loads(session: Session) -> list[tuple[int, int, Optional[date]]]:
+    """Reads every visible assignee's number of open tasks and the latest due date among them, in one query.
+
+    Done tasks and tasks of soft-deleted projects do not count.
+
+    Returns: list[tuple[int, int, date | None]]: The `(assignee_id, open_tasks, busy_until)` of each assignee.
+    """
+    open_task = and_(Task.id == AssigneeTask.task_id, Task.status != DONE_STATUS,
+                     Task.project.has(Project.deleted_at.is_(None)))
+    return [tuple(row) for row in session.execute(
+        select(Assignee.id, func.count(Task.id), func.max(Task.due_date))
+        .outerjoin(AssigneeTask, AssigneeTask.assignee_id == Assignee.id)
+        .outerjoin(Task, open_task)
+        .where(Assignee.deleted_at.is_(None))
+        .group_by(Assignee.id)
+    )]
+
+
+def auto_assign_project(session: Session, project_id: int) -> tuple[int, int]:
+    """Assigns every open, unassigned task of a project, balancing the load over all visible assignees.
+
+    The project's row is locked first, so concurrent runs for the same project take turns: the second one reads
+    the unassigned tasks only after the first has committed, and never hands a task the first one assigned to
+    another assignee. The lock is `FOR NO KEY UPDATE`, which does not conflict with the key-share locks that
+    foreign key checks take, so tasks can still be added to the project meanwhile. The tasks and the loads are
+    then read in two queries and the result is written by one bulk insert, whose `ON CONFLICT DO NOTHING` skips
+    pairs that were assigned by hand in the meantime.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the queries and the insert. The caller is responsible for committing.
+    project_id : int
+        The ID of the project whose tasks are assigned.
+
+    Returns: tuple[int, int]: The number of new assignments and the number of distinct assignees they went to.
+    """
+    session.execute(select(Project.id).where(Project.id == project_id).with_for_update(key_share=True))
+    tasks = unassigned_tasks(session, project_id)
+    if not tasks:
+        return 0, 0
+    assignments = balance(tasks, assignee_loads(session))
+    return bulk_assign_tasks(session, assignments), len({assignee_id for assignee_id, _ in assignments})
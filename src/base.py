@@ -10,14 +10,15 @@ Attributes:
     Model (Base): The declarative base class for all ORM models, with should inherit from this base class.
     db_engine (DBEngine): An instance of the DBEngine class, which handles the connection to the database
     and session creation.
-    session (scoped_session): A scoped session object created from the DBEngine instance, providing thread-safe
-    session handling.
+    session (scoped_session): A scoped session proxy created from the DBEngine instance, providing thread-safe
+    session handling for scripts and background workers; each thread that uses it gets its own session. Streamlit
+    pages use `db_engine.unit_of_work()` instead, which gives each script run its own session.
     Model.query (Query): A SQLAlchemy query property attached to the `Model` base class. This allows for querying
     directly on model classes (e.g., `User.query.all()`) when using Flask-SQLAlchemy-like syntax.
 """
 
 db_engine = DBEngine()
-session = db_engine.get_session()
+session = db_engine.Session
 Model = db_engine.get_base()
 
 
@@ -29,13 +30,19 @@ class TimeStampedModel(Model):  # type: ignore
             Automatically set to the current date and time when the record is created.
         updated_at (DateTime): Stores the timestamp when the record was last updated.
             Automatically updated to the current date and time whenever the record is updated.
+        deleted_at (DateTime): Stores the timestamp when the record was marked for deletion. Rows with this field
+            set are hidden from the app and removed in bounded batches by the background purger.
+        version (Integer): A counter incremented by every compare-and-swap update of the record. Edit forms update
+            a row only if its version is still the one they displayed, which detects concurrent edits without locks.
     """
     __abstract__ = True
     __allow_unmapped__ = True
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, onupdate=datetime.now())
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, onupdate=datetime.now)
+    deleted_at = Column(DateTime, nullable=True, index=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
 
 class PersonModel(TimeStampedModel):
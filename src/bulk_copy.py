@@ -0,0 +1,144 @@
+"""Bulk Loads and Exports With COPY, in the Binary Format When the Engine Runs on psycopg 3.
+
+`COPY ... FROM STDIN` streams rows into a table without parsing an `INSERT` per batch, and `COPY (...) TO STDOUT`
+streams a query's rows out without the per-row protocol overhead of a `SELECT`. psycopg 3 sends and receives the
+rows in PostgreSQL's binary format, so values are neither formatted as text nor parsed back. With psycopg2 the
+loads fall back to the text format and the exports to a plain `SELECT`.
+"""
+from datetime import date, datetime
+from io import StringIO
+from typing import Any, Iterable, Iterator, Sequence
+
+from sqlalchemy import (BigInteger, Boolean, Column, Connection, Date, DateTime, Engine, Float, Integer, Select, String,
+                        Table, func, insert, select)
+from sqlalchemy.orm import Session
+
+# The binary format is typed, so every column needs the name of the PostgreSQL type its values are dumped as.
+BINARY_TYPES = {BigInteger: "int8", Integer: "int4", Float: "float8", String: "text", Date: "date",
+                DateTime: "timestamp", Boolean: "bool"}
+TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def binary_copy_available(session: Session) -> bool:
+    """Tells whether the session's connection is a psycopg 3 connection, which supports the binary COPY format."""
+    return session.get_bind().dialect.driver == "psycopg"
+
+
+def binary_type(column: Column) -> str:
+    """Returns the name of the PostgreSQL type the values of a column are sent or received as in binary COPY.
+
+    Raises:
+    TypeError: If the column's type has no binary counterpart in `BINARY_TYPES`.
+    """
+    for type_class in type(column.type).__mro__:
+        if type_class in BINARY_TYPES:
+            return BINARY_TYPES[type_class]
+    raise TypeError(f"No binary COPY type for column {column.name} of type {column.type}")
+
+
+def _write_bind(session: Session, table: Table) -> Engine:
+    """Returns the engine a write to the table runs on, the primary when the session routes reads to replicas.
+
+    COPY and `nextval` reach the database through the connection or a `SELECT`, which a routing session would
+    send to a replica; asking for the bind of an insert routes them like a write, including reading from the
+    primary afterwards.
+    """
+    return session.get_bind(clause=insert(table))
+
+
+def _write_connection(session: Session, table: Table) -> Connection:
+    """Returns the session's connection to the engine writes to the table run on."""
+    return session.connection(bind_arguments={"bind": _write_bind(session, table)})
+
+
+def _text_value(value: Any) -> str:
+    r"""Formats a value for the text COPY format, where NULL is `\N` and tabs, newlines and backslashes are escaped."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value).translate(TEXT_ESCAPES)
+
+
+def copy_rows(session: Session, table: Table, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """Loads rows into a table with `COPY ... FROM STDIN` on the session's connection and transaction.
+
+    The rows are always written on the primary, also when the session routes reads to replicas.
+
+    Unlike an ORM or Core insert, COPY applies neither the models' Python-side defaults nor the audit hooks, so
+    the rows must carry every column the table needs, e.g. `created_at` and `version`. With psycopg 3 the rows
+    are sent in the binary format and must hold Python values of the columns' types, e.g. `date` for a date
+    column; psycopg2 sends them as text.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session whose transaction the rows are written in. The caller is responsible for committing.
+    table : sqlalchemy.Table
+        The table to load, e.g. `Task.__table__`.
+    columns : Sequence[str]
+        The names of the columns, in the order of the values of each row.
+    rows : Iterable[Sequence[Any]]
+        The rows to load.
+
+    Returns: int: The number of rows written.
+    """
+    connection = _write_connection(session, table)
+    driver_connection = connection.connection.driver_connection
+    column_list = ", ".join(columns)
+    written = 0
+    if connection.dialect.driver == "psycopg":
+        with driver_connection.cursor() as cursor, \
+                cursor.copy(f"COPY {table.name} ({column_list}) FROM STDIN (FORMAT BINARY)") as copy:
+            copy.set_types([binary_type(table.c[name]) for name in columns])
+            for row in rows:
+                copy.write_row(row)
+                written += 1
+        return written
+    buffer = StringIO()
+    for row in rows:
+        buffer.write("\t".join(_text_value(value) for value in row) + "\n")
+        written += 1
+    buffer.seek(0)
+    with driver_connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table.name} ({column_list}) FROM STDIN", buffer)
+    return written
+
+
+def export_rows(session: Session, statement: Select) -> Iterator[tuple[Any, ...]]:
+    """Streams the rows of a query with `COPY (...) TO STDOUT`, in the binary format on psycopg 3.
+
+    The statement is rendered with its parameters inlined, since COPY takes none, so it must only select plain
+    columns whose types are in `BINARY_TYPES`. With psycopg2 the statement is executed as a `SELECT` instead.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session whose transaction the rows are read in.
+    statement : sqlalchemy.Select
+        The query to export.
+
+    Returns: Iterator[tuple]: The rows, as tuples of Python values.
+    """
+    if not binary_copy_available(session):
+        yield from (tuple(row) for row in session.execute(statement))
+        return
+    connection = session.connection()
+    query = statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    with connection.connection.driver_connection.cursor() as cursor, \
+            cursor.copy(f"COPY ({query}) TO STDOUT (FORMAT BINARY)") as copy:
+        copy.set_types([binary_type(column) for column in statement.selected_columns])
+        yield from copy.rows()
+
+
+def reserve_ids(session: Session, table: Table, count: int) -> list[int]:
+    """Draws `count` values from the sequence of a table's `id` column, for rows loaded with COPY.
+
+    COPY returns nothing, so rows whose IDs other rows refer to get them from the sequence up front, in one round
+    trip, the same way the column default would.
+
+    Returns: list[int]: The reserved IDs in increasing order.
+    """
+    if not count:
+        return []
+    sequence = func.pg_get_serial_sequence(table.name, "id")
+    return list(session.scalars(select(func.nextval(sequence)).select_from(func.generate_series(1, count)),
+                                bind_arguments={"bind": _write_bind(session, table)}))
@@ -0,0 +1,40 @@
+"""Cheap Change Stamps of Tables for Conditional Reads and Cache Invalidation."""
+from typing import Iterable, NamedTuple
+
+from sqlalchemy.orm import Session
+
+from src.base import TimeStampedModel
+from src.queries import stamps_statement
+
+
+class TableStamp(NamedTuple):
+    """A summary of a table that changes whenever a transaction that inserted, updated or deleted its rows commits.
+
+    Attributes:
+    changes : int
+        The number of committed transactions that changed the table, counted by `TableChange` in commit order.
+    """
+    changes: int
+
+
+def table_stamps(session: Session, models: Iterable[type[TimeStampedModel]]) -> dict[str, TableStamp]:
+    """Reads the change stamps of several tables in one round trip.
+
+    The stamps are the change counters that the triggers of `install_change_counters` bump once for every committed
+    transaction that changed a table, so equal stamps mean no change was committed in between. Reading them is one
+    primary key lookup per table, however many rows the tables hold. A table that was not changed since the
+    triggers were installed has no counter yet and is stamped zero.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    models : Iterable[type[TimeStampedModel]]
+        The models whose tables are stamped.
+
+    Returns: dict[str, TableStamp]: The stamp of each table, keyed by table name.
+    """
+    models = tuple(models)
+    if not models:
+        return {}
+    counts = dict(session.execute(stamps_statement(models)).tuples().all())
+    return {model.__tablename__: TableStamp(int(counts.get(model.__tablename__, 0))) for model in models}
@@ -0,0 +1,37 @@
+"""Optimistic Concurrency Control for Edited Models."""
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from src.base import TimeStampedModel
+
+
+def compare_and_swap(session: Session, model: type[TimeStampedModel], item_id: int, expected_version: int,
+                     values: dict[str, Any]) -> bool:
+    """Updates a row only if its version still matches the version the editor has seen.
+
+    The version check and the increment happen in a single UPDATE statement, so concurrent editors never block
+    each other on row locks; the one that loses the race simply updates no row and is told so.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the update. The caller is responsible for committing.
+    model : type[TimeStampedModel]
+        The model class of the edited row.
+    item_id : int
+        The ID of the edited row.
+    expected_version : int
+        The version of the row the editor based the change on.
+    values : dict[str, Any]
+        The column names and new values to set.
+
+    Returns: bool: True if the row was updated, False if it was changed or deleted by someone else in the meantime.
+    """
+    result = session.execute(
+        update(model)
+        .where(model.id == item_id, model.version == expected_version)
+        .values(**values, version=model.version + 1),
+        execution_options={"synchronize_session": False}
+    )
+    return result.rowcount == 1
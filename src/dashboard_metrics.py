@@ -0,0 +1,117 @@
+"""Dashboard Metrics Counted by the Database and Kept Until One of Their Tables Changes."""
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from src.change_stamps import TableStamp, table_stamps
+from src.models import Assignee, AssigneeTask, Project, Task
+from src.queries import DASHBOARD_ASSIGNEES, DASHBOARD_PROJECTS, DASHBOARD_TASKS
+
+RECENT_DAYS = 5
+RECENT_RESOLUTION = timedelta(minutes=1)
+IN_PROGRESS_STATUS = "in_progres"
+DONE_STATUS = "done"
+CHART_COLUMNS = ["id", "firstname", "lastname", "tasks"]
+METRICS_MODELS = (Project, Task, Assignee, AssigneeTask)
+
+
+@dataclass(frozen=True)
+class DashboardMetrics:
+    """The counts shown on the Dashboard, each with the number of rows updated in the last `RECENT_DAYS` days.
+
+    Projects and assignees count unless soft-deleted, tasks count while their project does.
+
+    Attributes:
+    chart : pd.DataFrame
+        The columns of `CHART_COLUMNS`, one row per visible assignee with the number of tasks assigned to them.
+        The frame is shared between reruns; do not modify it.
+    """
+    projects: int
+    projects_updated: int
+    tasks: int
+    tasks_updated: int
+    tasks_in_progress: int
+    tasks_in_progress_updated: int
+    tasks_done: int
+    tasks_done_updated: int
+    assignees: int
+    assignees_updated: int
+    chart: pd.DataFrame
+
+
+def read_metrics(session: Session, cutoff: datetime) -> DashboardMetrics:
+    """Counts the Dashboard metrics in the database.
+
+    Three aggregate queries return the project counts, the task counts per status and one row per visible
+    assignee, so only the counts reach the app, however many rows the tables hold.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    cutoff : datetime
+        Rows updated since then count as recently updated.
+
+    Returns: DashboardMetrics: The current metrics.
+    """
+    parameters = {"cutoff": cutoff}
+    projects, projects_updated = session.execute(DASHBOARD_PROJECTS, parameters).one()
+    tasks = {status: (count, updated) for status, count, updated in session.execute(DASHBOARD_TASKS, parameters)}
+    assignees = session.execute(DASHBOARD_ASSIGNEES, parameters).all()
+    return DashboardMetrics(
+        projects=projects,
+        projects_updated=projects_updated,
+        tasks=sum(count for count, _ in tasks.values()),
+        tasks_updated=sum(updated for _, updated in tasks.values()),
+        tasks_in_progress=tasks.get(IN_PROGRESS_STATUS, (0, 0))[0],
+        tasks_in_progress_updated=tasks.get(IN_PROGRESS_STATUS, (0, 0))[1],
+        tasks_done=tasks.get(DONE_STATUS, (0, 0))[0],
+        tasks_done_updated=tasks.get(DONE_STATUS, (0, 0))[1],
+        assignees=len(assignees),
+        assignees_updated=sum(bool(recent) for *_, recent in assignees),
+        chart=pd.DataFrame([tuple(row[:4]) for row in assignees], columns=CHART_COLUMNS),
+    )
+
+
+class MetricsRefresher:
+    """Keeps the Dashboard metrics and counts them again only after one of their tables changed.
+
+    Every refresh starts with one probe reading the change stamps of the projects, tasks, assignees and
+    assignments in one round trip. While the stamps stay the same, the metrics of the previous refresh are
+    returned, until the window of recent updates has moved on by `RECENT_RESOLUTION`; otherwise `read_metrics`
+    counts them again. Only the counts and the chart are kept, never the rows they are counted from.
+
+    One refresher is shared by all sessions of the process, so its cache is guarded by a lock.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.cached: Optional[tuple[dict[str, TableStamp], datetime, DashboardMetrics]] = None
+
+    def refresh(self, session: Session, now: Optional[datetime] = None) -> DashboardMetrics:
+        """Returns the metrics, counting them again if a table changed or the recent-updates window moved on.
+
+        Parameters:
+        session : sqlalchemy.orm.session.Session
+            The SQLAlchemy session used for querying the database.
+        now : datetime, optional
+            The end of the recent-updates window, now by default.
+
+        Returns: DashboardMetrics: The current metrics.
+        """
+        cutoff = (now or datetime.now()) - timedelta(days=RECENT_DAYS)
+        stamps = table_stamps(session, METRICS_MODELS)
+        with self.lock:
+            cached = self.cached
+        if cached is not None and cached[0] == stamps and timedelta(0) <= cutoff - cached[1] < RECENT_RESOLUTION:
+            return cached[2]
+        metrics = read_metrics(session, cutoff)
+        with self.lock:
+            self.cached = (stamps, cutoff, metrics)
+        return metrics
+
+
+dashboard_metrics = MetricsRefresher()
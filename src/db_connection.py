@@ -1,11 +1,63 @@
 """Sets up the connection and session management class."""
 import os
-from typing import Any
+import threading
+import time
+from contextlib import contextmanager
+from itertools import cycle
+from typing import Any, Iterator, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, URL, exc
+from sqlalchemy import create_engine, URL, exc, text, Engine, Insert, Update, Delete
 from sqlalchemy.orm import sessionmaker, scoped_session, declarative_base, Session
 
+DRIVERS = ("psycopg2", "psycopg")
+# psycopg 3 returns undecoded bytes from a SQL_ASCII database unless the client encoding is set.
+CONNECT_ARGS = {"client_encoding": "utf8"}
+REPLICA_MAX_LAG = 5.0
+REPLICA_CHECK_INTERVAL = 5.0
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class RoutingSession(Session):
+    """A session that sends pure reads to a replica and everything else to the primary.
+
+    Writes, flushes and `SELECT ... FOR UPDATE` statements always go to the primary engine. After a write the
+    session keeps reading from the primary for `REPLICA_MAX_LAG` seconds, so users see their own changes even when
+    the replica has not replayed them yet. Reads fall back to the primary when no replica is configured or every
+    replica lags behind too much.
+
+    Attributes:
+    router : DBEngine | None
+        The DBEngine that owns the primary and replica engines. Without a router the session behaves like a plain
+        session bound to its `bind`.
+    read_only : bool
+        Whether the session's transactions are started read-only in the database, on the primary and the replicas
+        alike, so a write fails instead of being committed.
+    """
+    def __init__(self, router: Optional["DBEngine"] = None, read_only: bool = False, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.router = router
+        self.read_only = read_only
+        self._primary_until = 0.0
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Any:
+        """Returns the engine the given statement should run on."""
+        if self.router is None:
+            return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+        is_write = (self._flushing or isinstance(clause, (Insert, Update, Delete))
+                    or getattr(clause, "_for_update_arg", None) is not None)
+        if is_write:
+            self._primary_until = time.monotonic() + self.router.replica_max_lag
+            engine = self.router.engine
+        elif time.monotonic() < self._primary_until:
+            engine = self.router.engine
+        else:
+            engine = self.router.get_replica() or self.router.engine
+        return self.router.read_only(engine) if self.read_only else engine
+
 
 class DBEngine:
     """DBEngine is a utility class that manages the connection and session.
@@ -14,12 +66,23 @@ class DBEngine:
     used to define ORM models.
 
     Attributes:
+    driver : str
+        The DBAPI driver of the engines, one of `DRIVERS`.
     engine : sqlalchemy.engine.Engine
         The SQLAlchemy engine instance that handles the database connection.
+    replica_engines : list[sqlalchemy.engine.Engine]
+        Optional read replica engines configured with the `replica_hosts` environment variable.
+    replica_max_lag : float
+        The replication lag in seconds above which a replica is skipped in favour of the primary.
     Base : sqlalchemy.ext.declarative.api.Base
         The declarative base class used to define ORM models.
+    session_factory : sqlalchemy.orm.sessionmaker
+        The factory of `RoutingSession` instances shared by the scoped sessions and the units of work.
+    read_session_factory : sqlalchemy.orm.sessionmaker
+        The factory of the read-only `RoutingSession` instances of the read-only units of work.
     Session : sqlalchemy.orm.scoping.scoped_session
-        A factory for creating new SQLAlchemy session instances, scoped to the current thread.
+        A factory for creating new SQLAlchemy session instances, scoped to the current thread. The sessions are
+        `RoutingSession` instances that send pure reads to a healthy replica if any is configured.
 
     Methods:
     __init__() -> None
@@ -29,6 +92,12 @@ class DBEngine:
         Retrieves a new session instance from the scoped session factory.
     get_base() -> sqlalchemy.ext.declarative.api.Base
         Provides the declarative base class for defining ORM models.
+    get_replica() -> sqlalchemy.engine.Engine | None
+        Returns the next replica engine whose replication lag is acceptable.
+    unit_of_work() -> Iterator[sqlalchemy.orm.session.Session]
+        Provides a private session for one script run that commits once at the end.
+    read_only_unit_of_work() -> Iterator[sqlalchemy.orm.session.Session]
+        Provides a private read-only session for one script run of a page that only reads.
     close_session() -> None
         Closes the current session, ensuring that all resources are properly released.
     """
@@ -37,11 +106,20 @@ class DBEngine:
 
         This constructor loads environment variables using dotenv, creates a SQLAlchemy engine with connection
         pooling, and sets up a scoped session factory. The connection details such as the database name, username,
-        password, host, and port are retrieved from the environment variables.
+        password, host, and port are retrieved from the environment variables. Read replicas are optional and
+        configured as a comma-separated `replica_hosts=host:port,...` list sharing the primary's credentials;
+        `replica_max_lag` sets the acceptable replication lag in seconds. `db_driver` selects the DBAPI driver,
+        `psycopg2` by default or `psycopg` for psycopg 3, which adds pipeline mode and binary COPY.
+
+        Raises:
+        ValueError: If `db_driver` names a driver that is not in `DRIVERS`.
         """
         load_dotenv()
+        self.driver = os.getenv('db_driver') or DRIVERS[0]
+        if self.driver not in DRIVERS:
+            raise ValueError(f"Unknown db_driver '{self.driver}', expected one of: {', '.join(DRIVERS)}")
         database_url = URL.create(
-            "postgresql+psycopg2",
+            f"postgresql+{self.driver}",
             database=os.getenv('dbname'),
             username=os.getenv('user'),
             password=os.getenv('password'),
@@ -54,14 +132,43 @@ class DBEngine:
             pool_size=10,  # Adjust based on your expected load
             max_overflow=20,  # Allows for additional connections beyond pool_size
             pool_pre_ping=True,  # Ensures connections are alive
-            pool_recycle=1800  # Recycle connections after 30 minutes
+            pool_recycle=1800,  # Recycle connections after 30 minutes
+            connect_args=CONNECT_ARGS
         )
+        self.replica_max_lag = float(os.getenv('replica_max_lag') or REPLICA_MAX_LAG)
+        self.replica_engines = [
+            create_engine(
+                database_url.set(host=replica.partition(':')[0], port=int(replica.partition(':')[2] or 5432)),
+                echo=True,
+                pool_size=10,
+                max_overflow=20,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                connect_args=CONNECT_ARGS
+            )
+            for replica in (os.getenv('replica_hosts') or '').split(',') if replica.strip()
+        ]
+        self._replicas = cycle(self.replica_engines)
+        self._replica_lag: dict[int, tuple[float, float]] = {}
+        self._replica_lock = threading.Lock()
+        self._read_only_engines: dict[int, Engine] = {}
         self.Base = declarative_base()
-        self.Session = scoped_session(sessionmaker(
+        self.session_factory = sessionmaker(
+            class_=RoutingSession,
+            router=self,
             autoflush=False,
             autocommit=False,
             bind=self.engine
-        ))
+        )
+        self.read_session_factory = sessionmaker(
+            class_=RoutingSession,
+            router=self,
+            read_only=True,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=self.engine
+        )
+        self.Session = scoped_session(self.session_factory)
 
     def get_session(self) -> Session | Session:
         """Retrieves a new session instance from the scoped session factory.
@@ -81,6 +188,66 @@ class DBEngine:
             print(f"Error getting a new session: {e}")
             raise
 
+    def replica_lag(self, replica: Engine) -> float:
+        """Measures the replication lag of a replica in seconds.
+
+        Standalone servers that are not in recovery report no lag, which allows testing the routing with two
+        independent local Postgres instances.
+
+        Parameters:
+        replica : sqlalchemy.engine.Engine
+            The replica engine to check.
+
+        Returns:
+        lag : float: The lag in seconds, or infinity if the replica cannot be reached.
+        """
+        try:
+            with replica.connect() as connection:
+                return float(connection.execute(REPLICA_LAG_QUERY).scalar() or 0.0)
+        except exc.SQLAlchemyError as e:
+            print(f"Error checking replica lag: {e}")
+            return float('inf')
+
+    def get_replica(self) -> Optional[Engine]:
+        """Returns the next replica engine whose replication lag is acceptable.
+
+        Replicas are used round-robin. The lag of each replica is re-checked at most every
+        `REPLICA_CHECK_INTERVAL` seconds, so routing does not add a round trip to every read.
+
+        Returns:
+        replica : sqlalchemy.engine.Engine | None: A healthy replica, or None to fall back to the primary.
+        """
+        for _ in range(len(self.replica_engines)):
+            with self._replica_lock:
+                replica = next(self._replicas)
+                checked_at, lag = self._replica_lag.get(id(replica), (0.0, 0.0))
+            if time.monotonic() - checked_at > REPLICA_CHECK_INTERVAL:
+                lag = self.replica_lag(replica)
+                with self._replica_lock:
+                    self._replica_lag[id(replica)] = (time.monotonic(), lag)
+            if lag <= self.replica_max_lag:
+                return replica
+        return None
+
+    def read_only(self, engine: Engine) -> Engine:
+        """Returns a variant of an engine whose transactions are started read-only.
+
+        The variant shares the engine's connection pool. The read-only mode is sent along with the `BEGIN` of the
+        transaction, so it costs no extra round trip, and it is reset when the connection returns to the pool.
+
+        Parameters:
+        engine : sqlalchemy.engine.Engine
+            The primary or a replica engine.
+
+        Returns:
+        engine : sqlalchemy.engine.Engine: The read-only variant, created once per engine.
+        """
+        with self._replica_lock:
+            variant = self._read_only_engines.get(id(engine))
+            if variant is None:
+                variant = self._read_only_engines[id(engine)] = engine.execution_options(postgresql_readonly=True)
+        return variant
+
     def get_base(self) -> Any:
         """Provides the declarative base class for defining ORM models.
 
@@ -91,6 +258,48 @@ class DBEngine:
         """
         return self.Base
 
+    @contextmanager
+    def unit_of_work(self) -> Iterator[Session]:
+        """Provides a private session for one Streamlit script run that commits once at the end.
+
+        Every rerun gets its own session instead of sharing one across the per-user script threads. The session
+        keeps a single transaction open for the whole run, so all reads reuse the same pooled connection and the
+        writes made by the forms are committed together when the block exits. Any exception rolls the run back.
+
+        Yields:
+        session : sqlalchemy.orm.session.Session: The session for the current run.
+
+        Raises:
+        Exception: Re-raises any error raised inside the block after rolling the transaction back.
+        """
+        session = self.session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    @contextmanager
+    def read_only_unit_of_work(self) -> Iterator[Session]:
+        """Provides a private read-only session for one script run of a page that only reads.
+
+        The session neither autoflushes nor expires its instances, and its transactions are read-only in the
+        database, so a write made by mistake fails instead of being committed. Nothing is committed: the
+        transaction is rolled back when the block exits, which costs the same round trip as a commit. Reads are
+        routed to the replicas like those of the other sessions.
+
+        Yields:
+        session : sqlalchemy.orm.session.Session: The read-only session for the current run.
+        """
+        session = self.read_session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
     def close_session(self) -> None:
         """Provides the declarative base class for defining ORM models.
 
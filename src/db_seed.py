@@ -1,11 +1,20 @@
 """Deletes, Creates Database Tables and Feeds them with Dummy Data for Testing Purposes."""
-from typing import Any
-
+import os
+import time
+from datetime import date, datetime
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Sized
+
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
 from src.base import db_engine, session, Model
-from src.models import Project, Task, Assignee, Manager
+from src.bulk_copy import binary_copy_available, copy_rows, reserve_ids
+from src.models import Task, Assignee, AssigneeTask
 from src.dummy_data import projects_list_full
+from src.upserts import create_project_with_manager, upsert_people, assign_tasks
 
 
 def drop_tables() -> None:
@@ -61,22 +70,129 @@ def create_database() -> None:
     Model.metadata.create_all(db_engine.engine)
 
 
-def seed_database(projects_data: list[dict[str, Any]]) -> None:
+def seed_project(session: Session, project_data: dict[str, Any],
+                 assignee_ids: Optional[dict[str, int]] = None) -> Optional[int]:
+    """Inserts one project record with its manager, tasks and task assignments using set-based statements.
+
+    The project and its manager are written in one upsert statement, the project's assignees are resolved by email
+    in one multi-row upsert, the tasks are inserted in one batched statement returning their IDs and the
+    assignments in one `ON CONFLICT DO NOTHING` insert, so no query-then-insert round trips are needed. On
+    psycopg 3 the tasks and assignments are loaded with binary COPY instead, see `copy_tasks`.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the inserts. The caller is responsible for committing.
+    project_data : dict[str, Any]
+        A project record in the format of `projects_list_full`.
+    assignee_ids : dict[str, int], optional
+        Already resolved assignee IDs by email. When omitted, the project's assignees are upserted.
+
+    Returns: int | None: The ID of the new project, or None if its manager already runs a project.
+    """
+    project_id = create_project_with_manager(session, project_data, project_data['manager'])
+    if project_id is None:
+        print(f"Skipped project '{project_data['project_name']}': its manager already runs a project.")
+        return None
+    tasks_data = project_data['tasks']
+    if assignee_ids is None:
+        assignee_ids = upsert_people(session, Assignee,
+                                     (assignee for task in tasks_data for assignee in task['assignees']))
+    if tasks_data and binary_copy_available(session):
+        copy_tasks(session, project_id, tasks_data, assignee_ids)
+        return project_id
+    task_ids: list[int] = []
+    if tasks_data:
+        task_ids = list(session.scalars(
+            insert(Task).returning(Task.id, sort_by_parameter_order=True),
+            [{
+                'task_name': task_data['task_name'],
+                'start_date': task_data['start_date'],
+                'due_date': task_data['due_date'],
+                'status': task_data['status'],
+                'project_id': project_id
+            } for task_data in tasks_data]
+        ))
+    assign_tasks(session, ((assignee_ids[assignee['email']], task_id)
+                           for task_data, task_id in zip(tasks_data, task_ids)
+                           for assignee in task_data['assignees']))
+    return project_id
+
+
+def _as_date(value: date | str) -> date:
+    """Returns a date given as a `date` or as an ISO string, the way seed files and generated records carry it."""
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+
+def copy_tasks(session: Session, project_id: int, tasks_data: list[dict[str, Any]],
+               assignee_ids: dict[str, int]) -> list[int]:
+    """Loads the tasks of a new project and their assignments with binary COPY.
+
+    The task IDs are reserved from the sequence first, so the assignments can refer to them; the tasks are new,
+    so their assignments cannot conflict with existing ones and need no `ON CONFLICT` clause. The rows carry the
+    `created_at` and `version` values the models' defaults would set.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session of a psycopg 3 engine. The caller is responsible for committing.
+    project_id : int
+        The ID of the project the tasks belong to.
+    tasks_data : list[dict[str, Any]]
+        The task records of a project record in the format of `projects_list_full`.
+    assignee_ids : dict[str, int]
+        The IDs of the tasks' assignees by email.
+
+    Returns: list[int]: The IDs of the tasks, in the order of `tasks_data`.
+    """
+    now = datetime.now()
+    task_ids = reserve_ids(session, Task.__table__, len(tasks_data))
+    copy_rows(session, Task.__table__,
+              ("id", "task_name", "start_date", "due_date", "status", "project_id", "created_at", "version"),
+              ((task_id, task_data['task_name'], _as_date(task_data['start_date']), _as_date(task_data['due_date']),
+                task_data['status'], project_id, now, 1) for task_id, task_data in zip(task_ids, tasks_data)))
+    assignments = dict.fromkeys((assignee_ids[assignee['email']], task_id)
+                                for task_data, task_id in zip(tasks_data, task_ids)
+                                for assignee in task_data['assignees'])
+    copy_rows(session, AssigneeTask.__table__, ("assignee_id", "task_id", "created_at", "version"),
+              ((assignee_id, task_id, now, 1) for assignee_id, task_id in assignments))
+    return task_ids
+
+
+def seed_projects(db_session: Session, projects_data: Iterable[dict[str, Any]],
+                  on_progress: Optional[Callable[[int, int], None]] = None) -> None:
+    """Seeds the given projects with the given session, committing after each project.
+
+    Unlike `seed_database()`, errors are raised to the caller and the session is left open, so a background job
+    seeding with the worker's session is recorded as failed.
+
+    Parameters:
+    db_session : sqlalchemy.orm.session.Session
+        The session to seed with.
+    projects_data : Iterable[dict[str, Any]]
+        The project records to insert, in the format of `projects_list_full`.
+    on_progress : Callable[[int, int], None], optional
+        Called after each committed project with the number of projects seeded so far and the total.
+    """
+    total = len(projects_data) if isinstance(projects_data, Sized) else 0
+    for done, project_data in enumerate(projects_data, start=1):
+        seed_project(db_session, project_data)
+        db_session.commit()
+        if on_progress:
+            on_progress(done, max(total, done))
+
+
+def seed_database(projects_data: Iterable[dict[str, Any]], db_session: Optional[Session] = None,
+                  on_progress: Optional[Callable[[int, int], None]] = None) -> None:
     """Populates the database with initial data for projects, managers, tasks, and assignees.
 
     This function iterates over a predefined list of project data and populates the database with `Manager`,
     `Project`, `Task`, and `Assignee` records. It ensures that existing managers and assignees are not duplicated
-    by checking their presence based on the email field. The function also manages the associations between
+    by upserting them on the unique email field. The function also manages the associations between
     projects, tasks, and assignees.
     Process:
-    1. For each project in `projects_data`:
-        - Check if the manager exists in the database by email. If not, create and add the manager.
-        - Create the project and associate it with the manager.
-        - For each task in the project:
-            - Create the task and associate it with the project.
-            - For each assignee in the task:
-                - Check if the assignee exists in the database by email. If not, create and add the assignee.
-                - Associate the task with the assignee.
+    1. For each project in `projects_data`, `seed_project()`:
+        - Creates the project together with its manager, reusing the manager if the email exists.
+        - Upserts the project's assignees by email.
+        - Inserts the project's tasks and the task assignments in batches.
 
     2. Commit the session after adding each project and its associated tasks and assignees.
     Error Handling: - If an `IntegrityError` occurs (e.g., due to unique constraint violations), the transaction is
@@ -84,71 +200,121 @@ def seed_database(projects_data: list[dict[str, Any]]) -> None:
     Finalization: - The database session is closed in the `finally` block to ensure that resources are properly
     released.
 
+    Parameters:
+    projects_data : Iterable[dict[str, Any]]
+        The project records to insert, in the format of `projects_list_full`.
+    db_session : sqlalchemy.orm.session.Session, optional
+        The session to seed with. Defaults to the current thread's scoped session.
+    on_progress : Callable[[int, int], None], optional
+        Called after each committed project with the number of projects seeded so far and the total.
+
     Notes:
     - This function assumes that the database schema has already been created (e.g., using `create_database()`).
-    - Be cautious when running this function multiple times as it may lead to data duplication if not properly handled.
+    - Running this function multiple times skips projects whose manager already runs a project, so the seed data
+      is not duplicated.
     - The function commits changes incrementally to avoid holding open transactions for too long, which could
       lead to locks or other performance issues.
     """
+    db_session = db_session or session()
     try:
-        for project_data in projects_data:
-            # Create or get the Manager object
-            manager = session.query(Manager).filter_by(email=project_data['manager']['email']).first()
-            if not manager:
-                manager = Manager(
-                    firstname=project_data['manager']['firstname'],
-                    lastname=project_data['manager']['lastname'],
-                    salary=project_data['manager']['salary'],
-                    email=project_data['manager']['email']
-                )
-                session.add(manager)
-                session.commit()
-
-            # Create the Project object
-            project = Project(
-                project_name=project_data['project_name'],
-                project_aim=project_data['project_aim'],
-                project_budget=project_data['project_budget'],
-                manager=manager
-            )
-            session.add(project)
-
-            for task_data in project_data['tasks']:
-                # Create the Task object
-                task = Task(
-                    task_name=task_data['task_name'],
-                    start_date=task_data['start_date'],
-                    due_date=task_data['due_date'],
-                    status=task_data['status'],
-                    project=project
-                )
-                session.add(task)
-
-                # Associate Assignees with the Task
-                for assignee_data in task_data['assignees']:
-                    assignee = session.query(Assignee).filter_by(email=assignee_data['email']).first()
-                    if not assignee:
-                        assignee = Assignee(
-                            firstname=assignee_data['firstname'],
-                            lastname=assignee_data['lastname'],
-                            salary=assignee_data['salary'],
-                            email=assignee_data['email']
-                        )
-                        session.add(assignee)
-                        session.commit()  # Commit the new Assignee to generate its ID
-
-                    # Associate the Task with the Assignee
-                    task.assignees.append(assignee)
-
-            session.commit()
+        seed_projects(db_session, projects_data, on_progress)
 
     except IntegrityError as e:
-        session.rollback()
+        db_session.rollback()
         print(f"An error occurred: {e}")
     finally:
         db_engine.close_session()
 
 
+def _seed_shard(shard: list[dict[str, Any]], assignee_ids: dict[str, int]) -> tuple[int, int, int]:
+    """Seeds one shard of projects in a worker process and returns the project, task and assignment counts.
+
+    The worker drops the connections inherited from the parent process, from the primary and every replica pool,
+    and seeds with a session of its own, so every process talks to the database through its own engine pools. The
+    read-only engine variants share these pools and need no disposing of their own.
+    """
+    for engine in (db_engine.engine, *db_engine.replica_engines):
+        engine.dispose(close=False)
+    worker_session = db_engine.session_factory()
+    projects = tasks = assignments = 0
+    try:
+        for project_data in shard:
+            if seed_project(worker_session, project_data, assignee_ids) is not None:
+                projects += 1
+                tasks += len(project_data['tasks'])
+                assignments += sum(len(task['assignees']) for task in project_data['tasks'])
+            worker_session.commit()
+    except Exception:
+        worker_session.rollback()
+        raise
+    finally:
+        worker_session.close()
+    return projects, tasks, assignments
+
+
+def _chunks(projects_data: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Splits a list or a generated stream of project records into lists of at most `chunk_size` records."""
+    iterator = iter(projects_data)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def seed_database_parallel(projects_data: Iterable[dict[str, Any]], workers: Optional[int] = None,
+                           chunk_size: int = 50) -> dict[str, float]:
+    """Populates the database using a pool of worker processes, each seeding a shard of the projects.
+
+    The projects are split into shards of `chunk_size` records. Before a shard is handed to a worker, the parent
+    process resolves all of its assignees by email in one upsert, so the workers never race each other on creating
+    the same person; the workers then insert projects, tasks and assignments in parallel. At most two shards per
+    worker are in flight, so a generated stream of projects is never materialized in memory.
+
+    Parameters:
+    projects_data : Iterable[dict[str, Any]]
+        The project records to insert, in the format of `projects_list_full`, as a list or a generator.
+    workers : int, optional
+        The number of worker processes. Defaults to the number of CPUs; keep it below the database's
+        connection limit.
+    chunk_size : int
+        The number of projects per shard.
+
+    Returns: dict[str, float]: The seeded projects, tasks and assignments, elapsed seconds and rows per second.
+    """
+    workers = workers or os.cpu_count() or 1
+    totals = {"projects": 0, "tasks": 0, "assignments": 0}
+    started = time.perf_counter()
+    parent_session = session()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight: set[Future[tuple[int, int, int]]] = set()
+            for shard in _chunks(projects_data, chunk_size):
+                assignee_ids = upsert_people(parent_session, Assignee,
+                                             (assignee for project in shard for task in project['tasks']
+                                              for assignee in task['assignees']))
+                parent_session.commit()
+                in_flight.add(pool.submit(_seed_shard, shard, assignee_ids))
+                if len(in_flight) >= 2 * workers:
+                    finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    _add_shard_counts(totals, finished)
+            _add_shard_counts(totals, wait(in_flight).done)
+    finally:
+        db_engine.close_session()
+    elapsed = time.perf_counter() - started
+    rows = totals["projects"] + totals["tasks"] + totals["assignments"]
+    report = {**totals, "seconds": elapsed, "rows_per_second": rows / elapsed if elapsed else 0.0}
+    print(f"Seeded {totals['projects']} projects, {totals['tasks']} tasks and {totals['assignments']} assignments "
+          f"with {workers} workers in {elapsed:.1f}s ({report['rows_per_second']:.0f} rows/s).")
+    return report
+
+
+def _add_shard_counts(totals: dict[str, int], finished: Iterable[Future[tuple[int, int, int]]]) -> None:
+    """Adds the counts returned by finished shards to the running totals."""
+    for future in finished:
+        projects, tasks, assignments = future.result()
+        totals["projects"] += projects
+        totals["tasks"] += tasks
+        totals["assignments"] += assignments
+
+
 def main() -> None:
     """Displays a menu to the user for executing various database management functions.
 
@@ -170,8 +336,11 @@ def main() -> None:
     4. Exit the program:
        - Calls `db_engine.close_session()` to close the database session and exits the program
          without making any changes to the database.
+    5. Seed database with dummy data in parallel:
+       - Calls the `seed_database_parallel()` function to seed with a pool of worker processes and
+         reports the aggregate throughput.
 
-    User Input: The user is prompted to enter their choice (1, 2, 3, or 4). The input is then evaluated,
+    User Input: The user is prompted to enter their choice (1, 2, 3, 4 or 5). The input is then evaluated,
       and the corresponding function is executed.
 
     Notes: The function provides a simple interface for performing common database operations,
@@ -184,7 +353,8 @@ def main() -> None:
           '1. Drop all tables in database.\n'
           '2. Create database tables Model provides.\n'
           '3. Seed database with dummy data.\n'
-          '4. Just exit.'
+          '4. Just exit.\n'
+          '5. Seed database with dummy data in parallel worker processes.'
           )
     use_choice = input('\nYour choice: ', )
     if use_choice == '1':
@@ -193,6 +363,8 @@ def main() -> None:
         create_database()
     elif use_choice == '3':
         seed_database(projects_list_full)
+    elif use_choice == '5':
+        seed_database_parallel(projects_list_full)
     else:
         db_engine.close_session()
 
@@ -1,4 +1,7 @@
 """Dummy Data to Feed Database Tables for Testing Purposes."""
+import random
+from datetime import date, timedelta
+from typing import Any, Iterator
 
 projects_list_full = [
     {
@@ -316,3 +319,58 @@ person_tasks_list = [
     {'person_id': 5, 'task_id': 8},
     {'person_id': 2, 'task_id': 9}
 ]
+
+
+def generate_projects(projects: int, tasks_per_project: int = 20, assignees: int = 500, assignees_per_task: int = 2,
+                      seed: int = 0) -> Iterator[dict[str, Any]]:
+    """Generates a stream of synthetic project records in the format of `projects_list_full`.
+
+    The records are produced one at a time, so datasets far larger than `projects_list_full` can be streamed into
+    the seeding functions without building them in memory. The same seed always produces the same records.
+
+    Parameters:
+    projects : int
+        The number of projects to generate; each gets its own manager.
+    tasks_per_project : int
+        The number of tasks per project.
+    assignees : int
+        The size of the pool of assignees the tasks are assigned from.
+    assignees_per_task : int
+        The number of distinct assignees per task.
+    seed : int
+        The seed of the random generator. It is part of the managers' emails, so streams generated with different
+        seeds can be seeded into the same database.
+
+    Yields: dict[str, Any]: A project record with its manager, tasks and task assignees.
+    """
+    rng = random.Random(seed)
+    statuses = ['not_started', 'in_progres', 'done']
+    for project_number in range(projects):
+        tasks = []
+        for task_number in range(tasks_per_project):
+            start_date = date(2024, 1, 1) + timedelta(days=rng.randrange(365))
+            picked = rng.sample(range(assignees), min(assignees_per_task, assignees))
+            tasks.append({
+                'task_name': f'Task {project_number}-{task_number}',
+                'start_date': start_date.isoformat(),
+                'due_date': (start_date + timedelta(days=rng.randrange(1, 90))).isoformat(),
+                'status': rng.choice(statuses),
+                'assignees': [{
+                    'firstname': f'Assignee{number}',
+                    'lastname': 'Generated',
+                    'salary': 40000 + (number * 37) % 60000,
+                    'email': f'assignee{number}@generated.example.com'
+                } for number in picked]
+            })
+        yield {
+            'project_name': f'Generated Project {project_number}',
+            'project_aim': f'To deliver generated project {project_number}',
+            'project_budget': rng.randrange(100000, 1000000),
+            'manager': {
+                'firstname': f'Manager{project_number}',
+                'lastname': 'Generated',
+                'salary': rng.randrange(80000, 150000),
+                'email': f'manager{seed}-{project_number}@generated.example.com'
+            },
+            'tasks': tasks
+        }
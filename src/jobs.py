@@ -0,0 +1,195 @@
+"""Postgres-Backed Job Queue for Heavy Operations Run Outside the Streamlit Script Thread."""
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.models import Job
+from src.queries import RECENT_JOBS
+from src.purge import purge_project, purge_manager, purge_assignee, purge_all_deleted
+
+JOB_STATUSES = ("queued", "running", "done", "failed")
+STALE_JOB_TIMEOUT = timedelta(minutes=10)
+
+Reporter = Callable[[int, Optional[int], Optional[str]], None]
+
+
+def _seed(session: Session, payload: dict[str, Any], report: Reporter) -> None:
+    """Seeds the database with the dummy data set, or streams the JSON Lines file given as `path` in the payload."""
+    from src.db_seed import seed_projects
+    from src.dummy_data import projects_list_full
+    from src.seed_files import iter_seed_file
+    projects_data = iter_seed_file(payload["path"]) if payload.get("path") else projects_list_full
+    seed_projects(session, projects_data, on_progress=lambda done, total: report(done, total, None))
+
+
+def _purge(purge: Callable[..., None]) -> Callable[[Session, dict[str, Any], Reporter], None]:
+    """Wraps one of the purge functions as a job handler that reports each batch as progress."""
+    def handler(session: Session, payload: dict[str, Any], report: Reporter) -> None:
+        purge(session, payload["id"], on_progress=lambda table, done, total: report(done, total, f"Purging {table}"))
+    return handler
+
+
+def _purge_all(session: Session, payload: dict[str, Any], report: Reporter) -> None:
+    """Purges every row that is marked as deleted."""
+    purge_all_deleted(session, on_progress=lambda table, done, total: report(done, total, f"Purging {table}"))
+
+
+JOB_HANDLERS: dict[str, Callable[[Session, dict[str, Any], Reporter], None]] = {
+    "seed": _seed,
+    "purge_project": _purge(purge_project),
+    "purge_manager": _purge(purge_manager),
+    "purge_assignee": _purge(purge_assignee),
+    "purge_deleted": _purge_all,
+}
+
+
+def enqueue_job(session: Session, kind: str, payload: Optional[dict[str, Any]] = None) -> Job:
+    """Adds a job to the queue for a background worker to pick up.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used to insert the job. The caller is responsible for committing.
+    kind : str
+        The name of a handler registered in `JOB_HANDLERS`.
+    payload : dict[str, Any], optional
+        The JSON arguments passed to the handler.
+
+    Returns: Job: The new job instance.
+
+    Raises:
+    ValueError: If no handler is registered for the given kind.
+    """
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    job = Job(kind=kind, payload=payload or {}, status="queued", progress=0)
+    session.add(job)
+    session.flush()
+    return job
+
+
+def claim_next_job(session: Session, worker: str) -> Optional[Job]:
+    """Claims the oldest queued job for the given worker.
+
+    The queued row is locked with `FOR UPDATE SKIP LOCKED`, so concurrent workers skip rows another worker is
+    claiming instead of blocking on them, and the status switch to "running" is committed right away.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The worker's SQLAlchemy session.
+    worker : str
+        The name of the worker claiming the job.
+
+    Returns: Job | None: The claimed job, or None if the queue is empty.
+    """
+    job = session.execute(
+        select(Job).where(Job.status == "queued").order_by(Job.id).limit(1).with_for_update(skip_locked=True)
+    ).scalar()
+    if job is None:
+        session.rollback()
+        return None
+    now = datetime.now()
+    job.status = "running"
+    job.worker = worker
+    job.started_at = now
+    job.heartbeat_at = now
+    session.commit()
+    return job
+
+
+def report_progress(job_id: int, progress: int, total: Optional[int] = None, message: Optional[str] = None) -> None:
+    """Records the progress of a running job in its own short transaction.
+
+    Progress is written on a separate connection so that it is visible immediately, independently of the
+    transactions the handler itself is running.
+
+    Parameters:
+    job_id : int
+        The ID of the running job.
+    progress : int
+        The number of work units done so far.
+    total : int, optional
+        The number of work units expected.
+    message : str, optional
+        A short progress message.
+    """
+    values: dict[str, Any] = {"progress": progress, "heartbeat_at": datetime.now()}
+    if total is not None:
+        values["total"] = total
+    if message is not None:
+        values["message"] = message[:255]
+    with db_engine.engine.begin() as connection:
+        connection.execute(update(Job).where(Job.id == job_id).values(**values))
+
+
+def finish_job(job_id: int, status: str, message: Optional[str] = None) -> None:
+    """Marks a job as done or failed.
+
+    Parameters:
+    job_id : int
+        The ID of the job.
+    status : str
+        Either "done" or "failed".
+    message : str, optional
+        The error message of a failed job.
+    """
+    values: dict[str, Any] = {"status": status, "finished_at": datetime.now()}
+    if message is not None:
+        values["message"] = message[:255]
+    with db_engine.engine.begin() as connection:
+        connection.execute(update(Job).where(Job.id == job_id).values(**values))
+
+
+def run_job(session: Session, job: Job) -> None:
+    """Runs a claimed job with its registered handler and records the outcome.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The worker's SQLAlchemy session, handed to the handler.
+    job : Job
+        A job claimed with `claim_next_job`.
+    """
+    job_id, kind, payload = job.id, job.kind, dict(job.payload or {})
+    try:
+        JOB_HANDLERS[kind](session, payload,
+                           lambda progress, total, message: report_progress(job_id, progress, total, message))
+        finish_job(job_id, "done")
+    except Exception as e:
+        session.rollback()
+        print(f"Error: {e}")
+        finish_job(job_id, "failed", str(e))
+
+
+def requeue_stale_jobs(session: Session, timeout: timedelta = STALE_JOB_TIMEOUT) -> int:
+    """Puts running jobs whose worker stopped reporting back into the queue.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the update.
+    timeout : datetime.timedelta
+        How long a running job may go without a heartbeat.
+
+    Returns: int: The number of re-queued jobs.
+    """
+    result = session.execute(
+        update(Job).where(Job.status == "running", Job.heartbeat_at < datetime.now() - timeout)
+        .values(status="queued", worker=None)
+    )
+    session.commit()
+    return int(result.rowcount)
+
+
+def recent_jobs(session: Session, limit: int = 50) -> list[Job]:
+    """Returns the most recently queued jobs, newest first.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    limit : int
+        The maximum number of jobs to return.
+
+    Returns: list[Job]: The most recent jobs.
+    """
+    return list(session.execute(RECENT_JOBS, {"limit": limit}).scalars().all())
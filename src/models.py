@@ -1,5 +1,8 @@
 """Data Model for Entire App."""
-from sqlalchemy import Column, Integer, String, ForeignKey, Float, Date
+from typing import Any
+
+from sqlalchemy import (Column, Integer, BigInteger, String, ForeignKey, Float, Date, DateTime, JSON, UniqueConstraint,
+                        Index, MetaData, Connection, event, inspect, text)
 from sqlalchemy.orm import Relationship
 
 from src.base import TimeStampedModel, PersonModel, Model
@@ -213,15 +216,258 @@ class AssigneeTask(TimeStampedModel):
         The foreign key that links this record to a `Task`. This field is also part of the composite primary key,
         and the `ondelete="CASCADE"` option ensures that if the referenced task is deleted, the corresponding
         records in this table are also deleted.
+    The pair of `assignee_id` and `task_id` is unique, which also backs the `ON CONFLICT (assignee_id, task_id)`
+    clause of the bulk assignment insert. `task_id` has an index of its own, so the assignments of a task or a
+    project are found without scanning the table.
 
     Methods:
     __repr__():
         Returns a string representation of the `AssigneeTask` instance, showing the associated assignee and task IDs.
     """
     __tablename__ = "assignee_tasks"
+    __table_args__ = (UniqueConstraint("assignee_id", "task_id"),)
 
     assignee_id = Column(Integer, ForeignKey("assignees.id", ondelete="CASCADE"), primary_key=True)
-    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True, index=True)
 
     def __repr__(self) -> str:
         return f"<AssigneeTask(assignee_id={self.assignee_id}, task_id={self.task_id})>"
+
+
+class TaskDependency(TimeStampedModel):
+    """Represents a finish-to-start dependency between two tasks of the same project.
+
+    The dependent task cannot start before the task it depends on is due. Dependencies form a directed acyclic
+    graph per project, which `src.scheduling` uses to compute earliest and latest dates, slack and the critical
+    path. `src.scheduling.add_dependency` rejects dependencies across projects and dependencies that would close
+    a cycle.
+
+    Attributes:
+    task_id : sqlalchemy.Column
+        The foreign key of the dependent task. The `ondelete="CASCADE"` option removes the dependency together
+        with the task.
+    depends_on_id : sqlalchemy.Column
+        The foreign key of the task that has to finish first. It is indexed, so the dependents of a task are found
+        without scanning the table, and also removed together with the task.
+    The pair of `task_id` and `depends_on_id` is unique.
+
+    Methods:
+    __repr__():
+        Returns a string representation of the `TaskDependency` instance, showing both task IDs.
+    """
+    __tablename__ = "task_dependencies"
+    __table_args__ = (UniqueConstraint("task_id", "depends_on_id"),)
+
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    depends_on_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<TaskDependency(task_id={self.task_id}, depends_on_id={self.depends_on_id})>"
+
+
+class Job(TimeStampedModel):
+    """Represents a heavy operation queued for a background worker, such as seeding or purging.
+
+    Jobs are inserted by the app with the `queued` status and claimed by worker processes started with
+    `python -m src.worker`. Workers lock queued rows with `FOR UPDATE SKIP LOCKED`, so any number of workers can poll
+    the table without handing the same job to two of them.
+
+    Attributes:
+    kind : sqlalchemy.Column
+        The name of the handler that runs the job (e.g. "seed", "purge_project"). It is a required field.
+    payload : sqlalchemy.Column
+        The JSON arguments passed to the handler.
+    status : sqlalchemy.Column
+        The job state: "queued", "running", "done" or "failed". It is indexed for the workers' polling query.
+    progress : sqlalchemy.Column
+        The number of work units the handler reported as done.
+    total : sqlalchemy.Column
+        The number of work units the handler expects to process, if known.
+    message : sqlalchemy.Column
+        The last progress message or the error of a failed job.
+    worker : sqlalchemy.Column
+        The name of the worker that claimed the job.
+    started_at : sqlalchemy.Column
+        The date and time the job was claimed by a worker.
+    heartbeat_at : sqlalchemy.Column
+        The date and time the worker last reported progress. Running jobs with a stale heartbeat are re-queued.
+    finished_at : sqlalchemy.Column
+        The date and time the job finished or failed.
+
+    Methods:
+    __repr__():
+        Returns a string representation of the `Job` instance, showing the job's ID, kind and status.
+    """
+    __tablename__ = "jobs"
+
+    kind = Column(String(80), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String(20), nullable=False, default="queued", index=True)
+    progress = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=True)
+    message = Column(String(255), nullable=True)
+    worker = Column(String(80), nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<Job(id={self.id}, kind={self.kind}, status={self.status})>"
+
+
+class AuditEvent(Model):
+    """Represents one change made through the app's forms, in an append-only log partitioned by month.
+
+    Events are never updated or deleted by the app, so the model carries none of the update, soft-delete and
+    version columns of `TimeStampedModel`. The table is range-partitioned on `occurred_at` with one partition per
+    month, which `src.audit` creates before writing the first event of a month; old months can be detached or
+    dropped as a whole. The primary key includes `occurred_at` because every unique index of a partitioned table
+    must contain the partition key.
+
+    Attributes:
+    occurred_at : sqlalchemy.Column
+        The date and time the change was made, before it was written to the log.
+    actor : sqlalchemy.Column
+        Who made the change: the viewer's email on Streamlit Community Cloud, otherwise the browser session's ID.
+    entity : sqlalchemy.Column
+        The table of the changed row, e.g. "projects".
+    entity_id : sqlalchemy.Column
+        The ID of the changed row, or None for a bulk change of several rows that are not known one by one.
+        Together with `entity` and `occurred_at` it is indexed, so the history of one row reads a few index
+        entries per partition.
+    action : sqlalchemy.Column
+        "insert", "update" or "delete".
+    changes : sqlalchemy.Column
+        The new values of the written columns, keyed by column name, or `{"rows": n}` for a bulk change.
+
+    Methods:
+    __repr__():
+        Returns a string representation of the `AuditEvent` instance, showing the action and the changed row.
+    """
+    __tablename__ = "audit_events"
+    __table_args__ = (Index("ix_audit_events_entity", "entity", "entity_id", "occurred_at"),
+                      {"postgresql_partition_by": "RANGE (occurred_at)"})
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    occurred_at = Column(DateTime, primary_key=True)
+    actor = Column(String(255), nullable=True)
+    entity = Column(String(80), nullable=False)
+    entity_id = Column(Integer, nullable=True)
+    action = Column(String(20), nullable=False)
+    changes = Column(JSON, nullable=False, default=dict)
+
+    def __repr__(self) -> str:
+        return f"<AuditEvent({self.action} {self.entity} {self.entity_id} at {self.occurred_at})>"
+
+
+class TableChange(Model):
+    """Counts the committed changes of each app table, so that change stamps move in commit order.
+
+    Timestamps are taken when a row is flushed, not when its transaction commits, so a transaction committing after
+    a later one can land a change that no timestamp maximum reveals. A statement trigger on each counted table notes
+    the table in the transaction, and one deferred trigger per transaction bumps the counters of all the tables it
+    noted, at commit. The counter rows are locked in table name order, so writers only queue for the commit itself,
+    only behind writers of the same tables, and never deadlock on the counter rows.
+
+    Attributes:
+    table_name : sqlalchemy.Column
+        The name of the counted table.
+    changes : sqlalchemy.Column
+        The number of committed transactions that inserted, updated or deleted rows of the table.
+    """
+    __tablename__ = "table_changes"
+
+    table_name = Column(String(80), primary_key=True)
+    changes = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<TableChange({self.table_name}: {self.changes})>"
+
+
+class TableChangeMark(Model):
+    """Marks a transaction that changed counted tables, so that their counters are bumped once, at its commit.
+
+    The first statement of a transaction that changes a counted table inserts one mark. The mark's deferred trigger
+    bumps the counters of the tables the transaction changed and deletes the mark again, so the table stays empty.
+
+    Attributes:
+    id : sqlalchemy.Column
+        The ID of the mark.
+    """
+    __tablename__ = "table_change_marks"
+
+    id = Column(BigInteger, primary_key=True)
+
+    def __repr__(self) -> str:
+        return f"<TableChangeMark({self.id})>"
+
+
+COUNTED_MODELS = (Project, Manager, Task, Assignee, AssigneeTask, TaskDependency)
+CHANGED_TABLES_SETTING = "table_changes.pending"
+
+NOTE_CHANGE_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION note_table_change() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    pending text := coalesce(current_setting('{CHANGED_TABLES_SETTING}', true), '');
+BEGIN
+    IF pending = '' THEN
+        PERFORM set_config('{CHANGED_TABLES_SETTING}', TG_TABLE_NAME, true);
+        INSERT INTO {TableChangeMark.__tablename__} DEFAULT VALUES;
+    ELSIF NOT TG_TABLE_NAME = ANY(string_to_array(pending, ',')) THEN
+        PERFORM set_config('{CHANGED_TABLES_SETTING}', pending || ',' || TG_TABLE_NAME, true);
+    END IF;
+    RETURN NULL;
+END $$
+"""
+
+COUNT_CHANGES_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION count_table_changes() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO {TableChange.__tablename__} (table_name, changes)
+    SELECT changed.name, 1
+    FROM unnest(string_to_array(current_setting('{CHANGED_TABLES_SETTING}'), ',')) AS changed(name)
+    ORDER BY changed.name
+    ON CONFLICT (table_name) DO UPDATE SET changes = {TableChange.__tablename__}.changes + 1;
+    DELETE FROM {TableChangeMark.__tablename__} WHERE id = NEW.id;
+    RETURN NULL;
+END $$
+"""
+
+
+@event.listens_for(Model.metadata, "after_create")
+def install_change_counters(target: MetaData, connection: Connection, **kw: Any) -> None:
+    """Installs the commit-time change counting triggers on the counted tables after `create_all()`.
+
+    Each counted table gets a statement trigger, so a statement changing many rows, such as a `COPY`, fires it once,
+    and a transaction queues one deferred trigger however many statements it runs. The triggers are replaced on every
+    run, so running `create_database()` again adds them to an existing schema. SQLite, which the tests use, has no
+    statement triggers, so its tables get row triggers bumping the counters right away; SQLite runs one writer at a
+    time, so these counts move in commit order as well. Other databases only get the counter table, whose counts
+    then stay at zero.
+    """
+    TableChange.__table__.create(connection, checkfirst=True)
+    existing = set(inspect(connection).get_table_names())
+    counted = [model.__tablename__ for model in COUNTED_MODELS if model.__tablename__ in existing]
+    if connection.dialect.name == "sqlite":
+        for table in counted:
+            for operation in ("insert", "update", "delete"):
+                connection.execute(text(f"DROP TRIGGER IF EXISTS count_{operation}s_on_{table}"))
+                connection.execute(text(
+                    f"CREATE TRIGGER count_{operation}s_on_{table} AFTER {operation.upper()} ON {table} BEGIN "
+                    f"INSERT INTO {TableChange.__tablename__} (table_name, changes) VALUES ('{table}', 1) "
+                    f"ON CONFLICT (table_name) DO UPDATE SET changes = changes + 1; END"))
+        return
+    if connection.dialect.name != "postgresql":
+        return
+    TableChangeMark.__table__.create(connection, checkfirst=True)
+    connection.execute(text(NOTE_CHANGE_FUNCTION))
+    connection.execute(text(COUNT_CHANGES_FUNCTION))
+    connection.execute(text(f"DROP TRIGGER IF EXISTS count_changes ON {TableChangeMark.__tablename__}"))
+    connection.execute(text(
+        f"CREATE CONSTRAINT TRIGGER count_changes AFTER INSERT ON {TableChangeMark.__tablename__} "
+        f"DEFERRABLE INITIALLY DEFERRED FOR EACH ROW EXECUTE FUNCTION count_table_changes()"))
+    for table in counted:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS count_changes ON {table}"))
+        connection.execute(text(
+            f"CREATE TRIGGER count_changes AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION note_table_change()"))
@@ -0,0 +1,269 @@
+"""Soft-Deletes Items and Purges Their Cascading Children in Bounded Batches."""
+from datetime import datetime
+from typing import Any, Callable
+
+from sqlalchemy import select, delete, update, func, tuple_
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.models import Project, Manager, Task, Assignee, AssigneeTask
+
+PURGE_BATCH_SIZE = 1000
+
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def print_progress(table: str, done: int, total: int) -> None:
+    """Default progress callback that prints purge progress to the console.
+
+    Parameters:
+    table : str
+        The name of the table the rows are being removed from.
+    done : int
+        The number of rows removed so far from that table.
+    total : int
+        The number of rows that were counted for removal from that table.
+    """
+    print(f"Purging {table}: {done}/{total}")
+
+
+def project_cascade_size(session: Session, project_id: int) -> dict[str, int]:
+    """Counts the rows that would be removed together with the given project.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    project_id : int
+        The ID of the project to be deleted.
+
+    Returns: dict[str, int]: A mapping of table name to the number of rows that cascade from the project.
+    """
+    task_ids = select(Task.id).where(Task.project_id == project_id)
+    tasks_count = session.execute(select(func.count()).select_from(task_ids.subquery())).scalar_one()
+    assignments_count = session.execute(
+        select(func.count()).select_from(AssigneeTask).where(AssigneeTask.task_id.in_(task_ids))
+    ).scalar_one()
+    return {"projects": 1, "tasks": tasks_count, "assignee_tasks": assignments_count}
+
+
+def manager_cascade_size(session: Session, manager_id: int) -> dict[str, int]:
+    """Counts the rows that would be removed together with the given manager.
+
+    Deleting a manager cascades to the project the manager is responsible for and further to its tasks.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    manager_id : int
+        The ID of the manager to be deleted.
+
+    Returns: dict[str, int]: A mapping of table name to the number of rows that cascade from the manager.
+    """
+    result = {"managers": 1, "projects": 0, "tasks": 0, "assignee_tasks": 0}
+    project_id = session.execute(select(Project.id).where(Project.manager_id == manager_id)).scalar()
+    if project_id is not None:
+        result.update(project_cascade_size(session, project_id))
+    return result
+
+
+def assignee_cascade_size(session: Session, assignee_id: int) -> dict[str, int]:
+    """Counts the rows that would be removed together with the given assignee.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    assignee_id : int
+        The ID of the assignee to be deleted.
+
+    Returns: dict[str, int]: A mapping of table name to the number of rows that cascade from the assignee.
+    """
+    assignments_count = session.execute(
+        select(func.count()).select_from(AssigneeTask).where(AssigneeTask.assignee_id == assignee_id)
+    ).scalar_one()
+    return {"assignees": 1, "assignee_tasks": assignments_count}
+
+
+def mark_deleted(session: Session, model: type[Project] | type[Manager] | type[Assignee], item_id: int) -> bool:
+    """Marks a single row as deleted so that it disappears from the app before its children are purged.
+
+    Marking is a single-row update, so it is cheap and does not hold locks on the cascading children. A marked
+    manager or assignee also gives up its email, which is prefixed with `deleted-<id>-`, so a person created later
+    with the same email gets a new row instead of being matched to the one the purge is about to remove.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the update. The caller is responsible for committing.
+    model : type
+        The model class of the row to mark (`Project`, `Manager` or `Assignee`).
+    item_id : int
+        The ID of the row to mark.
+
+    Returns: bool: True if a not yet deleted row was marked, otherwise False.
+    """
+    values: dict[str, Any] = {"deleted_at": datetime.now()}
+    if model is not Project:
+        values["email"] = func.left(func.concat("deleted-", model.id, "-", model.email), model.email.type.length)
+    result = session.execute(update(model).where(model.id == item_id, model.deleted_at.is_(None)).values(**values))
+    return bool(result.rowcount)
+
+
+def _purge_in_batches(session: Session, table: str, batch_statement: Callable[[], int], total: int,
+                      on_progress: ProgressCallback) -> int:
+    """Runs a bounded delete statement repeatedly, committing after each batch, until no rows are left."""
+    done = 0
+    while True:
+        deleted = batch_statement()
+        session.commit()
+        if not deleted:
+            break
+        done += deleted
+        on_progress(table, done, total)
+    return done
+
+
+def _purge_project_children(session: Session, project_id: int, batch_size: int,
+                            on_progress: ProgressCallback) -> None:
+    """Removes the assignments and tasks of a project in bounded batches."""
+    sizes = project_cascade_size(session, project_id)
+    task_ids = select(Task.id).where(Task.project_id == project_id)
+
+    def delete_assignments() -> int:
+        batch = (select(AssigneeTask.assignee_id, AssigneeTask.task_id)
+                 .where(AssigneeTask.task_id.in_(task_ids)).limit(batch_size))
+        return int(session.execute(
+            delete(AssigneeTask).where(tuple_(AssigneeTask.assignee_id, AssigneeTask.task_id).in_(batch)),
+            execution_options={"synchronize_session": False}
+        ).rowcount)
+
+    def delete_tasks() -> int:
+        return int(session.execute(
+            delete(Task).where(Task.id.in_(task_ids.limit(batch_size))),
+            execution_options={"synchronize_session": False}
+        ).rowcount)
+
+    _purge_in_batches(session, "assignee_tasks", delete_assignments, sizes["assignee_tasks"], on_progress)
+    _purge_in_batches(session, "tasks", delete_tasks, sizes["tasks"], on_progress)
+
+
+def purge_project(session: Session, project_id: int, batch_size: int = PURGE_BATCH_SIZE,
+                  on_progress: ProgressCallback = print_progress) -> None:
+    """Removes a project marked as deleted together with its tasks and assignments in bounded batches.
+
+    Each batch runs in its own short transaction, so a project with a large number of tasks never holds locks for
+    the whole cascade and the app stays responsive while the purge runs.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the deletes.
+    project_id : int
+        The ID of the project to purge.
+    batch_size : int
+        The maximum number of rows removed per transaction.
+    on_progress : Callable[[str, int, int], None]
+        Called after each batch with the table name, rows removed so far and the counted total.
+    """
+    _purge_project_children(session, project_id, batch_size, on_progress)
+    session.execute(delete(Project).where(Project.id == project_id), execution_options={"synchronize_session": False})
+    session.commit()
+    on_progress("projects", 1, 1)
+
+
+def purge_manager(session: Session, manager_id: int, batch_size: int = PURGE_BATCH_SIZE,
+                  on_progress: ProgressCallback = print_progress) -> None:
+    """Removes a manager marked as deleted together with the managed project, its tasks and assignments.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the deletes.
+    manager_id : int
+        The ID of the manager to purge.
+    batch_size : int
+        The maximum number of rows removed per transaction.
+    on_progress : Callable[[str, int, int], None]
+        Called after each batch with the table name, rows removed so far and the counted total.
+    """
+    project_id = session.execute(select(Project.id).where(Project.manager_id == manager_id)).scalar()
+    if project_id is not None:
+        purge_project(session, project_id, batch_size, on_progress)
+    session.execute(delete(Manager).where(Manager.id == manager_id), execution_options={"synchronize_session": False})
+    session.commit()
+    on_progress("managers", 1, 1)
+
+
+def purge_assignee(session: Session, assignee_id: int, batch_size: int = PURGE_BATCH_SIZE,
+                   on_progress: ProgressCallback = print_progress) -> None:
+    """Removes an assignee marked as deleted together with the assignments in bounded batches.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the deletes.
+    assignee_id : int
+        The ID of the assignee to purge.
+    batch_size : int
+        The maximum number of rows removed per transaction.
+    on_progress : Callable[[str, int, int], None]
+        Called after each batch with the table name, rows removed so far and the counted total.
+    """
+    total = assignee_cascade_size(session, assignee_id)["assignee_tasks"]
+
+    def delete_assignments() -> int:
+        batch = (select(AssigneeTask.assignee_id, AssigneeTask.task_id)
+                 .where(AssigneeTask.assignee_id == assignee_id).limit(batch_size))
+        return int(session.execute(
+            delete(AssigneeTask).where(tuple_(AssigneeTask.assignee_id, AssigneeTask.task_id).in_(batch)),
+            execution_options={"synchronize_session": False}
+        ).rowcount)
+
+    _purge_in_batches(session, "assignee_tasks", delete_assignments, total, on_progress)
+    session.execute(delete(Assignee).where(Assignee.id == assignee_id),
+                    execution_options={"synchronize_session": False})
+    session.commit()
+    on_progress("assignees", 1, 1)
+
+
+def purge_all_deleted(session: Session, batch_size: int = PURGE_BATCH_SIZE,
+                      on_progress: ProgressCallback = print_progress) -> None:
+    """Purges every project, manager and assignee that is marked as deleted with the given session.
+
+    Errors are raised to the caller, so a job running the sweep is recorded as failed.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the deletes.
+    batch_size : int
+        The maximum number of rows removed per transaction.
+    on_progress : Callable[[str, int, int], None]
+        Called after each batch with the table name, rows removed so far and the counted total.
+    """
+    for project_id in session.execute(select(Project.id).where(Project.deleted_at.is_not(None))).scalars().all():
+        purge_project(session, project_id, batch_size, on_progress)
+    for manager_id in session.execute(select(Manager.id).where(Manager.deleted_at.is_not(None))).scalars().all():
+        purge_manager(session, manager_id, batch_size, on_progress)
+    for assignee_id in session.execute(select(Assignee.id).where(Assignee.deleted_at.is_not(None))).scalars().all():
+        purge_assignee(session, assignee_id, batch_size, on_progress)
+
+
+def purge_deleted(batch_size: int = PURGE_BATCH_SIZE, on_progress: ProgressCallback = print_progress) -> None:
+    """Purges every project, manager and assignee that is marked as deleted.
+
+    This sweep picks up rows whose background purge was interrupted, e.g. by a server restart, and can be run
+    periodically or by hand with `python -m src.purge`.
+
+    Parameters:
+    batch_size : int
+        The maximum number of rows removed per transaction.
+    on_progress : Callable[[str, int, int], None]
+        Called after each batch with the table name, rows removed so far and the counted total.
+    """
+    session = db_engine.get_session()
+    try:
+        purge_all_deleted(session, batch_size, on_progress)
+    except Exception as e:
+        session.rollback()
+        print(f"Error: {e}")
+    finally:
+        db_engine.close_session()
+
+
+if __name__ == "__main__":
+    purge_deleted()
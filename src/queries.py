@@ -0,0 +1,223 @@
+"""The Hot Read Statements, Built Once per Process, and the Hit Rate of the Compiled-Statement Cache.
+
+SQLAlchemy caches the SQL compiled for a statement under the statement's cache key, but a statement built anew on
+every rerun still pays for its construction and for computing that key, which for the larger ones costs more than
+the round trip to the database. The statements the pages and the dashboard run on every rerun are therefore built
+once, at import or on first use, with the values that change between calls as bound parameters, and the same
+objects are executed over and over; their cache keys are memoized on them, so each run goes straight to the
+compiled SQL. `compiled_cache_stats` counts how every statement sent by any engine of the process was compiled.
+On psycopg 3, `fetch_pipelined` sends several of them in one round trip.
+"""
+import functools
+import threading
+from collections import Counter
+from datetime import date
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import CompoundSelect, Date, DateTime, Engine, Integer, Select, bindparam, event, func, select, true
+from sqlalchemy.engine import Dialect, default
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.compiler import Compiled
+
+from src.base import TimeStampedModel
+from src.models import Assignee, AssigneeTask, Job, Manager, Project, TableChange, Task
+
+EPOCH = date(1970, 1, 1)
+
+CACHE_OUTCOMES = {
+    default.CACHE_HIT: "hit",
+    default.CACHE_MISS: "miss",
+    default.CACHING_DISABLED: "disabled",
+    default.NO_CACHE_KEY: "no cache key",
+    default.NO_DIALECT_SUPPORT: "no dialect support",
+}
+
+PROJECT_ROWS = (select(Project.id, Project.version, Project.project_name, Project.project_aim, Project.project_budget)
+                .where(Project.deleted_at.is_(None)).order_by(Project.id))
+PROJECT_ROWS_WITH_MANAGER = (PROJECT_ROWS.add_columns(Manager.firstname, Manager.lastname)
+                             .outerjoin(Manager, Project.manager_id == Manager.id))
+MANAGER_ROWS = (select(Manager.id, Manager.version, Manager.firstname, Manager.lastname, Manager.salary, Manager.email)
+                .where(Manager.deleted_at.is_(None)).order_by(Manager.id))
+MANAGER_ROWS_WITH_PROJECT = (MANAGER_ROWS.add_columns(Project.project_name)
+                             .outerjoin(Project, Project.manager_id == Manager.id))
+TASK_ROWS = (select(Task.id, Task.version, Task.task_name, Task.start_date, Task.due_date, Task.status, Task.project_id)
+             .join(Task.project).where(Project.deleted_at.is_(None)).order_by(Task.id))
+TASK_ROWS_WITH_PROJECT = TASK_ROWS.add_columns(Project.project_name)
+ASSIGNEE_ROWS = (select(Assignee.id, Assignee.version, Assignee.firstname, Assignee.lastname, Assignee.salary,
+                        Assignee.email)
+                 .where(Assignee.deleted_at.is_(None)).order_by(Assignee.id))
+ASSIGNMENT_NAMES = (select(AssigneeTask.assignee_id, Assignee.firstname, Assignee.lastname, AssigneeTask.task_id,
+                           Task.task_name)
+                    .join(Assignee, AssigneeTask.assignee_id == Assignee.id)
+                    .join(Task, AssigneeTask.task_id == Task.id)
+                    .order_by(AssigneeTask.id))
+
+OPEN_ASSIGNMENTS = (select(AssigneeTask.assignee_id, Task.id, Task.status, Task.start_date - EPOCH,
+                           Task.due_date - EPOCH)
+                    .join(Task, Task.id == AssigneeTask.task_id)
+                    .join(Project, Project.id == Task.project_id)
+                    .join(Assignee, Assignee.id == AssigneeTask.assignee_id)
+                    .where(Project.deleted_at.is_(None), Assignee.deleted_at.is_(None)))
+ASSIGNEE_SALARIES = (select(Assignee.id, Assignee.firstname + " " + Assignee.lastname, Assignee.salary)
+                     .where(Assignee.deleted_at.is_(None)).order_by(Assignee.id))
+
+_CUTOFF = bindparam("cutoff", type_=DateTime)
+DASHBOARD_PROJECTS = (select(func.count(), func.count().filter(Project.updated_at >= _CUTOFF))
+                      .where(Project.deleted_at.is_(None)))
+DASHBOARD_TASKS = (select(Task.status, func.count(), func.count().filter(Task.updated_at >= _CUTOFF))
+                   .join(Task.project).where(Project.deleted_at.is_(None)).group_by(Task.status))
+DASHBOARD_ASSIGNEES = (select(Assignee.id, Assignee.firstname, Assignee.lastname, func.count(AssigneeTask.id),
+                              Assignee.updated_at >= _CUTOFF)
+                       .outerjoin(AssigneeTask, AssigneeTask.assignee_id == Assignee.id)
+                       .where(Assignee.deleted_at.is_(None)).group_by(Assignee.id).order_by(Assignee.id))
+
+RECENT_JOBS = select(Job).order_by(Job.id.desc()).limit(bindparam("limit", type_=Integer))
+
+_WINDOW_START = bindparam("window_start", type_=Date)
+_WINDOW_END = bindparam("window_end", type_=Date)
+_LANE_IDS = bindparam("lane_ids", expanding=True)
+_LANE_PAGE = {"offset": bindparam("offset", type_=Integer), "limit": bindparam("limit", type_=Integer)}
+TIMELINE_EXTENT = (select(func.min(Task.start_date), func.max(Task.due_date))
+                   .join(Task.project).where(Project.deleted_at.is_(None)))
+TIMELINE_LANES = {
+    "project": (select(Project.id, Project.project_name, func.count().over())
+                .where(Project.deleted_at.is_(None)).order_by(Project.project_name, Project.id)
+                .offset(_LANE_PAGE["offset"]).limit(_LANE_PAGE["limit"])),
+    "assignee": (select(Assignee.id, Assignee.firstname + " " + Assignee.lastname, func.count().over())
+                 .where(Assignee.deleted_at.is_(None)).order_by(Assignee.lastname, Assignee.firstname, Assignee.id)
+                 .offset(_LANE_PAGE["offset"]).limit(_LANE_PAGE["limit"])),
+}
+
+
+def _timeline_tasks(lane: Any) -> Select:
+    """Selects the lane and tasks of the lanes in `lane_ids` that overlap the window."""
+    statement = select(lane).select_from(Task)
+    if lane is not Task.project_id:
+        statement = statement.join(AssigneeTask, AssigneeTask.task_id == Task.id)
+    return (statement.join(Project, Project.id == Task.project_id)
+            .where(lane.in_(_LANE_IDS), Project.deleted_at.is_(None), Task.start_date <= _WINDOW_END,
+                   Task.due_date >= _WINDOW_START))
+
+
+def _timeline_buckets(lane: Any) -> Select:
+    """Counts the tasks of each lane active in each bucket of `bucket_days` days from the window's start.
+
+    Every task is expanded to the buckets its start-to-due span overlaps, clipped to the `buckets` buckets of the
+    window, so the database returns at most one row per lane and bucket however many tasks there are.
+    """
+    bucket_days = bindparam("bucket_days", type_=Integer)
+    first = func.greatest((Task.start_date - _WINDOW_START) // bucket_days, 0)
+    last = func.least((Task.due_date - _WINDOW_START) // bucket_days, bindparam("buckets", type_=Integer) - 1)
+    bucket = func.generate_series(first, last).table_valued("bucket").render_derived("buckets")
+    tasks = _timeline_tasks(lane)
+    return (tasks.add_columns(bucket.c.bucket, func.count()).join(bucket, true())
+            .group_by(lane, bucket.c.bucket).order_by(lane, bucket.c.bucket))
+
+
+TIMELINE_TASKS = {
+    kind: _timeline_tasks(lane).add_columns(Task.task_name, Task.start_date, Task.due_date, Task.status)
+    .order_by(lane, Task.start_date, Task.id).limit(bindparam("limit", type_=Integer))
+    for kind, lane in (("project", Task.project_id), ("assignee", AssigneeTask.assignee_id))
+}
+TIMELINE_BUCKETS = {kind: _timeline_buckets(lane)
+                    for kind, lane in (("project", Task.project_id), ("assignee", AssigneeTask.assignee_id))}
+
+
+@functools.cache
+def stamps_statement(models: tuple[type[TimeStampedModel], ...]) -> Select:
+    """Returns the statement reading the change counts of the tables of `models`, built once per combination.
+
+    Returns: Select: The name and change count of each of the tables that changed since the counters were installed.
+    """
+    return (select(TableChange.table_name, TableChange.changes)
+            .where(TableChange.table_name.in_([model.__tablename__ for model in models])))
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled(statement: Select | CompoundSelect, dialect: Dialect) -> Compiled:
+    return statement.compile(dialect=dialect)
+
+
+def fetch_pipelined(session: Session, statements: Sequence[Select | CompoundSelect]) -> list[list[tuple[Any, ...]]]:
+    """Runs independent statements and returns the rows of each, in one round trip on psycopg 3.
+
+    On psycopg 3 the statements are sent in pipeline mode on the session's connection and transaction, and the
+    client waits for the results of all of them at once instead of for each in turn. Their SQL is compiled once
+    per statement and dialect and the cursor is driven directly, so the statements must be prebuilt and select
+    only columns that need no result processing. The `before_cursor_execute` listeners still see every
+    statement, without an execution context, so `compiled_cache_stats` does not count them. On other drivers
+    the statements are executed one after the other through the session.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session the statements are run in.
+    statements : Sequence[Select | CompoundSelect]
+        Statements without parameters, none of which depends on the results of another.
+
+    Returns: list[list[tuple]]: The rows of each statement, in the order of `statements`.
+    """
+    connection = session.connection()
+    if connection.dialect.driver != "psycopg":
+        return [[tuple(row) for row in session.execute(statement)] for statement in statements]
+    driver_connection = connection.connection.driver_connection
+    cursors = [driver_connection.cursor() for _ in statements]
+    with driver_connection.pipeline():
+        for cursor, statement in zip(cursors, statements):
+            compiled = _compiled(statement, connection.dialect)
+            connection.dispatch.before_cursor_execute(connection, cursor, compiled.string, compiled.params, None,
+                                                      False)
+            cursor.execute(compiled.string, compiled.params)
+    results = [cursor.fetchall() for cursor in cursors]
+    for cursor in cursors:
+        cursor.close()
+    return results
+
+
+class CompiledCacheStats:
+    """Counts the statements sent to the database by how their SQL was obtained from the compiled cache.
+
+    A "hit" reused SQL compiled earlier in the process and a "miss" compiled it; "no cache key" statements, such as
+    DDL or text with values pasted in, are compiled every time. A steady hit rate below 1 after warm-up means some
+    statement embeds changing values instead of bound parameters.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counts: Counter = Counter()
+
+    def record(self, outcome: str) -> None:
+        """Counts one executed statement."""
+        with self.lock:
+            self.counts[outcome] += 1
+
+    def snapshot(self) -> dict[str, int]:
+        """Returns the number of statements per outcome counted so far."""
+        with self.lock:
+            return dict(self.counts)
+
+    def reset(self) -> None:
+        """Starts counting from zero."""
+        with self.lock:
+            self.counts.clear()
+
+    def hit_rate(self, since: Optional[dict[str, int]] = None) -> Optional[float]:
+        """Returns the share of statements whose compiled SQL was reused, None before any statement ran.
+
+        Parameters:
+        since : dict[str, int], optional
+            An earlier `snapshot()`; only the statements counted after it are considered.
+        """
+        counts = Counter(self.snapshot())
+        counts.subtract(since or {})
+        total = sum(counts.values())
+        return counts["hit"] / total if total else None
+
+
+compiled_cache_stats = CompiledCacheStats()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_cache_outcome(connection: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                         executemany: bool) -> None:
+    if context is not None:
+        compiled_cache_stats.record(CACHE_OUTCOMES.get(context.cache_hit, "no cache key"))
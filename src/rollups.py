@@ -0,0 +1,117 @@
+"""Per-Project Labour Cost Rollups Against the Budget, Computed in SQL and Cached Until a Row Changes."""
+import functools
+import threading
+from typing import Optional
+
+import pandas as pd
+from sqlalchemy import select, func, Select
+from sqlalchemy.orm import Session
+
+from src.change_stamps import TableStamp, table_stamps
+from src.models import Project, Manager, Task, Assignee, AssigneeTask
+
+DAYS_PER_YEAR = 365
+ROLLUP_MODELS = (Project, Manager, Task, Assignee, AssigneeTask)
+PORTFOLIO_COLUMNS = ["id", "Project", "Manager", "Tasks", "Budget", "Manager cost", "Assignee cost", "Labour cost",
+                     "Remaining", "Budget used", "Cost rank"]
+
+_cache: Optional[tuple[dict[str, TableStamp], pd.DataFrame]] = None
+_cache_lock = threading.Lock()
+
+
+@functools.cache
+def portfolio_statement() -> Select:
+    """Builds the statement that rolls the labour cost of every visible project up against its budget.
+
+    The manager is paid over the project's span, from its first task's start to its last task's due date. Each
+    assignee is paid over their own active span, from the start of their first task to the due date of their last
+    one across all projects, and that cost is shared out over their tasks in proportion to the tasks' durations.
+    An assignee working on overlapping tasks is therefore never paid twice for the same day. Salaries are yearly
+    and both ends of a span count as working days.
+
+    Window functions partitioned by assignee give every assignment its assignee's booked and active days in one
+    scan, `GROUP BY` sums the shares per project, and a final window ranks the projects by the share of the
+    budget used.
+
+    The statement is built once per process and the same object is returned on every call, so its compiled SQL
+    is found in the compiled cache without building the statement and its cache key again.
+
+    Returns: Select: A statement returning the columns of `PORTFOLIO_COLUMNS`, one row per project.
+    """
+    days = Task.due_date - Task.start_date + 1
+    per_assignee = {"partition_by": AssigneeTask.assignee_id}
+    assignment = (
+        select(Task.project_id, Assignee.salary, days.label("days"),
+               func.sum(days).over(**per_assignee).label("booked_days"),
+               (func.max(Task.due_date).over(**per_assignee) - func.min(Task.start_date).over(**per_assignee) + 1)
+               .label("active_days"))
+        .join_from(AssigneeTask, Task, Task.id == AssigneeTask.task_id)
+        .join(Assignee, Assignee.id == AssigneeTask.assignee_id)
+        .join(Project, Project.id == Task.project_id)
+        .where(Project.deleted_at.is_(None), Assignee.deleted_at.is_(None))
+    ).cte("assignment")
+    labour = (
+        select(assignment.c.project_id,
+               func.sum(assignment.c.salary * assignment.c.active_days * assignment.c.days
+                        / (DAYS_PER_YEAR * assignment.c.booked_days)).label("cost"))
+        .group_by(assignment.c.project_id)
+    ).cte("labour")
+    span = (
+        select(Task.project_id, func.count().label("tasks"),
+               (func.max(Task.due_date) - func.min(Task.start_date) + 1).label("days"))
+        .group_by(Task.project_id)
+    ).cte("span")
+    manager_cost = Manager.salary * func.coalesce(span.c.days, 0) / DAYS_PER_YEAR
+    assignee_cost = func.coalesce(labour.c.cost, 0.0)
+    labour_cost = manager_cost + assignee_cost
+    budget_used = labour_cost / func.nullif(Project.project_budget, 0)
+    return (
+        select(Project.id, Project.project_name, Manager.firstname + " " + Manager.lastname,
+               func.coalesce(span.c.tasks, 0), Project.project_budget, manager_cost, assignee_cost, labour_cost,
+               Project.project_budget - labour_cost, budget_used,
+               func.rank().over(order_by=budget_used.desc().nulls_last()))
+        .join(Manager, Manager.id == Project.manager_id)
+        .outerjoin(span, span.c.project_id == Project.id)
+        .outerjoin(labour, labour.c.project_id == Project.id)
+        .where(Project.deleted_at.is_(None))
+        .order_by(Project.id)
+    )
+
+
+def portfolio(session: Session) -> pd.DataFrame:
+    """Reads the labour cost rollup of every visible project.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+
+    Returns: pd.DataFrame: One row per project with the columns of `PORTFOLIO_COLUMNS`.
+    """
+    return pd.DataFrame(session.execute(portfolio_statement()).all(), columns=PORTFOLIO_COLUMNS)
+
+
+def cached_portfolio(session: Session, stamps: Optional[dict[str, TableStamp]] = None) -> pd.DataFrame:
+    """Returns the labour cost rollup, recomputing it only after a row of an underlying table changed.
+
+    The change stamps of the projects, managers, tasks, assignees and assignments are read in one round trip
+    before the rollup, so a change landing in between is picked up by the next call instead of being
+    hidden behind fresh stamps. The cache is shared by all sessions of the process; do not modify the frame.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    stamps : dict[str, TableStamp], optional
+        The stamps of the tables of `ROLLUP_MODELS` when the caller already read them for another cache.
+
+    Returns: pd.DataFrame: The output of `portfolio`.
+    """
+    global _cache
+    if stamps is None:
+        stamps = table_stamps(session, ROLLUP_MODELS)
+    with _cache_lock:
+        if _cache is not None and _cache[0] == stamps:
+            return _cache[1]
+    rollup = portfolio(session)
+    with _cache_lock:
+        _cache = (stamps, rollup)
+    return rollup
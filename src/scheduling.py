@@ -0,0 +1,413 @@
+"""Critical-Path Scheduling of a Project's Tasks With Incremental Slip Propagation.
+
+The incremental updates live on the in-memory `Schedule`. `load_schedule()` rebuilds a project's graph from the
+database, which is one pass over the project's tasks. A `ScheduleCache` keeps the schedules of the projects a user
+works with between reruns, and `reschedule_task()` and `add_dependency()` move a cached schedule along with the
+change they store instead of rebuilding it.
+"""
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from src.change_stamps import table_stamps
+from src.concurrency import compare_and_swap
+from src.models import Task, TaskDependency
+
+SCHEDULE_MODELS = (Task, TaskDependency)
+PENDING_KEY = "schedule_changes"
+
+
+@dataclass(frozen=True)
+class TaskSchedule:
+    """The computed dates of one task.
+
+    Attributes:
+    task_id : int
+        The ID of the task.
+    earliest_start : date
+        The planned start date, pushed back to the latest due date of the tasks it depends on.
+    earliest_finish : date
+        The earliest start plus the task's planned duration.
+    latest_start : date
+        The latest start that does not delay the end of the project.
+    latest_finish : date
+        The latest start plus the task's planned duration.
+    slack : int
+        The days the task can slip without delaying the end of the project.
+    critical : bool
+        Whether the task has no slack, so it is on the critical path.
+    """
+    task_id: int
+    earliest_start: date
+    earliest_finish: date
+    latest_start: date
+    latest_finish: date
+    slack: int
+    critical: bool
+
+
+class Schedule:
+    """The dependency graph of a project's tasks with their earliest and latest dates.
+
+    Every task keeps its planned duration, the days between its start and due dates, and cannot start before its
+    planned start date or before the tasks it depends on are due. The earliest start comes out of one forward
+    pass in topological order. Instead of latest dates the schedule keeps each task's tail, the longest chain of
+    durations from the task's start to the end of the project. Latest dates then follow from the project's end,
+    so a change that moves the end does not touch the tails.
+
+    A change to a task only recomputes the earliest starts of its descendants and the tails of its ancestors, in
+    topological order with a heap, and stops following a path as soon as a value no longer changes. A slip in a
+    project with tens of thousands of tasks therefore costs as much as the part of the graph it actually moves.
+    The changes are made to this object only; they are neither read from nor written to the database.
+
+    Dates are kept as proleptic Gregorian ordinals, so the passes add and compare integers.
+
+    Parameters:
+    tasks : Iterable[tuple[int, date, date]]
+        The `(task_id, start_date, due_date)` of every task of the project.
+    dependencies : Iterable[tuple[int, int]]
+        The `(task_id, depends_on_id)` pairs between those tasks.
+
+    Raises:
+    ValueError: If a dependency names an unknown task or the dependencies form a cycle.
+    """
+
+    def __init__(self, tasks: Iterable[tuple[int, date, date]], dependencies: Iterable[tuple[int, int]]) -> None:
+        self.release: dict[int, int] = {}
+        self.duration: dict[int, int] = {}
+        for task_id, start_date, due_date in tasks:
+            self._set_dates(task_id, start_date, due_date)
+        self.predecessors: dict[int, set[int]] = {task_id: set() for task_id in self.release}
+        self.successors: dict[int, set[int]] = {task_id: set() for task_id in self.release}
+        for task_id, depends_on_id in dependencies:
+            if task_id not in self.release or depends_on_id not in self.release:
+                raise ValueError(f"Task {task_id} or {depends_on_id} is not part of the project.")
+            self.predecessors[task_id].add(depends_on_id)
+            self.successors[depends_on_id].add(task_id)
+        self.rank: dict[int, int] = {}
+        self._order()
+        self.earliest_start: dict[int, int] = {}
+        self.tail: dict[int, int] = {}
+        order = sorted(self.rank, key=self.rank.__getitem__)
+        for task_id in order:
+            self.earliest_start[task_id] = self._earliest_start(task_id)
+        for task_id in reversed(order):
+            self.tail[task_id] = self._tail(task_id)
+        self._end: Optional[int] = None
+
+    def _set_dates(self, task_id: int, start_date: date, due_date: date) -> None:
+        self.release[task_id] = start_date.toordinal()
+        self.duration[task_id] = max(due_date.toordinal() - start_date.toordinal(), 0)
+
+    def _order(self) -> None:
+        """Ranks the tasks in topological order with Kahn's algorithm.
+
+        Raises:
+        ValueError: If the dependencies form a cycle.
+        """
+        waiting = {task_id: len(predecessors) for task_id, predecessors in self.predecessors.items()}
+        ready = deque(task_id for task_id, count in waiting.items() if count == 0)
+        rank: dict[int, int] = {}
+        while ready:
+            task_id = ready.popleft()
+            rank[task_id] = len(rank)
+            for successor in self.successors[task_id]:
+                waiting[successor] -= 1
+                if waiting[successor] == 0:
+                    ready.append(successor)
+        if len(rank) < len(waiting):
+            raise ValueError("The task dependencies form a cycle.")
+        self.rank = rank
+
+    def _earliest_start(self, task_id: int) -> int:
+        return max([self.release[task_id]] + [self.earliest_start[predecessor] + self.duration[predecessor]
+                                              for predecessor in self.predecessors[task_id]])
+
+    def _tail(self, task_id: int) -> int:
+        return self.duration[task_id] + max([0] + [self.tail[successor] for successor in self.successors[task_id]])
+
+    def _propagate(self, sources: Iterable[int], downstream: bool) -> set[int]:
+        """Recomputes the earliest starts below or the tails above the given tasks, in topological order.
+
+        The sources are always recomputed and their neighbours followed, because their own duration or edges may
+        have changed; any other task is only followed further when its value changed.
+
+        Returns: set[int]: The tasks whose value changed.
+        """
+        values, compute = (self.earliest_start, self._earliest_start) if downstream else (self.tail, self._tail)
+        neighbours = self.successors if downstream else self.predecessors
+        sign = 1 if downstream else -1
+        forced = set(sources)
+        heap = [(sign * self.rank[task_id], task_id) for task_id in forced]
+        heapq.heapify(heap)
+        queued = set(forced)
+        changed = set()
+        while heap:
+            _, task_id = heapq.heappop(heap)
+            queued.discard(task_id)
+            value = compute(task_id)
+            if value != values[task_id]:
+                values[task_id] = value
+                changed.add(task_id)
+            elif task_id not in forced:
+                continue
+            for neighbour in neighbours[task_id]:
+                if neighbour not in queued:
+                    queued.add(neighbour)
+                    heapq.heappush(heap, (sign * self.rank[neighbour], neighbour))
+        self._end = None
+        return changed
+
+    def update_task(self, task_id: int, start_date: date, due_date: date) -> set[int]:
+        """Changes the planned dates of a task and propagates the slip.
+
+        Returns: set[int]: The tasks whose earliest start moved, including the task itself when its planned start
+        date decides it.
+        """
+        self._set_dates(task_id, start_date, due_date)
+        moved = self._propagate([task_id], downstream=True)
+        self._propagate([task_id], downstream=False)
+        return moved
+
+    def _reaches(self, source: int, target: int) -> bool:
+        """Tells whether `target` depends on `source` directly or indirectly.
+
+        Only tasks ranked at most as high as the target are visited, because no path from them leads to it.
+        """
+        limit = self.rank[target]
+        stack, seen = [source], {source}
+        while stack:
+            task_id = stack.pop()
+            if task_id == target:
+                return True
+            for successor in self.successors[task_id]:
+                if successor not in seen and self.rank[successor] <= limit:
+                    seen.add(successor)
+                    stack.append(successor)
+        return False
+
+    def add_dependency(self, task_id: int, depends_on_id: int) -> set[int]:
+        """Makes a task depend on another one and propagates the slip.
+
+        Returns: set[int]: The tasks whose earliest start moved.
+
+        Raises:
+        ValueError: If either task is not part of the project or the dependency would close a cycle.
+        """
+        if task_id not in self.release or depends_on_id not in self.release:
+            raise ValueError(f"Task {task_id} or {depends_on_id} is not part of the project.")
+        if task_id == depends_on_id or self._reaches(task_id, depends_on_id):
+            raise ValueError(f"Task {depends_on_id} already depends on task {task_id}.")
+        self.predecessors[task_id].add(depends_on_id)
+        self.successors[depends_on_id].add(task_id)
+        if self.rank[depends_on_id] > self.rank[task_id]:
+            self._order()
+        moved = self._propagate([task_id], downstream=True)
+        self._propagate([depends_on_id], downstream=False)
+        return moved
+
+    def remove_dependency(self, task_id: int, depends_on_id: int) -> set[int]:
+        """Removes a dependency and lets the dependent task move up again.
+
+        Returns: set[int]: The tasks whose earliest start moved.
+        """
+        self.predecessors[task_id].discard(depends_on_id)
+        self.successors[depends_on_id].discard(task_id)
+        moved = self._propagate([task_id], downstream=True)
+        self._propagate([depends_on_id], downstream=False)
+        return moved
+
+    @property
+    def end(self) -> int:
+        """The ordinal of the day the last task finishes at the earliest, or 0 for a project without tasks."""
+        if self._end is None:
+            self._end = max((start + self.duration[task_id] for task_id, start in self.earliest_start.items()),
+                            default=0)
+        return self._end
+
+    def task_schedule(self, task_id: int) -> TaskSchedule:
+        """Returns the computed dates of one task."""
+        earliest_start = self.earliest_start[task_id]
+        latest_start = self.end - self.tail[task_id]
+        duration = self.duration[task_id]
+        return TaskSchedule(task_id, date.fromordinal(earliest_start), date.fromordinal(earliest_start + duration),
+                            date.fromordinal(latest_start), date.fromordinal(latest_start + duration),
+                            latest_start - earliest_start, latest_start == earliest_start)
+
+    def tasks(self) -> list[TaskSchedule]:
+        """Returns the computed dates of every task, by earliest start."""
+        return sorted((self.task_schedule(task_id) for task_id in self.rank),
+                      key=lambda item: (item.earliest_start, self.rank[item.task_id]))
+
+    def critical_path(self) -> list[int]:
+        """Returns the IDs of the tasks without slack, by earliest start."""
+        return [item.task_id for item in self.tasks() if item.critical]
+
+
+def load_schedule(session: Session, project_id: int) -> Schedule:
+    """Reads the tasks of a project and their dependencies and schedules them.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    project_id : int
+        The ID of the project to schedule.
+
+    Returns: Schedule: The schedule of the project's tasks.
+    """
+    task_ids = select(Task.id).where(Task.project_id == project_id)
+    tasks = session.execute(
+        select(Task.id, Task.start_date, Task.due_date).where(Task.project_id == project_id)).all()
+    dependencies = session.execute(
+        select(TaskDependency.task_id, TaskDependency.depends_on_id).where(TaskDependency.task_id.in_(task_ids))
+    ).all()
+    return Schedule(tasks, dependencies)
+
+
+class ScheduleCache:
+    """The schedules of the projects one user works with, kept between reruns and moved along by their own edits.
+
+    The cached schedules are valid for the change counts of the tasks and task dependencies they were loaded at, and
+    are dropped as soon as the counts move. An edit made with `reschedule_task()` or `add_dependency()` is applied to
+    the cached schedule incrementally; when its transaction commits, the counts the cache is valid for move on by
+    that one commit, so the schedules outlive it and only a commit of another writer makes them load again. A rolled
+    back edit drops them. The cache serves one user at a time and is not thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Optional[tuple[int, ...]] = None
+        self.schedules: dict[int, Schedule] = {}
+
+    def schedule(self, session: Session, project_id: int) -> Schedule:
+        """Returns the schedule of a project, loading it only if it is not cached or another writer changed it.
+
+        Parameters:
+        session : sqlalchemy.orm.session.Session
+            The SQLAlchemy session used for querying the database.
+        project_id : int
+            The ID of the project.
+
+        Returns: Schedule: The project's schedule. Change it only through `reschedule_task` and `add_dependency`.
+        """
+        stamps = table_stamps(session, SCHEDULE_MODELS)
+        counts = tuple(stamps[model.__tablename__].changes for model in SCHEDULE_MODELS)
+        if counts != self.counts:
+            self.clear()
+            self.counts = counts
+        schedule = self.schedules.get(project_id)
+        if schedule is None:
+            schedule = self.schedules[project_id] = load_schedule(session, project_id)
+        return schedule
+
+    def clear(self) -> None:
+        """Drops every cached schedule."""
+        self.counts = None
+        self.schedules = {}
+
+    def track(self, session: Session, model: type[Task] | type[TaskDependency]) -> None:
+        """Remembers that the session's transaction writes to the table of `model` and changes the cached schedules.
+
+        Call it before the cached schedule is changed, so that a failing write drops the change again.
+        """
+        session.info.setdefault(PENDING_KEY, {}).setdefault(self, set()).add(model.__tablename__)
+
+    def committed(self, tables: set[str]) -> None:
+        """Moves the counts the cache is valid for on by one commit that wrote to `tables`."""
+        if self.counts is not None:
+            self.counts = tuple(count + (model.__tablename__ in tables)
+                                for model, count in zip(SCHEDULE_MODELS, self.counts))
+
+
+@event.listens_for(Session, "after_commit")
+def _advance_schedules(session: Session) -> None:
+    for cache, tables in session.info.pop(PENDING_KEY, {}).items():
+        cache.committed(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_schedules(session: Session) -> None:
+    for cache in session.info.pop(PENDING_KEY, {}):
+        cache.clear()
+
+
+def _project_schedule(session: Session, task_id: int, schedules: Optional[ScheduleCache]) -> Optional[Schedule]:
+    """Returns the schedule of the project a task belongs to, from the cache if one is given."""
+    project_id = session.execute(select(Task.project_id).where(Task.id == task_id)).scalar()
+    if project_id is None:
+        return None
+    if schedules is None:
+        return load_schedule(session, project_id)
+    return schedules.schedule(session, project_id)
+
+
+def reschedule_task(session: Session, task_id: int, expected_version: int, start_date: date, due_date: date,
+                    schedules: Optional[ScheduleCache] = None) -> Optional[Schedule]:
+    """Stores new planned dates of a task and propagates the slip through the project's schedule.
+
+    The dates are written with a compare-and-swap on the task's version, like the other edit forms.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the update. The caller is responsible for committing.
+    task_id : int
+        The ID of the task.
+    expected_version : int
+        The version of the task the editor based the change on.
+    start_date : date
+        The new planned start date.
+    due_date : date
+        The new due date.
+    schedules : ScheduleCache, optional
+        The cache whose schedule of the project is updated incrementally. Without it the schedule is loaded anew.
+
+    Returns: Schedule | None: The project's schedule with the new dates, or None if the task does not exist or was
+    changed by someone else in the meantime.
+    """
+    schedule = _project_schedule(session, task_id, schedules)
+    if schedule is None:
+        return None
+    if schedules is not None:
+        schedules.track(session, Task)
+    if not compare_and_swap(session, Task, task_id, expected_version,
+                            {"start_date": start_date, "due_date": due_date}):
+        return None
+    schedule.update_task(task_id, start_date, due_date)
+    return schedule
+
+
+def add_dependency(session: Session, task_id: int, depends_on_id: int,
+                   schedules: Optional[ScheduleCache] = None) -> Optional[Schedule]:
+    """Stores a dependency after checking it against the project's schedule.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the insert. The caller is responsible for committing.
+    task_id : int
+        The ID of the dependent task.
+    depends_on_id : int
+        The ID of the task that has to finish first.
+    schedules : ScheduleCache, optional
+        The cache whose schedule of the project is updated incrementally. Without it the schedule is loaded anew,
+        which costs a full rebuild of the project's graph.
+
+    Returns: Schedule | None: The project's schedule including the new dependency, or None if the task does not
+    exist.
+
+    Raises:
+    ValueError: If the tasks belong to different projects or the dependency would close a cycle.
+    """
+    schedule = _project_schedule(session, task_id, schedules)
+    if schedule is None:
+        return None
+    if schedules is not None:
+        schedules.track(session, TaskDependency)
+    schedule.add_dependency(task_id, depends_on_id)
+    session.execute(pg_insert(TaskDependency).values(task_id=task_id, depends_on_id=depends_on_id)
+                    .on_conflict_do_nothing(index_elements=[TaskDependency.task_id, TaskDependency.depends_on_id]))
+    return schedule
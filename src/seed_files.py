@@ -0,0 +1,157 @@
+"""Streams Seed Data From JSON Lines Files: `python -m src.seed_files load projects.jsonl.gz --workers 4`."""
+import argparse
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, IO, Iterable, Iterator, Optional
+
+from src.db_seed import seed_database, seed_database_parallel
+from src.dummy_data import generate_projects
+
+PROJECT_FIELDS = ("project_name", "project_aim", "project_budget", "manager", "tasks")
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open_text(path: str | Path, mode: str) -> IO[str]:
+    """Opens a plain or gzip compressed text file; compressed files are detected by their magic bytes on read."""
+    path = Path(path)
+    if mode == "r":
+        with path.open("rb") as probe:
+            compressed = probe.read(2) == GZIP_MAGIC
+    else:
+        compressed = path.suffix == ".gz"
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+def iter_seed_file(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yields the project records of a JSON Lines seed file one line at a time.
+
+    Each non-blank line holds one project in the format of `projects_list_full`, so only the current record is kept
+    in memory however large the file is. Gzip compressed files are read transparently.
+
+    Parameters:
+    path : str | Path
+        The path of a `.jsonl` or `.jsonl.gz` file.
+
+    Returns: Iterator[dict[str, Any]]: The project records in file order.
+
+    Raises:
+    ValueError: If a line is not valid JSON or misses one of the project fields.
+    """
+    with _open_text(path, "r") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e.msg}") from e
+            missing = [field for field in PROJECT_FIELDS if field not in record]
+            if missing:
+                raise ValueError(f"{path}:{line_number}: missing fields: {', '.join(missing)}")
+            yield record
+
+
+def write_seed_file(path: str | Path, projects_data: Iterable[dict[str, Any]]) -> int:
+    """Writes project records to a JSON Lines seed file, gzip compressed if the path ends with `.gz`.
+
+    Parameters:
+    path : str | Path
+        The path of the file to write.
+    projects_data : Iterable[dict[str, Any]]
+        The project records, in the format of `projects_list_full`, as a list or a generator.
+
+    Returns: int: The number of records written.
+    """
+    written = 0
+    with _open_text(path, "w") as file:
+        for project_data in projects_data:
+            file.write(json.dumps(project_data, default=str) + "\n")
+            written += 1
+    return written
+
+
+class TimedIterator(Iterator[dict[str, Any]]):
+    """Wraps an iterator and measures the time spent producing its items, i.e. reading and parsing the file."""
+
+    def __init__(self, items: Iterable[dict[str, Any]]) -> None:
+        self._items = iter(items)
+        self.count = 0
+        self.seconds = 0.0
+
+    def __next__(self) -> dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            item = next(self._items)
+        finally:
+            self.seconds += time.perf_counter() - started
+        self.count += 1
+        return item
+
+
+def load_seed_file(path: str | Path, workers: Optional[int] = None,
+                   on_progress: Optional[Callable[[int, int], None]] = None) -> dict[str, float]:
+    """Seeds the database from a JSON Lines file, streaming the records straight into the seeding pipeline.
+
+    Records are parsed lazily while the seeding consumes them, so the parse time is measured on the reading side
+    and the rest of the elapsed time is reported as insert time.
+
+    Parameters:
+    path : str | Path
+        The path of a `.jsonl` or `.jsonl.gz` file.
+    workers : int, optional
+        Seeds with `seed_database_parallel()` using this many worker processes. Seeds serially when omitted.
+    on_progress : Callable[[int, int], None], optional
+        Passed to `seed_database()` for serial loads.
+
+    Returns: dict[str, float]: The number of records, parse and insert seconds and records per second of each.
+    """
+    records = TimedIterator(iter_seed_file(path))
+    started = time.perf_counter()
+    if workers:
+        seed_database_parallel(records, workers=workers)
+    else:
+        seed_database(records, on_progress=on_progress)
+    elapsed = time.perf_counter() - started
+    insert_seconds = max(elapsed - records.seconds, 0.0)
+    report = {
+        "records": records.count,
+        "parse_seconds": records.seconds,
+        "insert_seconds": insert_seconds,
+        "parse_per_second": records.count / records.seconds if records.seconds else 0.0,
+        "insert_per_second": records.count / insert_seconds if insert_seconds else 0.0,
+    }
+    print(f"Loaded {records.count} projects from {path}: parsing {report['parse_seconds']:.1f}s "
+          f"({report['parse_per_second']:.0f} records/s), inserting {insert_seconds:.1f}s "
+          f"({report['insert_per_second']:.0f} records/s).")
+    return report
+
+
+def main() -> None:
+    """Loads a seed file into the database or exports a generated dataset to a seed file."""
+    parser = argparse.ArgumentParser(description="Load or export JSON Lines seed files.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("load", help="Seed the database from a .jsonl or .jsonl.gz file.")
+    load.add_argument("path")
+    load.add_argument("--workers", type=int, help="Seed in parallel with this many worker processes.")
+    export = commands.add_parser("export", help="Write a generated dataset to a seed file.")
+    export.add_argument("path")
+    export.add_argument("--projects", type=int, default=1000)
+    export.add_argument("--tasks", type=int, default=20, help="Tasks per project.")
+    export.add_argument("--assignees", type=int, default=500, help="Size of the assignee pool.")
+    export.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "load":
+        load_seed_file(args.path, workers=args.workers)
+    else:
+        written = write_seed_file(args.path, generate_projects(args.projects, args.tasks, args.assignees,
+                                                               seed=args.seed))
+        print(f"Wrote {written} projects to {args.path}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Task Timeline per Project or Assignee, Downsampled to Weekly Buckets in the Database When Zoomed Out."""
+import math
+from datetime import date, timedelta
+from typing import NamedTuple, Optional
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from src.queries import TIMELINE_BUCKETS, TIMELINE_EXTENT, TIMELINE_LANES, TIMELINE_TASKS
+
+LANE_KINDS = ("project", "assignee")
+MAX_MARKS = 2000
+LANES_PER_PAGE = 40
+DAYS_PER_WEEK = 7
+TASK_COLUMNS = ["lane", "task", "start", "end", "status"]
+BUCKET_COLUMNS = ["lane", "start", "end", "tasks"]
+
+
+class Timeline(NamedTuple):
+    """The marks of one page of timeline lanes within a date window.
+
+    Attributes:
+    lanes : tuple[str, ...]
+        The labels of the lanes on the page, in display order.
+    lane_count : int
+        The number of lanes on all pages.
+    bucket_days : int
+        The width of the buckets the tasks were counted in, or 0 when the marks are single tasks.
+    marks : pd.DataFrame
+        With single tasks, the columns of `TASK_COLUMNS`, "end" being the due date. Otherwise the columns of
+        `BUCKET_COLUMNS`: the number of tasks of a lane active during each bucket, "end" being the first day after it.
+    """
+    lanes: tuple[str, ...]
+    lane_count: int
+    bucket_days: int
+    marks: pd.DataFrame
+
+
+def timeline_extent(session: Session) -> Optional[tuple[date, date]]:
+    """Returns the first start and the last due date of the visible tasks, or None without tasks."""
+    first, last = session.execute(TIMELINE_EXTENT).one()
+    return None if first is None else (first, last)
+
+
+def bucket_days(lanes: int, window: tuple[date, date], max_marks: int = MAX_MARKS) -> int:
+    """Returns the narrowest whole number of weeks per bucket that keeps `lanes` lanes within `max_marks` marks.
+
+    Returns: int: The bucket width in days, a multiple of seven.
+    """
+    weeks = math.ceil(((window[1] - window[0]).days + 1) / DAYS_PER_WEEK)
+    return DAYS_PER_WEEK * max(1, math.ceil(lanes * weeks / max_marks))
+
+
+def load_timeline(session: Session, kind: str, window: tuple[date, date], page: int = 0,
+                  lanes_per_page: int = LANES_PER_PAGE, max_marks: int = MAX_MARKS) -> Timeline:
+    """Reads the marks of a page of lanes within a window, single tasks if they fit and weekly buckets otherwise.
+
+    The lanes are the visible projects by name, or the visible assignees by name, in pages of `lanes_per_page`. The
+    tasks of the page overlapping the window are read first, at most `max_marks` plus one of them. If there are
+    more, the window is zoomed out too far to draw every task, and the database counts the active tasks per lane
+    and bucket instead, with buckets of whole weeks wide enough for `max_marks` marks. Either way the rerun reads
+    at most `max_marks` task rows or bucket rows, however many tasks the portfolio holds. A task with several
+    assignees appears in the lane of each of them.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    kind : str
+        "project" or "assignee", see `LANE_KINDS`.
+    window : tuple[date, date]
+        The first and the last day shown.
+    page : int
+        The page of lanes, starting with 0.
+    lanes_per_page : int
+        The number of lanes per page.
+    max_marks : int
+        The most marks the timeline may hold.
+
+    Returns: Timeline: The lanes of the page and their marks.
+
+    Raises:
+    ValueError: If `kind` is not one of `LANE_KINDS`.
+    """
+    if kind not in LANE_KINDS:
+        raise ValueError(f"Unknown lane kind '{kind}', expected one of: {', '.join(LANE_KINDS)}")
+    lanes = session.execute(TIMELINE_LANES[kind], {"offset": page * lanes_per_page, "limit": lanes_per_page}).all()
+    if not lanes:
+        return Timeline((), 0, 0, pd.DataFrame(columns=TASK_COLUMNS))
+    labels = {lane_id: label for lane_id, label, _ in lanes}
+    parameters = {"lane_ids": list(labels), "window_start": window[0], "window_end": window[1]}
+    tasks = session.execute(TIMELINE_TASKS[kind], {**parameters, "limit": max_marks + 1}).all()
+    if len(tasks) <= max_marks:
+        marks = pd.DataFrame(tasks, columns=["lane", *TASK_COLUMNS[1:]])
+        marks["lane"] = marks["lane"].map(labels)
+        return Timeline(tuple(labels.values()), lanes[0][2], 0, marks)
+
+    days = bucket_days(len(labels), window, max_marks)
+    buckets = math.ceil(((window[1] - window[0]).days + 1) / days)
+    counts = pd.DataFrame(session.execute(TIMELINE_BUCKETS[kind],
+                                          {**parameters, "bucket_days": days, "buckets": buckets}).all(),
+                          columns=["lane", "bucket", "tasks"])
+    starts = pd.Timestamp(window[0]) + pd.to_timedelta(counts["bucket"] * days, unit="D")
+    marks = pd.DataFrame({"lane": counts["lane"].map(labels), "start": starts,
+                          "end": starts + timedelta(days=days), "tasks": counts["tasks"]}, columns=BUCKET_COLUMNS)
+    return Timeline(tuple(labels.values()), lanes[0][2], days, marks)
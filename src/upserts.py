@@ -0,0 +1,164 @@
+"""Upsert-Based Write Layer for People, Projects and Task Assignments."""
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import select, literal, union_all, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.types import Integer
+from sqlalchemy.orm import Session
+
+from src.models import Project, Manager, Assignee, AssigneeTask
+
+PERSON_FIELDS = ("firstname", "lastname", "salary", "email")
+UPSERT_BATCH_SIZE = 1000
+
+
+def _person_values(person_data: dict[str, Any]) -> dict[str, Any]:
+    """Picks the person columns out of a seed or form record."""
+    return {field: person_data[field] for field in PERSON_FIELDS}
+
+
+def insert_person(session: Session, model: type[Manager] | type[Assignee],
+                  person_data: dict[str, Any]) -> Optional[int]:
+    """Inserts a manager or an assignee unless a person with the same email already exists.
+
+    The statement is an `INSERT ... ON CONFLICT (email) DO NOTHING RETURNING id`, so a duplicate or racing
+    submission costs one round trip and never aborts the surrounding transaction.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the insert. The caller is responsible for committing.
+    model : type
+        Either `Manager` or `Assignee`.
+    person_data : dict[str, Any]
+        A record with `firstname`, `lastname`, `salary` and `email` keys.
+
+    Returns: int | None: The ID of the new person, or None if the email was already taken.
+    """
+    return session.execute(
+        pg_insert(model).values(**_person_values(person_data))
+        .on_conflict_do_nothing(index_elements=[model.email])
+        .returning(model.id)
+    ).scalar()
+
+
+def upsert_people(session: Session, model: type[Manager] | type[Assignee],
+                  people_data: Iterable[dict[str, Any]]) -> dict[str, int]:
+    """Resolves a batch of managers or assignees to IDs, inserting the ones that do not exist yet.
+
+    People are sent as multi-row `INSERT ... ON CONFLICT (email) DO NOTHING RETURNING id, email` statements of
+    up to `UPSERT_BATCH_SIZE` rows, followed by one `SELECT` of the emails that already existed. Existing rows are
+    neither rewritten nor locked, so concurrent seeders inserting assignments for the same people never deadlock
+    on them, and existing people keep their stored details.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the upsert. The caller is responsible for committing.
+    model : type
+        Either `Manager` or `Assignee`.
+    people_data : Iterable[dict[str, Any]]
+        Records with `firstname`, `lastname`, `salary` and `email` keys. Duplicated emails are sent once.
+
+    Returns: dict[str, int]: A mapping of email to person ID.
+    """
+    unique_people = list({person["email"]: _person_values(person) for person in people_data}.values())
+    people_ids: dict[str, int] = {}
+    for start in range(0, len(unique_people), UPSERT_BATCH_SIZE):
+        batch = unique_people[start:start + UPSERT_BATCH_SIZE]
+        statement = pg_insert(model).values(batch).on_conflict_do_nothing(
+            index_elements=[model.email]).returning(model.id, model.email)
+        people_ids.update({email: person_id for person_id, email in session.execute(statement).all()})
+        existing = [person["email"] for person in batch if person["email"] not in people_ids]
+        if existing:
+            people_ids.update({email: person_id for person_id, email in session.execute(
+                select(model.id, model.email).where(model.email.in_(existing))).all()})
+    return people_ids
+
+
+def create_project_with_manager(session: Session, project_data: dict[str, Any],
+                                manager_data: dict[str, Any]) -> Optional[int]:
+    """Creates a project together with its manager in a single statement.
+
+    The manager is inserted by email in a data-modifying CTE, `ON CONFLICT DO NOTHING`, and combined with the ID
+    of an existing manager with that email; the result feeds the project insert, so the pair is written in one
+    round trip and one transaction without rewriting or locking an existing manager row. A manager can run only
+    one project; if the manager already has a project, the insert does nothing instead of raising an
+    `IntegrityError`.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the insert. The caller is responsible for committing.
+    project_data : dict[str, Any]
+        A record with `project_name`, `project_aim` and `project_budget` keys.
+    manager_data : dict[str, Any]
+        A record with `firstname`, `lastname`, `salary` and `email` keys.
+
+    Returns: int | None: The ID of the new project, or None if the manager already runs a project.
+    """
+    new_manager = pg_insert(Manager).values(**_person_values(manager_data)).on_conflict_do_nothing(
+        index_elements=[Manager.email]).returning(Manager.id).cte("new_manager")
+    manager = union_all(
+        select(new_manager.c.id), select(Manager.id).where(Manager.email == manager_data["email"])
+    ).cte("manager")
+    # The column defaults are selected explicitly, otherwise both inserts would render clashing default parameters.
+    project = pg_insert(Project).from_select(
+        [Project.project_name, Project.project_aim, Project.project_budget, Project.manager_id, Project.created_at,
+         Project.version],
+        select(literal(project_data["project_name"]), literal(project_data["project_aim"]),
+               literal(project_data["project_budget"]), manager.c.id, literal(datetime.now()), literal(1))
+    ).on_conflict_do_nothing(index_elements=[Project.manager_id]).returning(Project.id)
+    return session.execute(project).scalar()
+
+
+def assign_tasks(session: Session, assignments: Iterable[tuple[int, int]]) -> int:
+    """Assigns tasks to assignees, skipping assignments that already exist.
+
+    Assignments are inserted with `INSERT ... ON CONFLICT (assignee_id, task_id) DO NOTHING` in multi-row batches,
+    so duplicate or racing submissions neither raise an `IntegrityError` nor roll the transaction back.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the insert. The caller is responsible for committing.
+    assignments : Iterable[tuple[int, int]]
+        Pairs of `(assignee_id, task_id)`.
+
+    Returns: int: The number of new assignments.
+    """
+    rows = [{"assignee_id": assignee_id, "task_id": task_id} for assignee_id, task_id in dict.fromkeys(assignments)]
+    inserted = 0
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        inserted += session.execute(
+            pg_insert(AssigneeTask).values(rows[start:start + UPSERT_BATCH_SIZE])
+            .on_conflict_do_nothing(index_elements=[AssigneeTask.assignee_id, AssigneeTask.task_id])
+        ).rowcount
+    return inserted
+
+
+def bulk_assign_tasks(session: Session, assignments: Iterable[tuple[int, int]]) -> int:
+    """Assigns any number of tasks in a single statement, skipping assignments that already exist.
+
+    The pairs are sent as two integer arrays and unnested by `INSERT ... SELECT FROM unnest(...)`, so the statement
+    has four parameters however many rows it writes, and is not split into batches by the driver's parameter
+    limit like the multi-row `VALUES` of `assign_tasks`.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for the insert. The caller is responsible for committing.
+    assignments : Iterable[tuple[int, int]]
+        Pairs of `(assignee_id, task_id)`.
+
+    Returns: int: The number of new assignments.
+    """
+    pairs = list(dict.fromkeys(assignments))
+    if not pairs:
+        return 0
+    rows = func.unnest(literal([assignee_id for assignee_id, _ in pairs], ARRAY(Integer)),
+                       literal([task_id for _, task_id in pairs], ARRAY(Integer))
+                       ).table_valued("assignee_id", "task_id").render_derived("assignment")
+    return session.execute(
+        pg_insert(AssigneeTask).from_select(
+            [AssigneeTask.assignee_id, AssigneeTask.task_id, AssigneeTask.created_at, AssigneeTask.version],
+            select(rows.c.assignee_id, rows.c.task_id, literal(datetime.now()), literal(1)))
+        .on_conflict_do_nothing(index_elements=[AssigneeTask.assignee_id, AssigneeTask.task_id])
+    ).rowcount
@@ -0,0 +1,187 @@
+"""Read-Only Rows for the Pages, Loaded Column by Column Instead of as ORM Instances."""
+import threading
+from datetime import date
+from typing import NamedTuple, Optional
+
+from sqlalchemy.orm import Session
+
+from src.change_stamps import TableStamp, table_stamps
+from src.models import Assignee, AssigneeTask, Manager, Project, Task
+from src.queries import (ASSIGNEE_ROWS, ASSIGNMENT_NAMES, MANAGER_ROWS, MANAGER_ROWS_WITH_PROJECT, PROJECT_ROWS,
+                         PROJECT_ROWS_WITH_MANAGER, TASK_ROWS, TASK_ROWS_WITH_PROJECT, fetch_pipelined)
+
+VIEW_MODELS = (Project, Manager, Task, Assignee, AssigneeTask)
+
+_cache: dict[bool, tuple[dict[str, TableStamp], "Views"]] = {}
+_cache_lock = threading.Lock()
+
+
+class PersonRef(NamedTuple):
+    """The name of a manager or an assignee another row refers to."""
+    firstname: str
+    lastname: str
+
+
+class ProjectRef(NamedTuple):
+    """The name of the project a manager or a task refers to."""
+    project_name: str
+
+
+class TaskRef(NamedTuple):
+    """The name of a task a project or an assignee refers to."""
+    task_name: str
+
+
+class ProjectView(NamedTuple):
+    """A project as the pages display it. `manager` and `tasks` are only filled by `load_views(related=True)`."""
+    id: int
+    version: int
+    project_name: str
+    project_aim: str
+    project_budget: float
+    manager: Optional[PersonRef] = None
+    tasks: tuple[TaskRef, ...] = ()
+
+
+class ManagerView(NamedTuple):
+    """A manager as the pages display it. `project` is only filled by `load_views(related=True)`."""
+    id: int
+    version: int
+    firstname: str
+    lastname: str
+    salary: float
+    email: str
+    project: Optional[ProjectRef] = None
+
+
+class TaskView(NamedTuple):
+    """A task as the pages display it. `project` and `assignees` are only filled by `load_views(related=True)`."""
+    id: int
+    version: int
+    task_name: str
+    start_date: date
+    due_date: date
+    status: str
+    project_id: int
+    project: Optional[ProjectRef] = None
+    assignees: tuple[PersonRef, ...] = ()
+
+
+class AssigneeView(NamedTuple):
+    """An assignee as the pages display it. `tasks` is only filled by `load_views(related=True)`."""
+    id: int
+    version: int
+    firstname: str
+    lastname: str
+    salary: float
+    email: str
+    tasks: tuple[TaskRef, ...] = ()
+
+
+class Views(NamedTuple):
+    """The visible projects, managers, tasks and assignees, each ordered by ID."""
+    projects: tuple[ProjectView, ...]
+    managers: tuple[ManagerView, ...]
+    tasks: tuple[TaskView, ...]
+    assignees: tuple[AssigneeView, ...]
+
+
+def load_views(session: Session, related: bool = False) -> Views:
+    """Reads the visible projects, managers, tasks and assignees as read-only rows.
+
+    The views carry the attributes the pages read from the models under the same names, so `make_*_list`,
+    `find_*_id`, `find_version` and the `*_to_df` builders accept them in place of ORM instances. Only the
+    displayed columns are selected, by the prebuilt statements of `src.queries`, and no instance enters the
+    session's identity map. The rows are immutable tuples without a reference to the session, so they can be kept
+    across reruns and shared between sessions.
+
+    Without `related`, every list is one query. With it, the names of the related rows are joined in and the
+    assignments are read in one more query, five in total; a name several rows refer to is stored once. As with
+    the relationships of the models, the related rows are not filtered by their own deletion. The queries are
+    independent, so `fetch_pipelined` sends them in one round trip on psycopg 3.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    related : bool
+        Whether to fill the managers, projects, tasks and assignees the rows refer to.
+
+    Returns: Views: The rows, each list ordered by ID.
+    """
+    if not related:
+        project_rows, manager_rows, task_rows, assignee_rows = fetch_pipelined(
+            session, (PROJECT_ROWS, MANAGER_ROWS, TASK_ROWS, ASSIGNEE_ROWS))
+        return Views(
+            projects=tuple(ProjectView(*row) for row in project_rows),
+            managers=tuple(ManagerView(*row) for row in manager_rows),
+            tasks=tuple(TaskView(*row) for row in task_rows),
+            assignees=tuple(AssigneeView(*row) for row in assignee_rows),
+        )
+
+    assignment_rows, task_rows, project_rows, manager_rows, assignee_rows = fetch_pipelined(
+        session, (ASSIGNMENT_NAMES, TASK_ROWS_WITH_PROJECT, PROJECT_ROWS_WITH_MANAGER, MANAGER_ROWS_WITH_PROJECT,
+                  ASSIGNEE_ROWS))
+    persons: dict[tuple[str, str], PersonRef] = {}
+    project_refs: dict[str, ProjectRef] = {}
+    task_refs: dict[int, TaskRef] = {}
+    task_assignees: dict[int, list[PersonRef]] = {}
+    assignee_tasks: dict[int, list[TaskRef]] = {}
+    for assignee_id, firstname, lastname, task_id, task_name in assignment_rows:
+        person = persons.setdefault((firstname, lastname), PersonRef(firstname, lastname))
+        task = task_refs.setdefault(task_id, TaskRef(task_name))
+        task_assignees.setdefault(task_id, []).append(person)
+        assignee_tasks.setdefault(assignee_id, []).append(task)
+
+    tasks = []
+    project_tasks: dict[int, list[TaskRef]] = {}
+    for *values, project_name in task_rows:
+        task = TaskView(*values, project=project_refs.setdefault(project_name, ProjectRef(project_name)),
+                        assignees=tuple(task_assignees.get(values[0], ())))
+        tasks.append(task)
+        project_tasks.setdefault(task.project_id, []).append(task_refs.setdefault(task.id, TaskRef(task.task_name)))
+    projects = []
+    for *values, firstname, lastname in project_rows:
+        manager = None if firstname is None else persons.setdefault((firstname, lastname),
+                                                                    PersonRef(firstname, lastname))
+        projects.append(ProjectView(*values, manager=manager, tasks=tuple(project_tasks.get(values[0], ()))))
+    managers = []
+    for *values, project_name in manager_rows:
+        project = None if project_name is None else project_refs.setdefault(project_name, ProjectRef(project_name))
+        managers.append(ManagerView(*values, project=project))
+    return Views(
+        projects=tuple(projects),
+        managers=tuple(managers),
+        tasks=tuple(tasks),
+        assignees=tuple(AssigneeView(*row, tasks=tuple(assignee_tasks.get(row[0], ())))
+                        for row in assignee_rows),
+    )
+
+
+def cached_views(session: Session, related: bool = False,
+                 stamps: Optional[dict[str, TableStamp]] = None) -> Views:
+    """Returns the output of `load_views`, reading the rows again only after a row of their tables changed.
+
+    The change stamps of the tables of `VIEW_MODELS` are read in one round trip before the rows, so a
+    change landing in between is picked up by the next call instead of being hidden behind fresh stamps. The
+    views are shared by all sessions of the process, which is safe because they are immutable.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+    related : bool
+        Whether to fill the related rows, see `load_views`.
+    stamps : dict[str, TableStamp], optional
+        The stamps of the tables of `VIEW_MODELS` when the caller already read them for another cache.
+
+    Returns: Views: The rows, each list ordered by ID.
+    """
+    if stamps is None:
+        stamps = table_stamps(session, VIEW_MODELS)
+    with _cache_lock:
+        cached = _cache.get(related)
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+    views = load_views(session, related)
+    with _cache_lock:
+        _cache[related] = (stamps, views)
+    return views
@@ -0,0 +1,106 @@
+"""Runs Queued Jobs in an Independent Worker Process: `python -m src.worker --concurrency 2`."""
+import argparse
+import os
+import socket
+import threading
+import time
+
+from src.base import db_engine
+from src.jobs import claim_next_job, run_job, requeue_stale_jobs
+
+DEFAULT_CONCURRENCY = 2
+DEFAULT_POLL_INTERVAL = 2.0
+REQUEUE_INTERVAL = 60.0
+
+
+def work(worker: str, stop: threading.Event, poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+    """Claims and runs jobs one at a time until the stop event is set.
+
+    Each worker thread uses its own thread-scoped session, so the number of threads bounds both the number of jobs
+    running at once and the number of connections the worker holds. While the queue is empty, the worker also puts
+    back the jobs of workers that died, at most once every `REQUEUE_INTERVAL` seconds, so that their jobs do not stay
+    running until some worker restarts.
+
+    Parameters:
+    worker : str
+        The name recorded on the jobs this worker claims.
+    stop : threading.Event
+        Set to make the worker exit after the job it is currently running.
+    poll_interval : float
+        Seconds to wait before polling again when the queue is empty.
+    """
+    session = db_engine.get_session()
+    last_requeue = time.monotonic()
+    try:
+        while not stop.is_set():
+            try:
+                job = claim_next_job(session, worker)
+            except Exception as e:
+                session.rollback()
+                print(f"Error: {e}")
+                job = None
+            if job is None:
+                if time.monotonic() - last_requeue >= REQUEUE_INTERVAL:
+                    last_requeue = time.monotonic()
+                    try:
+                        requeued = requeue_stale_jobs(session)
+                    except Exception as e:
+                        session.rollback()
+                        print(f"Error: {e}")
+                        requeued = 0
+                    if requeued:
+                        print(f"{worker} re-queued {requeued} stale jobs.")
+                        continue
+                stop.wait(poll_interval)
+                continue
+            print(f"{worker} started job {job.id} ({job.kind}).")
+            run_job(session, job)
+            print(f"{worker} finished job {job.id}.")
+    finally:
+        db_engine.close_session()
+
+
+def main() -> None:
+    """Starts a bounded pool of worker threads and runs until interrupted.
+
+    Stale running jobs left behind by a worker that died are put back into the queue on start-up and, while the
+    queue is empty, periodically by the worker threads. The worker stops on Ctrl+C after the jobs currently
+    running have finished.
+    """
+    parser = argparse.ArgumentParser(description="Run queued background jobs.")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Maximum number of jobs run at the same time.")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL,
+                        help="Seconds between polls when the queue is empty.")
+    args = parser.parse_args()
+
+    session = db_engine.get_session()
+    try:
+        requeued = requeue_stale_jobs(session)
+        if requeued:
+            print(f"Re-queued {requeued} stale jobs.")
+    finally:
+        db_engine.close_session()
+
+    stop = threading.Event()
+    name = f"{socket.gethostname()}:{os.getpid()}"
+    threads = [
+        threading.Thread(target=work, args=(f"{name}/{number}", stop, args.poll_interval), name=f"worker-{number}")
+        for number in range(max(1, args.concurrency))
+    ]
+    for thread in threads:
+        thread.start()
+    print(f"Worker {name} is running {len(threads)} job slots. Press Ctrl+C to stop.")
+    try:
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=1.0)
+    except KeyboardInterrupt:
+        print("Stopping after the running jobs finish...")
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+if __name__ == "__main__":
+    main()
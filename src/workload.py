@@ -0,0 +1,96 @@
+"""Columnar Workload Analytics per Assignee."""
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from src.queries import ASSIGNEE_SALARIES, OPEN_ASSIGNMENTS
+
+OPEN_STATUSES = {"not_started": "Not started", "in_progres": "In progress"}
+UPCOMING_WEEKS = 4
+DAYS_PER_YEAR = 365
+ASSIGNMENT_COLUMNS = ["assignee_id", "task_id", "status", "start_date", "due_date"]
+
+
+def load_assignments(session: Session) -> pd.DataFrame:
+    """Reads every assignment of a visible task to a visible assignee in one query.
+
+    Rows are fetched as plain tuples without ORM instances. The dates are sent as days since the Unix epoch, which
+    turns into `datetime64[D]` columns with one cast instead of converting a Python `date` object per row.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The SQLAlchemy session used for querying the database.
+
+    Returns: pd.DataFrame: One row per assignment with the columns of `ASSIGNMENT_COLUMNS`.
+    """
+    rows = session.execute(OPEN_ASSIGNMENTS).all()
+    assignments = pd.DataFrame(rows, columns=ASSIGNMENT_COLUMNS)
+    for column in ("start_date", "due_date"):
+        assignments[column] = assignments[column].to_numpy(dtype=np.int64).astype("datetime64[D]")
+    return assignments
+
+
+def load_assignees(session: Session) -> pd.DataFrame:
+    """Reads the ID, full name and salary of every visible assignee.
+
+    Returns: pd.DataFrame: The "Full name" and "Salary" columns, indexed by assignee ID.
+    """
+    rows = session.execute(ASSIGNEE_SALARIES).all()
+    return pd.DataFrame(rows, columns=["id", "Full name", "Salary"]).set_index("id")
+
+
+def workload(assignments: pd.DataFrame, assignees: pd.DataFrame, today: Optional[date] = None,
+             weeks: int = UPCOMING_WEEKS) -> pd.DataFrame:
+    """Summarizes the open work of every assignee with vectorized grouping.
+
+    A task is open until its status is "done" and overdue when it is open and its due date has passed. The
+    upcoming load counts open tasks due in each of the next `weeks` weeks, the first week starting today. The
+    booked days add up the start-to-due span of the open tasks, counting both ends, and the estimated cost prices
+    them at the assignee's salary per day. Overlapping tasks are each booked in full, so the cost is an upper bound.
+
+    Every assignment is mapped to its assignee's row once with `Index.get_indexer`, and all counts are
+    `np.bincount` calls over those row numbers, so the work grows linearly with the assignments without a Python
+    loop over them.
+
+    Parameters:
+    assignments : pd.DataFrame
+        The output of `load_assignments`.
+    assignees : pd.DataFrame
+        The output of `load_assignees`. Assignees without assignments get rows of zeros; assignments of assignees
+        missing here are ignored.
+    today : date, optional
+        The reference date of the overdue and upcoming counts, today by default.
+    weeks : int
+        The number of upcoming weeks to count due tasks for.
+
+    Returns: pd.DataFrame: One row per assignee with the columns "Full name", "Salary", the open statuses, "Open",
+    "Overdue", "Week 1" to "Week N", "Booked days" and "Estimated cost", indexed by assignee ID.
+    """
+    today64 = np.datetime64(today or date.today(), "D")
+    size = len(assignees)
+    codes = assignees.index.get_indexer(assignments["assignee_id"].to_numpy())
+    status = assignments["status"].to_numpy()
+    start = assignments["start_date"].to_numpy(dtype="datetime64[D]")
+    due = assignments["due_date"].to_numpy(dtype="datetime64[D]")
+    is_open = (codes >= 0) & (status != "done")
+
+    def count(mask: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        return np.bincount(codes[mask], None if weights is None else weights[mask], minlength=size)
+
+    summary = assignees.loc[:, ["Full name", "Salary"]].copy()
+    for value, label in OPEN_STATUSES.items():
+        summary[label] = count(is_open & (status == value))
+    summary["Open"] = count(is_open)
+    summary["Overdue"] = count(is_open & (due < today64))
+    week = (due - today64).astype(np.int64) // 7
+    upcoming = is_open & (week >= 0) & (week < weeks)
+    load = np.bincount(codes[upcoming] * weeks + week[upcoming], minlength=size * weeks).reshape(size, weeks)
+    for number in range(weeks):
+        summary[f"Week {number + 1}"] = load[:, number]
+    booked_days = count(is_open, np.maximum((due - start).astype(np.int64), 0) + 1.0).astype(np.int64)
+    summary["Booked days"] = booked_days
+    summary["Estimated cost"] = (booked_days * summary["Salary"].to_numpy() / DAYS_PER_YEAR).round(2)
+    return summary
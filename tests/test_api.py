@@ -0,0 +1,122 @@
+"""Read-only JSON API tests."""
+import json
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Iterator
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from tornado.testing import AsyncHTTPTestCase
+from tornado.web import Application
+
+from src.api import make_app, MAX_LIMIT
+from src.base import Model
+from src.models import Project, Manager, Task
+
+
+class TestAPI(AsyncHTTPTestCase):
+    """Runs the API against an in-memory SQLite database with two projects and three tasks."""
+
+    def get_app(self) -> Application:
+        """Creates the database, seeds it and builds the application served to the tests.
+
+        Returns: tornado.web.Application: The API application, reading through sessions of the in-memory database.
+        """
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        # SQLite cannot autoincrement the composite key of assignee_tasks, which the API does not serve.
+        Model.metadata.create_all(self.engine, tables=[Manager.__table__, Project.__table__, Task.__table__])
+        with Session(self.engine) as session:
+            for number in (1, 2):
+                session.add(Project(project_name=f"Project {number}", project_aim="Aim", project_budget=1000 * number,
+                                    manager=Manager(firstname="Ann", lastname="Lee", salary=100,
+                                                    email=f"ann{number}@example.com"),
+                                    tasks=[Task(task_name=f"Task {number}.{task}", start_date=date(2024, 1, 1),
+                                                due_date=date(2024, 2, 1), status="not_started")
+                                           for task in range(1, number + 1)]))
+            session.commit()
+
+        @contextmanager
+        def unit_of_work() -> Iterator[Session]:
+            with Session(self.engine) as session, session.begin():
+                yield session
+
+        return make_app(unit_of_work)
+
+    def get_json(self, url: str, **kwargs: object) -> dict:
+        """Fetches a URL of the API, checks that it answered `200 OK` and decodes the body.
+
+        Parameters:
+        url : str
+            The path and query string to fetch.
+        **kwargs : object
+            Further arguments of `fetch`, such as headers.
+
+        Returns: dict: The decoded JSON body.
+        """
+        response = self.fetch(url, **kwargs)
+        self.assertEqual(response.code, 200, response.body)
+        return json.loads(response.body)
+
+    def test_keyset_pagination_walks_all_rows(self) -> None:
+        """Tests that following the `next` key of each page returns every row once, in ID order.
+
+        Returns: None : This test function does not return any value. It asserts the rows of both pages.
+        """
+        first = self.get_json("/api/tasks?limit=2&fields=task_name")
+        self.assertEqual(first["data"], [{"id": 1, "task_name": "Task 1.1"}, {"id": 2, "task_name": "Task 2.1"}])
+        last = self.get_json(f"/api/tasks?limit=2&fields=task_name&after={first['next']}")
+        self.assertEqual(last, {"data": [{"id": 3, "task_name": "Task 2.2"}], "next": None})
+
+    def test_filters_and_serializes_dates(self) -> None:
+        """Tests that the project filter selects the project's tasks and that dates are sent in ISO format.
+
+        Returns: None : This test function does not return any value. It asserts the returned rows.
+        """
+        page = self.get_json("/api/tasks?project_id=2&fields=due_date")
+        self.assertEqual(page["data"], [{"id": 2, "due_date": "2024-02-01"}, {"id": 3, "due_date": "2024-02-01"}])
+
+    def test_soft_deleted_rows_are_hidden(self) -> None:
+        """Tests that a soft-deleted project and the tasks of that project are left out of the lists.
+
+        Returns: None : This test function does not return any value. It asserts the IDs of the listed rows.
+        """
+        with Session(self.engine) as session, session.begin():
+            session.execute(update(Project).where(Project.id == 2).values(deleted_at=datetime.now()))
+        self.assertEqual([row["id"] for row in self.get_json("/api/projects")["data"]], [1])
+        self.assertEqual([row["id"] for row in self.get_json("/api/tasks")["data"]], [1])
+
+    def test_invalid_arguments_are_rejected(self) -> None:
+        """Tests that unknown fields, a too large limit and a malformed `after` key are answered with `400`.
+
+        Returns: None : This test function does not return any value. It asserts the status and the error body.
+        """
+        for url in ("/api/projects?fields=salary", f"/api/projects?limit={MAX_LIMIT + 1}", "/api/tasks?after=x"):
+            response = self.fetch(url)
+            self.assertEqual(response.code, 400, url)
+            self.assertIn("error", json.loads(response.body))
+
+    def test_etag_answers_304_until_the_table_changes(self) -> None:
+        """Tests that a matching `If-None-Match` is answered with `304` until a table the list reads changes.
+
+        Returns: None : This test function does not return any value. It asserts the status codes and entity tags.
+        """
+        etag = self.fetch("/api/tasks").headers["Etag"]
+        unchanged = self.fetch("/api/tasks", headers={"If-None-Match": etag})
+        self.assertEqual((unchanged.code, unchanged.body), (304, b""))
+        self.assertNotEqual(self.fetch("/api/tasks?limit=1").headers["Etag"], etag)
+        with Session(self.engine) as session, session.begin():
+            session.execute(update(Project).where(Project.id == 2).values(project_budget=1))
+        self.assertEqual(self.fetch("/api/tasks", headers={"If-None-Match": etag}).code, 200)
+
+    def test_responses_are_compressed(self) -> None:
+        """Tests that a response large enough to be compressed is sent gzip encoded to a client accepting it.
+
+        Returns: None : This test function does not return any value. It asserts the content encoding.
+        """
+        # Tornado leaves bodies under a kilobyte uncompressed.
+        with Session(self.engine) as session, session.begin():
+            session.add_all(Manager(firstname="Bob", lastname="Ray", salary=100, email=f"bob{number}@example.com")
+                            for number in range(20))
+        response = self.fetch("/api/managers", headers={"Accept-Encoding": "gzip"}, decompress_response=False)
+        self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
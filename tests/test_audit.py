@@ -0,0 +1,113 @@
+"""Audit log tests."""
+import os
+import threading
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+import src.audit
+from src.audit import AuditWriter, enable_audit, entity_history, write_events
+from src.base import Model, db_engine
+from src.concurrency import compare_and_swap
+from src.models import AuditEvent, Manager, Project, Task
+
+
+def test_committed_changes_are_logged_and_rolled_back_ones_discarded() -> None:
+    """Tests that flushed instances and ORM-enabled updates are logged once the transaction commits, and only then.
+
+    Returns: None : This test function does not return any value. It asserts the events handed to the writer.
+    """
+    engine = create_engine("sqlite://")
+    Model.metadata.create_all(engine, tables=[Manager.__table__, Project.__table__, Task.__table__])
+    batches: list[list[dict]] = []
+    writer = AuditWriter(write=batches.append, flush_interval=60)
+    with patch.object(src.audit, "audit_writer", writer), Session(engine) as session:
+        enable_audit(session, "ann@example.com")
+        project = Project(project_name="Audit", project_aim="Aim", project_budget=1000,
+                          manager=Manager(firstname="Ann", lastname="Lee", salary=100, email="ann@example.com"))
+        session.add(project)
+        session.flush()
+        project_id, manager_id = project.id, project.manager_id
+        assert compare_and_swap(session, Project, project_id, project.version, {"project_budget": 2000})
+        session.commit()
+        session.add(Task(task_name="Discarded", start_date=date(2024, 1, 1), due_date=date(2024, 1, 2),
+                         status="not_started", project_id=project_id))
+        session.flush()
+        session.rollback()
+        assert writer.flush() == 3
+    events = [(item["entity"], item["entity_id"], item["action"], item["changes"]) for item in batches[0]]
+    assert ("projects", project_id, "update", {"project_budget": 2000}) in events
+    assert ("managers", manager_id, "insert",
+            {"firstname": "Ann", "lastname": "Lee", "salary": 100, "email": "ann@example.com"}) in events
+    assert {item["action"] for item in batches[0] if item["entity"] == "projects"} == {"insert", "update"}
+    assert all(item["actor"] == "ann@example.com" for item in batches[0])
+    assert len(batches) == 1
+
+
+def test_writer_retries_failed_batches_and_flushes_full_ones() -> None:
+    """Tests that a failed write keeps its events and that a full batch is written without waiting for the interval.
+
+    Returns: None : This test function does not return any value. It asserts the written batches.
+    """
+    attempts: list[list[dict]] = []
+    written = threading.Event()
+
+    def write(batch: list[dict]) -> None:
+        attempts.append(batch)
+        if len(attempts) == 1:
+            raise RuntimeError("database unreachable")
+        written.set()
+
+    writer = AuditWriter(write=write, flush_interval=60, batch_size=3)
+    writer.buffer.extend([{"entity_id": 1}])
+    assert writer.flush() == 0
+    assert writer.buffer == [{"entity_id": 1}]
+    writer.put([{"entity_id": 2}, {"entity_id": 3}])
+    assert written.wait(5)
+    assert attempts[-1] == [{"entity_id": 1}, {"entity_id": 2}, {"entity_id": 3}]
+    assert writer.buffer == []
+
+
+def test_writer_drops_the_oldest_events_while_writes_fail() -> None:
+    """Tests that the buffer stays within `max_buffered` while the database is unreachable and keeps the newest events.
+
+    Returns: None : This test function does not return any value. It asserts the buffer and the dropped count.
+    """
+    def write(batch: list[dict]) -> None:
+        raise RuntimeError("database unreachable")
+
+    writer = AuditWriter(write=write, flush_interval=60, batch_size=100, max_buffered=3)
+    writer.put([{"entity_id": number} for number in range(5)])
+    assert writer.buffer == [{"entity_id": 2}, {"entity_id": 3}, {"entity_id": 4}]
+    writer.buffer.append({"entity_id": 5})
+    assert writer.flush() == 0
+    assert writer.buffer == [{"entity_id": 3}, {"entity_id": 4}, {"entity_id": 5}]
+    assert writer.dropped == 3
+    writer.buffer.clear()
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_events_land_in_monthly_partitions() -> None:
+    """Tests that writing events creates the partitions of their months and that the history of a row is read back.
+
+    The table is created in a transaction that is rolled back at the end.
+
+    Returns: None : This test function does not return any value. It asserts the partitions and the history.
+    """
+    events = [{"occurred_at": occurred_at, "actor": "test", "entity": "projects", "entity_id": 1, "action": "update",
+               "changes": {"project_budget": budget}}
+              for occurred_at, budget in ((datetime(2023, 12, 31, 23), 1), (datetime(2024, 1, 1, 1), 2))]
+    with db_engine.engine.connect() as connection, connection.begin() as transaction:
+        AuditEvent.__table__.create(connection, checkfirst=True)
+        write_events(connection, events)
+        partitions = connection.exec_driver_sql(
+            "SELECT tableoid::regclass::text FROM audit_events WHERE actor = 'test' ORDER BY occurred_at").scalars()
+        assert list(partitions) == ["audit_events_2023_12", "audit_events_2024_01"]
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        history = entity_history(session, "projects", 1, since=datetime(2024, 1, 1))
+        assert [item.changes for item in history if item.actor == "test"] == [{"project_budget": 2}]
+        assert session.execute(select(AuditEvent.id).where(AuditEvent.actor == "test")).all()
+        session.close()
+        transaction.rollback()
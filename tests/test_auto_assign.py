@@ -0,0 +1,102 @@
+"""Auto-assignment tests."""
+import os
+import threading
+from collections import Counter
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from src.auto_assign import auto_assign_project, balance
+from src.base import db_engine
+from src.models import Assignee, AssigneeTask, Manager, Project, Task
+
+DAY = date(2024, 1, 1)
+
+
+def day(offset: int) -> date:
+    """Returns the date `offset` days after the first of January 2024."""
+    return DAY + timedelta(days=offset)
+
+
+def test_balance_prefers_the_least_loaded_free_assignee() -> None:
+    """Tests that a task goes to a free assignee before a busy one, and to the least loaded of the free ones.
+
+    Returns: None : This test function does not return any value. It asserts the chosen assignees.
+    """
+    assignees = [(1, 0, day(30)), (2, 5, day(3)), (3, 2, day(4))]
+    assert balance([(10, day(5), day(6))], assignees) == [(3, 10)]
+    assert balance([(10, day(3), day(6))], assignees) == [(2, 10)]
+
+
+def test_balance_minimizes_overlap_when_nobody_is_free() -> None:
+    """Tests that without a free assignee the task goes to the one who gets free first.
+
+    Returns: None : This test function does not return any value. It asserts the chosen assignee.
+    """
+    assert balance([(10, day(0), day(2))], [(1, 0, day(30)), (2, 9, day(10))]) == [(2, 10)]
+
+
+def test_balance_spreads_tasks_evenly() -> None:
+    """Tests that many parallel tasks are spread evenly over idle assignees, in start date order.
+
+    Returns: None : This test function does not return any value. It asserts the load per assignee.
+    """
+    tasks = [(task_id, day(task_id % 7), day(task_id % 7 + 3)) for task_id in range(100)]
+    assignments = balance(tasks, [(assignee_id, 0, None) for assignee_id in range(10)])
+    assert sorted(task_id for _, task_id in assignments) == list(range(100))
+    assert set(Counter(assignee_id for assignee_id, _ in assignments).values()) == {10}
+
+
+def test_balance_without_assignees() -> None:
+    """Tests that nothing is assigned when there is nobody to assign to.
+
+    Returns: None : This test function does not return any value. It asserts the empty result.
+    """
+    assert balance([(10, day(0), day(1))], []) == []
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_concurrent_runs_assign_each_task_once() -> None:
+    """Tests that a second run for the same project waits for the first and finds nothing left to assign.
+
+    The test adds a project with three unassigned tasks and deletes it, its manager and tasks at the end.
+
+    Returns: None : This test function does not return any value. It asserts the assignments of the new tasks.
+    """
+    with Session(db_engine.engine) as session:
+        if session.execute(select(func.count()).select_from(Assignee)).scalar_one() < 2:
+            pytest.skip("needs two assignees")
+        manager = Manager(firstname="Auto", lastname="Assign", salary=1, email="auto.assign@example.com")
+        project = Project(project_name="Auto Assign", project_aim="Test", project_budget=1, manager=manager,
+                          tasks=[Task(task_name=f"Auto {number}", start_date=day(number), due_date=day(number + 1),
+                                      status="not_started") for number in range(3)])
+        session.add(project)
+        session.commit()
+        project_id, manager_id = project.id, manager.id
+        task_ids = [task.id for task in project.tasks]
+    results: list[tuple[int, int]] = []
+    try:
+        with Session(db_engine.engine) as first, Session(db_engine.engine) as second:
+            results.append(auto_assign_project(first, project_id))
+
+            def run_second() -> None:
+                results.append(auto_assign_project(second, project_id))
+                second.commit()
+
+            thread = threading.Thread(target=run_second)
+            thread.start()
+            thread.join(timeout=0.5)
+            assert thread.is_alive()
+            first.commit()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+        assert results == [(3, results[0][1]), (0, 0)]
+        with Session(db_engine.engine) as session:
+            assigned = session.execute(select(AssigneeTask.task_id).where(AssigneeTask.task_id.in_(task_ids)))
+            assert Counter(assigned.scalars()) == Counter(task_ids)
+    finally:
+        with Session(db_engine.engine) as session:
+            session.execute(delete(Manager).where(Manager.id == manager_id))
+            session.commit()
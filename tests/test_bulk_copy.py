@@ -0,0 +1,76 @@
+"""COPY loads and exports and pipelined reads tests."""
+import os
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.db_connection import RoutingSession
+from src.bulk_copy import _text_value, binary_type, copy_rows, export_rows, reserve_ids
+from src.models import AssigneeTask, Project, Task
+from src.queries import MANAGER_ROWS, PROJECT_ROWS, fetch_pipelined
+
+
+def test_copy_formats() -> None:
+    """Tests the binary type names of the model columns and the escaping of the text format.
+
+    Returns: None : This test function does not return any value. It asserts the type names and text values.
+    """
+    assert [binary_type(column) for column in (Task.id, Task.task_name, Task.start_date, Task.created_at,
+                                               Project.project_budget)] == ["int4", "text", "date", "timestamp",
+                                                                            "float8"]
+    assert [_text_value(value) for value in (None, "a\tb\\c\n", date(2024, 1, 2), 1.5)] == \
+        ["\\N", "a\\tb\\\\c\\n", "2024-01-02", "1.5"]
+
+
+def test_copies_and_reserved_ids_go_to_the_primary() -> None:
+    """Tests that COPY and `nextval` run on the primary although a routing session would send plain reads to a replica.
+
+    Returns: None : This test function does not return any value. It asserts the binds the statements are sent to.
+    """
+    router = MagicMock()
+    router.engine = MagicMock(name="primary")
+    router.replica_max_lag = 5.0
+    router.get_replica.return_value = MagicMock(name="replica")
+    session = RoutingSession(router=router)
+    with patch.object(session, "connection") as connection, patch.object(session, "scalars") as scalars:
+        connection.return_value.dialect.driver = "psycopg2"
+        assert copy_rows(session, AssigneeTask.__table__, ("assignee_id", "task_id"), [(1, 2)]) == 1
+        connection.assert_called_once_with(bind_arguments={"bind": router.engine})
+        scalars.return_value = [7, 8]
+        assert reserve_ids(session, Task.__table__, 2) == [7, 8]
+        assert scalars.call_args.kwargs["bind_arguments"] == {"bind": router.engine}
+    router.get_replica.assert_not_called()
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_copied_rows_read_back_and_pipelined_reads_match() -> None:
+    """Tests that rows loaded with COPY are exported unchanged and that pipelined reads return the session's rows.
+
+    Runs with the driver selected by `db_driver`, in a transaction that is rolled back.
+
+    Returns: None : This test function does not return any value. It asserts the exported and fetched rows.
+    """
+    with Session(db_engine.engine) as session:
+        project_id, assignee_id = session.execute(
+            select(Task.project_id, AssigneeTask.assignee_id).join(AssigneeTask, AssigneeTask.task_id == Task.id)
+            .limit(1)).one()
+        task_ids = reserve_ids(session, Task.__table__, 2)
+        created_at = datetime(2024, 1, 1, 12, 30)
+        rows = [(task_id, f"Copied\ttask {task_id}", date(2024, 1, 1), date(2024, 1, 31), "done", project_id,
+                 created_at, 1) for task_id in task_ids]
+        assert copy_rows(session, Task.__table__, ("id", "task_name", "start_date", "due_date", "status",
+                                                   "project_id", "created_at", "version"), rows) == 2
+        assert copy_rows(session, AssigneeTask.__table__, ("assignee_id", "task_id", "created_at", "version"),
+                         [(assignee_id, task_id, created_at, 1) for task_id in task_ids]) == 2
+        exported = export_rows(session, select(Task.id, Task.task_name, Task.start_date, Task.due_date, Task.status,
+                                               Task.project_id, Task.created_at, Task.version)
+                               .where(Task.id.in_(task_ids)).order_by(Task.id))
+        assert list(exported) == rows
+
+        statements = (PROJECT_ROWS, MANAGER_ROWS)
+        assert fetch_pipelined(session, statements) == [[tuple(row) for row in session.execute(statement)]
+                                                        for statement in statements]
+        session.rollback()
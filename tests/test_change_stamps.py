@@ -0,0 +1,41 @@
+"""Change stamp tests."""
+import os
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.change_stamps import table_stamps
+from src.models import Task, TaskDependency
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_stamp_moves_when_an_earlier_change_commits_last() -> None:
+    """Tests that a change flushed before a later one but committed after it still moves the table's stamp.
+
+    Two transactions each add a task dependency; the one created first commits last, so the latest creation time
+    of the table would not move on its commit. The dependencies are deleted at the end.
+
+    Returns: None : This test function does not return any value. It asserts that the stamps differ.
+    """
+    with Session(db_engine.engine) as first, Session(db_engine.engine) as second, \
+            Session(db_engine.engine) as reader:
+        task_ids = first.execute(select(Task.id).order_by(Task.id).limit(2)).scalars().all()
+        if len(task_ids) < 2:
+            pytest.skip("needs two tasks")
+        try:
+            first.add(TaskDependency(task_id=task_ids[1], depends_on_id=task_ids[0]))
+            first.flush()
+            second.add(TaskDependency(task_id=task_ids[0], depends_on_id=task_ids[1]))
+            second.commit()
+            before = table_stamps(reader, [TaskDependency])["task_dependencies"]
+            reader.rollback()
+            first.commit()
+            after = table_stamps(reader, [TaskDependency])["task_dependencies"]
+            assert after.changes == before.changes + 1
+        finally:
+            reader.rollback()
+            reader.execute(delete(TaskDependency).where(TaskDependency.task_id.in_(task_ids),
+                                                        TaskDependency.depends_on_id.in_(task_ids)))
+            reader.commit()
@@ -0,0 +1,29 @@
+"""Optimistic concurrency control tests."""
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from src.base import Model
+from src.concurrency import compare_and_swap
+from src.models import Manager, Project
+
+
+def test_stale_version_leaves_the_row_unchanged() -> None:
+    """Tests that an edit based on an outdated version is refused and does not touch the row another editor saved.
+
+    Returns: None : This test function does not return any value. It asserts the result and the stored row.
+    """
+    engine = create_engine("sqlite://")
+    Model.metadata.create_all(engine, tables=[Manager.__table__, Project.__table__])
+    with Session(engine) as session:
+        project = Project(project_name="Race", project_aim="Aim", project_budget=1000,
+                          manager=Manager(firstname="Ann", lastname="Lee", salary=100, email="ann@example.com"))
+        session.add(project)
+        session.commit()
+        project_id, seen_version = project.id, project.version
+
+        assert compare_and_swap(session, Project, project_id, seen_version, {"project_budget": 2000})
+        assert not compare_and_swap(session, Project, project_id, seen_version, {"project_budget": 3000})
+        assert not compare_and_swap(session, Project, project_id + 1, seen_version, {"project_budget": 3000})
+        session.commit()
+        row = session.execute(select(Project.project_budget, Project.version).where(Project.id == project_id)).one()
+        assert tuple(row) == (2000, seen_version + 1)
@@ -3,8 +3,10 @@ import os
 import unittest
 from typing import Any
 from unittest.mock import patch, MagicMock
-from sqlalchemy.exc import SQLAlchemyError
-from src.db_connection import DBEngine
+from sqlalchemy import select, update, text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from src.db_connection import CONNECT_ARGS, DBEngine, RoutingSession
+from src.models import Project
 
 
 class TestDBEngine(unittest.TestCase):
@@ -18,16 +20,26 @@ class TestDBEngine(unittest.TestCase):
     test_db_engine_init(self, mock_create_engine, mock_scoped_session, mock_url_create)
         Tests the initialization of the DBEngine class, ensuring that all components
         are correctly set up, including the database URL, engine, and session factory.
+    test_db_engine_driver_selection(self, mock_create_engine, mock_scoped_session, mock_url_create)
+        Tests that the `db_driver` environment variable selects the DBAPI driver and that unknown drivers are
+        rejected.
     test_get_session(self, mock_scoped_session)
         Tests the get_session method of the DBEngine class, verifying that a new session
         is correctly created and returned.
     test_close_session(self, mock_scoped_session)
         Tests the close_session method of the DBEngine class, ensuring that the session
         is properly removed and resources are released.
+    test_unit_of_work(self, mock_sessionmaker)
+        Tests the unit_of_work method of the DBEngine class, ensuring that each unit of work gets its own
+        session that is committed once on success and rolled back on errors.
+    test_read_only_unit_of_work(self, mock_sessionmaker)
+        Tests the read_only_unit_of_work method of the DBEngine class, ensuring that its sessions are never
+        committed and always closed.
     test_db_engine_init_sqlalchemy_error(self, mock_scoped_session, mock_create_engine)
         Tests the initialization of the DBEngine class when an SQLAlchemyError is raised,
         verifying that the error is handled correctly.
     """
+    @patch.dict(os.environ, {"db_driver": ""})
     @patch('src.db_connection.URL.create')
     @patch('src.db_connection.scoped_session')
     @patch('src.db_connection.create_engine')
@@ -71,11 +83,27 @@ class TestDBEngine(unittest.TestCase):
             pool_size=10,
             max_overflow=20,
             pool_pre_ping=True,
-            pool_recycle=1800
+            pool_recycle=1800,
+            connect_args=CONNECT_ARGS
         )
         self.assertEqual(db_engine.engine, mock_engine)
         self.assertEqual(db_engine.Session, mock_session_factory)
         self.assertIsNotNone(db_engine.Base)
+        self.assertEqual(db_engine.driver, "psycopg2")
+
+    @patch('src.db_connection.URL.create')
+    @patch('src.db_connection.scoped_session')
+    @patch('src.db_connection.create_engine')
+    def test_db_engine_driver_selection(self, mock_create_engine: Any, mock_scoped_session: Any,
+                                        mock_url_create: Any) -> None:
+        """Test that `db_driver` selects psycopg 3 and that an unknown driver raises a ValueError."""
+        with patch.dict(os.environ, {"db_driver": "psycopg"}):
+            db_engine = DBEngine()
+        self.assertEqual(db_engine.driver, "psycopg")
+        self.assertEqual(mock_url_create.call_args.args, ("postgresql+psycopg",))
+
+        with patch.dict(os.environ, {"db_driver": "pg8000"}), self.assertRaises(ValueError):
+            DBEngine()
 
     @patch('src.db_connection.scoped_session')
     def test_get_session(self, mock_scoped_session: Any) -> None:
@@ -114,6 +142,55 @@ class TestDBEngine(unittest.TestCase):
         # Assertions
         mock_session_remove.assert_called_once()
 
+    @patch('src.db_connection.sessionmaker')
+    def test_unit_of_work(self, mock_sessionmaker: Any) -> None:
+        """Test the unit_of_work method of the DBEngine class.
+
+        This test verifies that every unit of work gets a fresh session from the session factory, that the session
+        is committed once when the block succeeds, rolled back when it raises, and closed in both cases.
+        """
+        first_session, second_session = MagicMock(), MagicMock()
+        mock_sessionmaker.return_value.side_effect = [first_session, second_session]
+        db_engine = DBEngine()
+
+        with db_engine.unit_of_work() as session:
+            self.assertIs(session, first_session)
+        first_session.commit.assert_called_once()
+        first_session.close.assert_called_once()
+
+        with self.assertRaises(ValueError):
+            with db_engine.unit_of_work() as session:
+                self.assertIs(session, second_session)
+                raise ValueError("Form failed")
+        second_session.commit.assert_not_called()
+        second_session.rollback.assert_called_once()
+        second_session.close.assert_called_once()
+
+    @patch('src.db_connection.sessionmaker')
+    def test_read_only_unit_of_work(self, mock_sessionmaker: Any) -> None:
+        """Test the read_only_unit_of_work method of the DBEngine class.
+
+        This test verifies that the read-only sessions are created without autoflush and expiry and that they are
+        closed, but never committed, both when the block succeeds and when it raises.
+        """
+        db_engine = DBEngine()
+        self.assertEqual(mock_sessionmaker.call_args_list[1].kwargs["read_only"], True)
+        self.assertEqual(mock_sessionmaker.call_args_list[1].kwargs["expire_on_commit"], False)
+        self.assertEqual(mock_sessionmaker.call_args_list[1].kwargs["autoflush"], False)
+        first_session, second_session = MagicMock(), MagicMock()
+        mock_sessionmaker.return_value.side_effect = [first_session, second_session]
+
+        with db_engine.read_only_unit_of_work() as session:
+            self.assertIs(session, first_session)
+        first_session.commit.assert_not_called()
+        first_session.close.assert_called_once()
+
+        with self.assertRaises(ValueError):
+            with db_engine.read_only_unit_of_work() as session:
+                raise ValueError("Page failed")
+        second_session.commit.assert_not_called()
+        second_session.close.assert_called_once()
+
     @patch('src.db_connection.create_engine')
     def test_db_engine_init_sqlalchemy_error(self, mock_create_engine: Any) -> None:
         """Test initialization when SQLAlchemyError is raised.
@@ -133,5 +210,100 @@ class TestDBEngine(unittest.TestCase):
         mock_create_engine.assert_called_once()
 
 
+class TestRoutingSession(unittest.TestCase):
+    """Unit tests for the RoutingSession class, which splits reads and writes between a replica and the primary.
+
+    The tests use a mocked DBEngine as the router, so no database is needed. They check that pure reads go to a
+    healthy replica, that writes and locking reads go to the primary, that reads stick to the primary right after
+    a write and that the session falls back to the primary when no replica is available.
+    """
+    def setUp(self) -> None:
+        """Creates a router with distinct primary and replica engine mocks."""
+        self.router = MagicMock()
+        self.router.engine = MagicMock(name='primary')
+        self.router.replica_max_lag = 5.0
+        self.replica = MagicMock(name='replica')
+        self.router.get_replica.return_value = self.replica
+        self.session = RoutingSession(router=self.router)
+
+    def test_reads_go_to_replica(self) -> None:
+        """Test that a plain SELECT is routed to the replica."""
+        self.assertIs(self.session.get_bind(clause=select(Project)), self.replica)
+
+    def test_writes_go_to_primary(self) -> None:
+        """Test that UPDATE and SELECT ... FOR UPDATE statements are routed to the primary."""
+        self.assertIs(self.session.get_bind(clause=update(Project).values(project_budget=1)), self.router.engine)
+        self.assertIs(self.session.get_bind(clause=select(Project).with_for_update()), self.router.engine)
+
+    def test_reads_stick_to_primary_after_write(self) -> None:
+        """Test that reads following a write are routed to the primary to keep read-your-writes consistency."""
+        self.session.get_bind(clause=update(Project).values(project_budget=1))
+        self.assertIs(self.session.get_bind(clause=select(Project)), self.router.engine)
+
+    def test_fallback_to_primary_without_healthy_replica(self) -> None:
+        """Test that reads are routed to the primary when every replica lags behind."""
+        self.router.get_replica.return_value = None
+        self.assertIs(self.session.get_bind(clause=select(Project)), self.router.engine)
+
+    def test_read_only_session_uses_read_only_engines(self) -> None:
+        """Test that a read-only session routes reads and writes to the read-only variants of the engines."""
+        session = RoutingSession(router=self.router, read_only=True)
+        self.router.read_only.side_effect = lambda engine: (engine, 'read only')
+        self.assertEqual(session.get_bind(clause=select(Project)), (self.replica, 'read only'))
+        self.assertEqual(session.get_bind(clause=update(Project).values(project_budget=1)),
+                         (self.router.engine, 'read only'))
+
+    @patch('src.db_connection.create_engine')
+    def test_get_replica_skips_lagging_replica(self, mock_create_engine: Any) -> None:
+        """Test that DBEngine.get_replica skips replicas whose replication lag exceeds the configured maximum."""
+        with patch.dict(os.environ, {'replica_hosts': 'localhost:5433,localhost:5434', 'replica_max_lag': '5'}):
+            mock_create_engine.side_effect = [MagicMock(name='primary'), MagicMock(name='lagging'),
+                                              MagicMock(name='healthy')]
+            db_engine = DBEngine()
+        lagging, healthy = db_engine.replica_engines
+        with patch.object(DBEngine, 'replica_lag', side_effect=lambda replica: 60.0 if replica is lagging else 0.0):
+            self.assertIs(db_engine.get_replica(), healthy)
+            self.assertIs(db_engine.get_replica(), healthy)
+
+
+@unittest.skipUnless(os.getenv('host'), 'needs a database')
+class TestReadOnlyUnitOfWorkIntegration(unittest.TestCase):
+    """Integration test for the read-only unit of work against the configured Postgres database."""
+    def test_writes_fail_and_the_mode_is_reset(self) -> None:
+        """Test that a read-only transaction rejects writes and that pooled connections are writable again."""
+        db_engine = DBEngine()
+        try:
+            with db_engine.read_only_unit_of_work() as session:
+                self.assertEqual(session.execute(text('SHOW transaction_read_only')).scalar(), 'on')
+                with self.assertRaises(DBAPIError):
+                    session.execute(update(Project).where(Project.id == -1).values(project_budget=0))
+            with db_engine.unit_of_work() as session:
+                self.assertEqual(session.execute(text('SHOW transaction_read_only')).scalar(), 'off')
+        finally:
+            db_engine.engine.dispose()
+
+
+@unittest.skipUnless(os.getenv('replica_hosts') and os.getenv('host'), 'needs a primary and a replica database')
+class TestReplicaRoutingIntegration(unittest.TestCase):
+    """Integration test for replica routing against two local Postgres instances.
+
+    Start two servers, e.g. `docker run -p 5432:5432 postgres` and `docker run -p 5433:5432 postgres`, set the
+    primary connection variables and `replica_hosts=localhost:5433`, and run the tests. The test checks the server
+    port each statement ran on.
+    """
+    def test_reads_and_writes_are_routed(self) -> None:
+        """Test that a read runs on the replica and a read following a write runs on the primary."""
+        db_engine = DBEngine()
+        session = db_engine.get_session()
+        replica_port = db_engine.replica_engines[0].url.port
+        try:
+            self.assertEqual(session.execute(select(text('inet_server_port()'))).scalar(), replica_port)
+            session.execute(update(Project).where(Project.id == -1).values(project_budget=0))
+            self.assertNotEqual(session.execute(select(text('inet_server_port()'))).scalar(), replica_port)
+        finally:
+            session.rollback()
+            db_engine.close_session()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,98 @@
+"""Dashboard metrics tests."""
+import os
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
+
+import src.dashboard_metrics
+from src.base import db_engine
+from src.change_stamps import TableStamp
+from src.dashboard_metrics import MetricsRefresher, RECENT_DAYS, RECENT_RESOLUTION, read_metrics
+from src.models import Assignee, AssigneeTask, Project, Task
+
+
+def test_refresher_counts_again_only_after_a_change() -> None:
+    """Tests that the metrics are reused until a table's stamp moves or the recent-updates window moves on.
+
+    Returns: None : This test function does not return any value. It asserts the reused and recounted metrics.
+    """
+    stamps = {"tasks": TableStamp(1)}
+    moved = {"tasks": TableStamp(2)}
+    counted = [object(), object(), object()]
+    now = datetime.now()
+    refresher = MetricsRefresher()
+    with patch.object(src.dashboard_metrics, "table_stamps", side_effect=[stamps, stamps, moved, moved, moved]), \
+            patch.object(src.dashboard_metrics, "read_metrics", side_effect=counted) as read_metrics_:
+        session = MagicMock()
+        assert refresher.refresh(session, now) is counted[0]
+        assert refresher.refresh(session, now + RECENT_RESOLUTION / 2) is counted[0]
+        assert refresher.refresh(session, now) is counted[1]
+        assert refresher.refresh(session, now) is counted[1]
+        assert refresher.refresh(session, now + RECENT_RESOLUTION) is counted[2]
+    assert read_metrics_.call_count == 3
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_read_metrics_matches_direct_counts() -> None:
+    """Tests the counted metrics against direct counts after updates, inserts, soft deletes and hard deletes.
+
+    The changes are made in a transaction that is rolled back at the end.
+
+    Returns: None : This test function does not return any value. It asserts that both counts agree.
+    """
+    def direct(session: Session) -> tuple[int, ...]:
+        recent = datetime.now() - timedelta(days=RECENT_DAYS)
+        visible_task = Task.project.has(Project.deleted_at.is_(None))
+        counts = [
+            (Project, Project.deleted_at.is_(None)),
+            (Project, Project.deleted_at.is_(None), Project.updated_at >= recent),
+            (Task, visible_task),
+            (Task, visible_task, Task.updated_at >= recent),
+            (Task, visible_task, Task.status == "in_progres"),
+            (Task, visible_task, Task.status == "in_progres", Task.updated_at >= recent),
+            (Task, visible_task, Task.status == "done"),
+            (Task, visible_task, Task.status == "done", Task.updated_at >= recent),
+            (Assignee, Assignee.deleted_at.is_(None)),
+            (Assignee, Assignee.deleted_at.is_(None), Assignee.updated_at >= recent),
+        ]
+        return tuple(session.execute(select(func.count()).select_from(model).where(*criteria)).scalar_one()
+                     for model, *criteria in counts)
+
+    def chart(session: Session) -> list[tuple[int, int]]:
+        return [(row_id, tasks) for row_id, tasks in session.execute(
+            select(Assignee.id, func.count(AssigneeTask.id))
+            .outerjoin(AssigneeTask, AssigneeTask.assignee_id == Assignee.id)
+            .where(Assignee.deleted_at.is_(None)).group_by(Assignee.id).order_by(Assignee.id))]
+
+    with db_engine.engine.connect() as connection, connection.begin() as transaction:
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        project_id, other_project_id, assignee_id = session.execute(
+            select(func.min(Project.id), func.max(Project.id), select(func.min(Assignee.id)).scalar_subquery())
+        ).one()
+        if project_id is None or project_id == other_project_id or assignee_id is None:
+            pytest.skip("needs two projects and an assignee")
+        changes = [
+            None,
+            update(Task).where(Task.project_id == project_id).values(status="done"),
+            update(Project).where(Project.id == project_id).values(deleted_at=datetime.now()),
+            update(Assignee).where(Assignee.id == assignee_id).values(lastname="Renamed"),
+            delete(AssigneeTask).where(AssigneeTask.assignee_id == assignee_id),
+        ]
+        for change in changes:
+            if change is not None:
+                session.execute(change)
+            metrics = read_metrics(session, datetime.now() - timedelta(days=RECENT_DAYS))
+            assert tuple(getattr(metrics, name) for name in (
+                "projects", "projects_updated", "tasks", "tasks_updated", "tasks_in_progress",
+                "tasks_in_progress_updated", "tasks_done", "tasks_done_updated", "assignees", "assignees_updated",
+            )) == direct(session)
+            assert list(zip(metrics.chart["id"], metrics.chart["tasks"])) == chart(session)
+        session.add(Task(task_name="Metrics check", start_date=date.today(), due_date=date.today(),
+                         status="in_progres", project_id=other_project_id))
+        session.flush()
+        assert read_metrics(session, datetime.now()).tasks == direct(session)[2]
+        session.close()
+        transaction.rollback()
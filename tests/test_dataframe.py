@@ -1,8 +1,8 @@
 """Panda Dataframe test."""
 import pandas as pd
 from typing import List
-from src.models import Project
-from utils.utilities import projects_to_df
+from src.models import Project, Job
+from utils.utilities import projects_to_df, jobs_to_df
 from tests.conftest import test_projects_list
 
 
@@ -32,3 +32,22 @@ def test_projects_to_df(test_projects_list: List[Project]) -> None:
     expected_df = pd.DataFrame(expected_data)
     result_df = projects_to_df(test_projects_list)
     pd.testing.assert_frame_equal(result_df, expected_df)
+
+
+def test_jobs_to_df() -> None:
+    """Tests the jobs_to_df function to ensure job progress is reported as a fraction of the expected total.
+
+    This test checks whether the jobs_to_df function converts running, finished and queued jobs into the
+    progress values shown on the Background Jobs page, including jobs that do not know their total.
+
+    Returns: None : This test function does not return any value. It asserts that the Progress and Done columns
+    of the produced DataFrame match the expected values.
+    """
+    jobs = [
+        Job(id=1, kind='seed', status='running', progress=5, total=20),
+        Job(id=2, kind='purge_deleted', status='done', progress=300, total=None),
+        Job(id=3, kind='seed', status='queued', progress=0, total=None),
+    ]
+    result_df = jobs_to_df(jobs)
+    assert result_df["Progress"].tolist() == [0.25, 1.0, 0.0]
+    assert result_df["Done"].tolist() == ['5/20', '300', '0']
@@ -2,6 +2,7 @@
 from typing import List
 import utils.utilities as func_to_test
 from src.models import Assignee, Project
+from src.dummy_data import generate_projects
 from tests.conftest import test_assignees_list, test_projects_list
 
 
@@ -78,3 +79,47 @@ def test_find_project_id(test_projects_list: List[Project]) -> None:
     """
     result = func_to_test.find_project_id(test_projects_list, 'Wind Factory Project')
     assert result == 1
+
+
+def test_describe_cascade() -> None:
+    """Tests the describe_cascade function to ensure it lists every table affected by a cascading delete.
+
+    This test checks whether the describe_cascade function turns a mapping of table names to row counts into a
+    readable sentence that is shown to the user before a project, manager or assignee is deleted.
+
+    Returns: None : This test function does not return any value. It asserts that the result of the describe_cascade
+    function matches the expected sentence.
+    """
+    result = func_to_test.describe_cascade({"projects": 1, "tasks": 250, "assignee_tasks": 600})
+    assert result == "Deleting it removes 1 projects, 250 tasks, 600 assignee tasks."
+
+
+def test_find_version() -> None:
+    """Tests the find_version function to ensure it returns the version counter of the selected record.
+
+    This test checks whether the find_version function returns the version the edit forms compare against when
+    they update a row, and None when the selected record is not in the list.
+
+    Returns: None : This test function does not return any value. It asserts that the result of the find_version
+    function matches the expected versions.
+    """
+    assignees = [Assignee(id=1, firstname='Alice', lastname='Brown', version=3),
+                 Assignee(id=2, firstname='Charlie', lastname='Davis', version=1)]
+    assert func_to_test.find_version(assignees, 1) == 3
+    assert func_to_test.find_version(assignees, 5) is None
+
+
+def test_generate_projects() -> None:
+    """Tests the generate_projects function to ensure it streams reproducible records in the seed data format.
+
+    This test checks whether the generator yields the requested number of projects with unique managers and the
+    requested number of tasks and assignees, and whether the same seed produces the same records.
+
+    Returns: None : This test function does not return any value. It asserts the shape of the generated records.
+    """
+    projects = list(generate_projects(3, tasks_per_project=4, assignees=10, assignees_per_task=2))
+    assert len(projects) == 3
+    assert len({project['manager']['email'] for project in projects}) == 3
+    assert all(len(project['tasks']) == 4 for project in projects)
+    assert all(len(task['assignees']) == 2 for project in projects for task in project['tasks'])
+    assert projects == list(generate_projects(3, tasks_per_project=4, assignees=10, assignees_per_task=2))
@@ -0,0 +1,106 @@
+"""Background job queue tests."""
+import os
+import threading
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import delete, select, text, update
+from sqlalchemy.orm import Session
+
+import src.jobs
+import src.worker
+from src.base import db_engine
+from src.jobs import JOB_HANDLERS, Reporter, claim_next_job, enqueue_job, requeue_stale_jobs, run_job
+from src.models import Job
+
+
+def test_failed_purge_sweep_is_recorded_as_failed() -> None:
+    """Tests that an error inside the purge sweep reaches `run_job` instead of being reported as a finished job.
+
+    Returns: None : This test function does not return any value. It asserts the recorded outcome.
+    """
+    session = MagicMock()
+    session.execute.side_effect = RuntimeError("database unreachable")
+    with patch.object(src.jobs, "finish_job") as finish_job:
+        run_job(session, Job(id=1, kind="purge_deleted", payload={}))
+    finish_job.assert_called_once_with(1, "failed", "database unreachable")
+    session.rollback.assert_called_once()
+
+
+def test_idle_worker_requeues_stale_jobs() -> None:
+    """Tests that a worker polling an empty queue puts stale jobs back, instead of only doing so on start-up.
+
+    Returns: None : This test function does not return any value. It asserts that the stale jobs were re-queued.
+    """
+    stop = threading.Event()
+
+    def requeue_and_stop(session: Session) -> int:
+        stop.set()
+        return 0
+
+    with patch.object(src.worker, "db_engine"), patch.object(src.worker, "REQUEUE_INTERVAL", 0.0), \
+            patch.object(src.worker, "claim_next_job", return_value=None), \
+            patch.object(src.worker, "requeue_stale_jobs", side_effect=requeue_and_stop) as requeue:
+        src.worker.work("test/1", stop, poll_interval=0.0)
+    requeue.assert_called_once()
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_workers_skip_locked_jobs_and_record_the_outcome() -> None:
+    """Tests claiming past a locked job, recording done and failed jobs, and re-queueing a job with a stale heartbeat.
+
+    The jobs are committed, because progress and outcomes are written on connections of their own, and deleted at
+    the end.
+
+    Returns: None : This test function does not return any value. It asserts the claimed jobs and their states.
+    """
+    def succeed(session: Session, payload: dict[str, Any], report: Reporter) -> None:
+        report(1, 1, "seeded")
+
+    def fail(session: Session, payload: dict[str, Any], report: Reporter) -> None:
+        raise RuntimeError("seed failed")
+
+    with Session(db_engine.engine) as session:
+        if session.execute(select(Job.id).where(Job.status == "queued")).first():
+            pytest.skip("needs an empty queue")
+        first, second = enqueue_job(session, "seed").id, enqueue_job(session, "seed").id
+        session.commit()
+    try:
+        with Session(db_engine.engine) as locker, Session(db_engine.engine) as worker:
+            locker.execute(select(Job.id).where(Job.id == first).with_for_update())
+            worker.execute(text("SET LOCAL lock_timeout = '2s'"))
+            claimed = claim_next_job(worker, "test/1")
+            assert claimed is not None
+            assert claimed.id == second and claimed.status == "running" and claimed.worker == "test/1"
+            locker.rollback()
+            claimed_first = claim_next_job(worker, "test/2")
+            assert claimed_first is not None and claimed_first.id == first
+            assert claim_next_job(worker, "test/3") is None
+
+            with patch.dict(JOB_HANDLERS, {"seed": succeed}):
+                run_job(worker, claimed)
+            with patch.dict(JOB_HANDLERS, {"seed": fail}):
+                run_job(worker, claimed_first)
+            worker.expire_all()
+            done, failed = worker.get(Job, second), worker.get(Job, first)
+            assert done is not None and failed is not None
+            assert done.status == "done" and done.progress == 1 and done.total == 1 and done.message == "seeded"
+            assert done.finished_at is not None
+            assert failed.status == "failed" and failed.message == "seed failed"
+
+            worker.execute(update(Job).where(Job.id == second)
+                           .values(status="running", heartbeat_at=datetime.now() - timedelta(hours=1)))
+            worker.execute(update(Job).where(Job.id == first).values(status="running", heartbeat_at=datetime.now()))
+            worker.commit()
+            assert requeue_stale_jobs(worker, timeout=timedelta(minutes=10)) >= 1
+            worker.expire_all()
+            requeued, running = worker.get(Job, second), worker.get(Job, first)
+            assert requeued is not None and running is not None
+            assert requeued.status == "queued" and requeued.worker is None
+            assert running.status == "running"
+    finally:
+        with Session(db_engine.engine) as session:
+            session.execute(delete(Job).where(Job.id.in_([first, second])))
+            session.commit()
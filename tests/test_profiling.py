@@ -0,0 +1,89 @@
+"""Memory profiling tests."""
+import gc
+import logging
+import os
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import Session
+from streamlit.testing.v1 import AppTest
+
+import utils.profiling as profiling
+from src.base import db_engine
+
+ROOT = Path(__file__).resolve().parent.parent
+PAGES = ["Home.py", "pages/1_Dashboard.py", "pages/2_Data_Overview.py", "pages/3_Edit_Data.py", "pages/4_Jobs.py",
+         "pages/5_Timeline.py"]
+LEAK_RERUNS = 5
+MAX_GROWTH_PER_RERUN = 64 * 1024
+
+
+def test_top_allocation_sites() -> None:
+    """Tests that top_allocation_sites points at the line that retained memory between two snapshots.
+
+    Returns: None : This test function does not return any value. It asserts the reported allocation site.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        retained = [bytearray(1024) for _ in range(100)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    sites = profiling.top_allocation_sites(before, after, limit=3)
+    assert retained
+    assert sites[0].startswith(f"{__file__}:")
+    assert "KiB" in sites[0]
+
+
+def test_profiled_unit_of_work_reports_reruns(monkeypatch: pytest.MonkeyPatch,
+                                              capsys: pytest.CaptureFixture[str]) -> None:
+    """Tests that profiled_unit_of_work yields a session and accumulates the growth across reruns of a page.
+
+    Returns: None : This test function does not return any value. It asserts the printed profiles.
+    """
+    monkeypatch.setattr(db_engine, "session_factory", Session)
+    monkeypatch.setattr(profiling, "_history", {})
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    try:
+        for _ in range(2):
+            with profiling.profiled_unit_of_work("Test page", enabled=True) as session:
+                assert isinstance(session, Session)
+    finally:
+        tracemalloc.stop()
+    output = capsys.readouterr().out
+    assert "Memory profile of Test page, rerun 1: identity map 0 objects" in output
+    assert "Memory profile of Test page, rerun 2" in output
+    assert len(profiling._history["Test page"]) == 2
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+@pytest.mark.parametrize("page", PAGES)
+def test_page_reruns_do_not_leak(page: str) -> None:
+    """Tests that repeated reruns of a page do not keep growing the memory held by the process.
+
+    The page is rendered headlessly with Streamlit's AppTest. The baseline is taken after two traced reruns,
+    because `tracemalloc` does not see untraced objects of earlier runs being freed and AppTest keeps the element
+    tree of the previous run alive. From there the memory still allocated after each rerun must grow by less than
+    `MAX_GROWTH_PER_RERUN` bytes per rerun on average; ORM lists, DataFrames or identity maps kept alive between
+    reruns exceed that quickly. Without a database the pages only render their connection errors, so the test
+    needs one.
+
+    Returns: None : This test function does not return any value. It asserts the average growth per rerun.
+    """
+    app = AppTest.from_file(str(ROOT / page), default_timeout=60)
+    app.run()
+    tracemalloc.start()
+    try:
+        app.run()
+        app.run()
+        gc.collect()
+        start = tracemalloc.get_traced_memory()[0]
+        for _ in range(LEAK_RERUNS):
+            app.run()
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    assert growth / LEAK_RERUNS < MAX_GROWTH_PER_RERUN
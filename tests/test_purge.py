@@ -0,0 +1,68 @@
+"""Batched purge tests."""
+import os
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.models import Assignee, AssigneeTask, Manager, Project, Task
+from src.purge import assignee_cascade_size, manager_cascade_size, mark_deleted, purge_assignee, purge_manager
+from src.upserts import insert_person
+
+
+def table_counts(session: Session) -> dict[str, int]:
+    """Counts the rows of every table a purge removes rows from."""
+    models = {"managers": Manager, "projects": Project, "tasks": Task, "assignee_tasks": AssigneeTask,
+              "assignees": Assignee}
+    return {table: session.execute(select(func.count()).select_from(model)).scalar_one()
+            for table, model in models.items()}
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_purge_removes_exactly_the_counted_cascade() -> None:
+    """Tests that purging a manager and an assignee in batches of one row removes the rows their cascades counted.
+
+    The purges run in a transaction that is rolled back at the end, each batch committing to a savepoint.
+
+    Returns: None : This test function does not return any value. It asserts the removed rows and the progress.
+    """
+    with db_engine.engine.connect() as connection, connection.begin() as transaction:
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        manager_id = session.execute(
+            select(Project.manager_id).join(Task, Task.project_id == Project.id)
+            .join(AssigneeTask, AssigneeTask.task_id == Task.id)
+            .group_by(Project.manager_id).having(func.count(func.distinct(Task.id)) > 1).limit(1)
+        ).scalar()
+        if manager_id is None:
+            pytest.skip("needs a project with two tasks and assignments")
+        manager = session.get(Manager, manager_id)
+        person = {"firstname": manager.firstname, "lastname": manager.lastname, "salary": manager.salary,
+                  "email": manager.email}
+        assert mark_deleted(session, Manager, manager_id)
+        assert not mark_deleted(session, Manager, manager_id)
+        session.expire_all()
+        assert session.get(Manager, manager_id).email.startswith(f"deleted-{manager_id}-")
+        new_manager_id = insert_person(session, Manager, person)
+        assert new_manager_id not in (None, manager_id)
+        sizes = manager_cascade_size(session, manager_id)
+        before = table_counts(session)
+        progress: list[tuple[str, int, int]] = []
+        purge_manager(session, manager_id, batch_size=1,
+                      on_progress=lambda table, done, total: progress.append((table, done, total)))
+        after = table_counts(session)
+        assert {table: before[table] - after[table] for table in sizes} == sizes
+        assert before["assignees"] == after["assignees"]
+        assert len([step for step in progress if step[0] == "tasks"]) == sizes["tasks"] > 1
+        assert {table: done for table, done, _ in progress} == sizes
+
+        assignee_id = session.execute(select(AssigneeTask.assignee_id).limit(1)).scalar()
+        if assignee_id is not None:
+            assert mark_deleted(session, Assignee, assignee_id)
+            sizes = assignee_cascade_size(session, assignee_id)
+            before = table_counts(session)
+            purge_assignee(session, assignee_id, batch_size=1, on_progress=lambda *step: None)
+            after = table_counts(session)
+            assert {table: before[table] - after[table] for table in sizes} == sizes
+        session.close()
+        transaction.rollback()
@@ -0,0 +1,41 @@
+"""Prebuilt statements and compiled cache statistics tests."""
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from src.base import Model
+from src.models import Job, Project, Task
+from src.queries import RECENT_JOBS, CompiledCacheStats, compiled_cache_stats, stamps_statement
+
+
+def test_prebuilt_statements_reuse_their_compiled_sql() -> None:
+    """Tests that a prebuilt statement is compiled once and that text without a cache key is not counted as a hit.
+
+    Returns: None : This test function does not return any value. It asserts the outcomes counted per execution.
+    """
+    engine = create_engine("sqlite://")
+    Model.metadata.create_all(engine, tables=[Job.__table__])
+    with Session(engine) as session:
+        before = compiled_cache_stats.snapshot()
+        for limit in (5, 10, 20):
+            session.execute(RECENT_JOBS, {"limit": limit}).all()
+        assert compiled_cache_stats.hit_rate(since=before) == 2 / 3
+        session.execute(text("SELECT 1"))
+        assert compiled_cache_stats.hit_rate(since=before) == 2 / 4
+    assert stamps_statement((Project, Task)) is stamps_statement((Project, Task))
+
+
+def test_hit_rate_counts_since_a_snapshot() -> None:
+    """Tests the hit rate over all statements and over the statements counted after a snapshot.
+
+    Returns: None : This test function does not return any value. It asserts the rates and the reset.
+    """
+    stats = CompiledCacheStats()
+    assert stats.hit_rate() is None
+    stats.record("miss")
+    snapshot = stats.snapshot()
+    for outcome in ("hit", "hit", "hit", "no cache key"):
+        stats.record(outcome)
+    assert stats.hit_rate() == 3 / 5
+    assert stats.hit_rate(since=snapshot) == 3 / 4
+    stats.reset()
+    assert stats.snapshot() == {}
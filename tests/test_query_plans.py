@@ -0,0 +1,70 @@
+"""Query plan regression tests."""
+import json
+import os
+
+import pytest
+
+from benchmarks.query_plans import (FIXTURES_FILE, capture_plans, check_plans, normalize_sql, plan_regressions,
+                                    plan_shape, statement_key)
+
+
+def test_normalize_sql_collapses_batches() -> None:
+    """Tests that batches of different sizes and the parameter casts of psycopg 3 get the same fixture key.
+
+    Returns: None : This test function does not return any value. It asserts the normalized statements.
+    """
+    two_rows = ("INSERT INTO assignee_tasks (assignee_id, task_id) VALUES (%(assignee_id_m0)s, %(task_id_m0)s), "
+                "(%(assignee_id_m1)s, %(task_id_m1)s) ON CONFLICT (assignee_id, task_id) DO NOTHING")
+    one_row = ("INSERT INTO assignee_tasks (assignee_id, task_id) VALUES (%(assignee_id_m0)s, %(task_id_m0)s) "
+               "ON CONFLICT (assignee_id, task_id) DO NOTHING")
+    assert statement_key(two_rows) == statement_key(one_row)
+    assert normalize_sql("SELECT id FROM assignees\n WHERE email IN (%(email_1_1)s, %(email_1_2)s)") == \
+        "SELECT id FROM assignees WHERE email IN (%(email_1)s)"
+    assert normalize_sql("SELECT id FROM tasks WHERE id = %(id_1)s::INTEGER AND due_date < "
+                         "%(param_1)s::TIMESTAMP WITHOUT TIME ZONE") == \
+        "SELECT id FROM tasks WHERE id = %(id)s AND due_date < %(param)s"
+
+
+def test_plan_shape_lists_scans_and_arbiters() -> None:
+    """Tests that plan_shape flattens a JSON plan into indented node lines with relations and indexes.
+
+    Returns: None : This test function does not return any value. It asserts the flattened shape.
+    """
+    plan = {"Node Type": "ModifyTable", "Relation Name": "assignees",
+            "Conflict Arbiter Indexes": ["assignees_email_key"],
+            "Plans": [{"Node Type": "Index Scan", "Relation Name": "assignees", "Index Name": "assignees_pkey"}]}
+    assert plan_shape(plan) == ["ModifyTable on assignees", "  Conflict Arbiter using assignees_email_key",
+                                "  Index Scan on assignees using assignees_pkey"]
+
+
+def test_plan_regressions() -> None:
+    """Tests that a lost index and a new sequential scan are reported, while other plan changes are not.
+
+    Returns: None : This test function does not return any value. It asserts the reported regressions.
+    """
+    expected = ["Aggregate", "  Nested Loop", "    Index Scan on tasks using ix_tasks_project_id",
+                "    Index Only Scan on assignee_tasks using ix_assignee_tasks_task_id"]
+    reordered = ["Aggregate", "  Hash Join", "    Index Scan on tasks using ix_tasks_project_id",
+                 "    Bitmap Heap Scan on assignee_tasks", "      Bitmap Index Scan using ix_assignee_tasks_task_id"]
+    regressed = ["Aggregate", "  Hash Join", "    Seq Scan on assignee_tasks",
+                 "    Index Scan on tasks using ix_tasks_project_id"]
+    assert plan_regressions(expected, reordered) == []
+    assert plan_regressions(expected, regressed) == ["lost index ix_assignee_tasks_task_id",
+                                                     "sequential scan on assignee_tasks"]
+    assert check_plans({"abc": {"sql": "SELECT 1", "shape": ["Result"]}}, {}) == ["abc: no fixture for SELECT 1"]
+
+
+@pytest.mark.skipif(not os.getenv("host") or not FIXTURES_FILE.exists(), reason="needs a database and fixtures")
+def test_query_plans_match_fixtures() -> None:
+    """Tests that no statement the app issues lost an index or fell back to a sequential scan.
+
+    The plans are captured against the configured database, which must hold the reference dataset seeded with
+    `python -m benchmarks.query_plans --seed-reference`; the test is skipped on smaller databases.
+
+    Returns: None : This test function does not return any value. It asserts that no plan regressed.
+    """
+    try:
+        plans = capture_plans()
+    except RuntimeError as e:
+        pytest.skip(str(e))
+    assert check_plans(plans, json.loads(FIXTURES_FILE.read_text())) == []
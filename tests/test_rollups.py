@@ -0,0 +1,40 @@
+"""Labour cost rollup tests."""
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+from sqlalchemy.dialects import postgresql
+
+import src.rollups
+from src.change_stamps import TableStamp
+from src.rollups import PORTFOLIO_COLUMNS, cached_portfolio, portfolio_statement
+
+
+def test_portfolio_is_computed_in_the_database() -> None:
+    """Tests that the rollup is one statement with windows per assignee and a GROUP BY per project.
+
+    Returns: None : This test function does not return any value. It asserts the shape of the statement.
+    """
+    sql = str(portfolio_statement().compile(dialect=postgresql.dialect()))
+    assert sql.count("OVER (PARTITION BY assignee_tasks.assignee_id)") == 3
+    assert "GROUP BY assignment.project_id" in sql
+    assert "GROUP BY tasks.project_id" in sql
+    assert "rank() OVER (ORDER BY" in sql
+    assert len(portfolio_statement().selected_columns) == len(PORTFOLIO_COLUMNS)
+
+
+def test_cached_portfolio_recomputes_only_after_a_change() -> None:
+    """Tests that the rollup is reused while the change stamps stay the same and recomputed once they move.
+
+    Returns: None : This test function does not return any value. It asserts the calls of the rollup query.
+    """
+    stamps = {"projects": TableStamp(1)}
+    moved = {"projects": TableStamp(2)}
+    frames = [pd.DataFrame({"id": [1]}), pd.DataFrame({"id": [2]})]
+    with patch.object(src.rollups, "_cache", None), \
+            patch.object(src.rollups, "table_stamps", side_effect=[stamps, stamps, moved]), \
+            patch.object(src.rollups, "portfolio", side_effect=frames) as portfolio:
+        session = MagicMock()
+        assert cached_portfolio(session) is frames[0]
+        assert cached_portfolio(session) is frames[0]
+        assert cached_portfolio(session) is frames[1]
+        assert portfolio.call_count == 2
@@ -0,0 +1,182 @@
+"""Critical-path scheduling tests."""
+import os
+import random
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.orm import Session
+
+from src.base import Model, db_engine
+from src.models import Manager, Project, Task, TaskDependency
+from src.scheduling import Schedule, ScheduleCache, add_dependency, load_schedule, reschedule_task
+
+DAY = date(2024, 1, 1)
+
+
+def day(offset: int) -> date:
+    """Returns the date `offset` days after the first of January 2024."""
+    return DAY + timedelta(days=offset)
+
+
+def snapshot(schedule: Schedule) -> list[tuple]:
+    """Lists the computed dates of every task, by task ID."""
+    return sorted(tuple(item.__dict__.values()) for item in schedule.tasks())
+
+
+def test_schedule_computes_slack_and_critical_path() -> None:
+    """Tests a diamond of tasks 1 -> (2, 3) -> 4 where the longer branch through 2 is critical.
+
+    Returns: None : This test function does not return any value. It asserts the computed dates.
+    """
+    schedule = Schedule([(1, day(0), day(5)), (2, day(0), day(10)), (3, day(0), day(2)), (4, day(0), day(1))],
+                        [(2, 1), (3, 1), (4, 2), (4, 3)])
+    assert schedule.critical_path() == [1, 2, 4]
+    task = schedule.task_schedule(3)
+    assert (task.earliest_start, task.earliest_finish) == (day(5), day(7))
+    assert (task.latest_start, task.latest_finish, task.slack) == (day(13), day(15), 8)
+    assert schedule.task_schedule(4).earliest_finish == day(16)
+
+
+def test_planned_start_delays_a_task_without_dependencies() -> None:
+    """Tests that a task never starts before its planned start date, even when its dependencies finish earlier.
+
+    Returns: None : This test function does not return any value. It asserts the computed dates.
+    """
+    schedule = Schedule([(1, day(0), day(1)), (2, day(10), day(12))], [(2, 1)])
+    assert schedule.task_schedule(2).earliest_start == day(10)
+    assert schedule.task_schedule(1).slack == 9
+    assert schedule.critical_path() == [2]
+
+
+def test_slip_only_moves_the_downstream_tasks() -> None:
+    """Tests that a slipping task moves its dependents and nothing else.
+
+    Returns: None : This test function does not return any value. It asserts the moved tasks and dates.
+    """
+    schedule = Schedule([(1, day(0), day(2)), (2, day(0), day(3)), (3, day(0), day(1)), (4, day(0), day(1))],
+                        [(2, 1), (3, 2)])
+    assert schedule.update_task(1, day(0), day(6)) == {2, 3}
+    assert schedule.task_schedule(3).earliest_start == day(9)
+    assert schedule.task_schedule(4).latest_start == day(9)
+
+
+def test_cycles_are_rejected() -> None:
+    """Tests that cyclic dependencies are rejected when building the schedule and when adding a dependency.
+
+    Returns: None : This test function does not return any value. It asserts the raised errors.
+    """
+    tasks = [(1, day(0), day(1)), (2, day(0), day(1)), (3, day(0), day(1))]
+    with pytest.raises(ValueError):
+        Schedule(tasks, [(2, 1), (3, 2), (1, 3)])
+    schedule = Schedule(tasks, [(2, 1), (3, 2)])
+    with pytest.raises(ValueError):
+        schedule.add_dependency(1, 3)
+    with pytest.raises(ValueError):
+        schedule.add_dependency(1, 1)
+    assert schedule.predecessors[1] == set()
+
+
+def test_incremental_changes_match_a_full_rebuild() -> None:
+    """Tests random slips and dependency changes against schedules built from scratch after every change.
+
+    Returns: None : This test function does not return any value. It asserts that both schedules agree.
+    """
+    rng = random.Random(40)
+    size = 200
+    tasks = {task_id: (day(rng.randint(0, 30)), rng.randint(0, 10)) for task_id in range(size)}
+    dependencies = {(task_id, rng.randrange(task_id)) for task_id in range(1, size) for _ in range(2)}
+
+    def rows() -> list[tuple[int, date, date]]:
+        return [(task_id, start, start + timedelta(days=length)) for task_id, (start, length) in tasks.items()]
+
+    schedule = Schedule(rows(), dependencies)
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.6:
+            task_id = rng.randrange(size)
+            tasks[task_id] = (day(rng.randint(0, 30)), rng.randint(0, 10))
+            schedule.update_task(task_id, *rows()[task_id][1:])
+        elif action < 0.8 and dependencies:
+            dependency = rng.choice(sorted(dependencies))
+            dependencies.discard(dependency)
+            schedule.remove_dependency(*dependency)
+        else:
+            dependency = (rng.randrange(size), rng.randrange(size))
+            try:
+                schedule.add_dependency(*dependency)
+                dependencies.add(dependency)
+            except ValueError:
+                pass
+        assert snapshot(schedule) == snapshot(Schedule(rows(), dependencies))
+
+
+def test_reschedule_task_updates_the_cached_schedule() -> None:
+    """Tests that rescheduling a task moves the cached schedule along and that a rolled back edit drops it.
+
+    SQLite keeps no change counts, so the cache cannot tell its own commit from another writer's and loads again.
+
+    Returns: None : This test function does not return any value. It asserts the schedules and stored dates.
+    """
+    engine = create_engine("sqlite://")
+    Model.metadata.create_all(engine, tables=[Manager.__table__, Project.__table__, Task.__table__,
+                                              TaskDependency.__table__])
+    with Session(engine) as session:
+        project = Project(project_name="Plan", project_aim="Aim", project_budget=1000,
+                          manager=Manager(firstname="Ann", lastname="Lee", salary=100, email="ann@example.com"),
+                          tasks=[Task(task_name=f"Task {number}", start_date=day(0), due_date=day(2),
+                                      status="not_started") for number in (1, 2)])
+        session.add(project)
+        session.flush()
+        first, second = (task.id for task in project.tasks)
+        session.add(TaskDependency(task_id=second, depends_on_id=first))
+        session.commit()
+        schedules = ScheduleCache()
+        schedule = schedules.schedule(session, project.id)
+        assert schedules.schedule(session, project.id) is schedule
+
+        assert reschedule_task(session, first, 1, day(1), day(5), schedules) is schedule
+        assert schedule.task_schedule(second).earliest_start == day(5)
+        assert reschedule_task(session, first, 1, day(0), day(1), schedules) is None
+        session.rollback()
+        assert schedules.schedule(session, project.id) is not schedule
+        assert schedules.schedule(session, project.id).task_schedule(second).earliest_start == day(2)
+
+        schedule = reschedule_task(session, first, 1, day(1), day(5), schedules)
+        session.commit()
+        assert session.get(Task, first).due_date == day(5)
+        assert snapshot(schedules.schedule(session, project.id)) == snapshot(load_schedule(session, project.id))
+        assert reschedule_task(session, 0, 1, day(1), day(5), schedules) is None
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_cached_schedule_outlives_its_own_commit() -> None:
+    """Tests that a dependency added through the cache keeps the cached schedule valid after it commits.
+
+    The dependency is committed, because the change counts only move on commit, and deleted at the end.
+
+    Returns: None : This test function does not return any value. It asserts the cached and rebuilt schedules.
+    """
+    schedules = ScheduleCache()
+    with Session(db_engine.engine) as session:
+        linked = select(TaskDependency.task_id).union(select(TaskDependency.depends_on_id))
+        rows = session.execute(select(Task.id, Task.project_id).where(Task.id.not_in(linked))
+                               .order_by(Task.project_id, Task.id).limit(20)).all()
+        pairs = [(row.id, previous.id, row.project_id) for previous, row in zip(rows, rows[1:])
+                 if row.project_id == previous.project_id]
+        if not pairs:
+            pytest.skip("needs two tasks of one project without dependencies")
+        task_id, depends_on_id, project_id = pairs[0]
+        try:
+            schedule = schedules.schedule(session, project_id)
+            assert add_dependency(session, task_id, depends_on_id, schedules) is schedule
+            session.commit()
+            assert schedules.schedule(session, project_id) is schedule
+            assert snapshot(schedule) == snapshot(load_schedule(session, project_id))
+            with pytest.raises(ValueError):
+                add_dependency(session, depends_on_id, task_id, schedules)
+        finally:
+            session.rollback()
+            session.execute(delete(TaskDependency).where(TaskDependency.task_id == task_id,
+                                                         TaskDependency.depends_on_id == depends_on_id))
+            session.commit()
@@ -0,0 +1,43 @@
+"""JSON Lines seed file tests."""
+from pathlib import Path
+
+import pytest
+
+from src.dummy_data import projects_list_full
+from src.seed_files import iter_seed_file, write_seed_file, TimedIterator
+
+
+@pytest.mark.parametrize("file_name", ["projects.jsonl", "projects.jsonl.gz"])
+def test_seed_file_round_trip(tmp_path: Path, file_name: str) -> None:
+    """Tests that records written to a plain or gzip compressed seed file are streamed back unchanged.
+
+    Returns: None : This test function does not return any value. It asserts the records read back from the file.
+    """
+    path = tmp_path / file_name
+    assert write_seed_file(path, projects_list_full) == len(projects_list_full)
+    assert list(iter_seed_file(path)) == projects_list_full
+
+
+def test_iter_seed_file_reports_bad_lines(tmp_path: Path) -> None:
+    """Tests that a malformed record is reported with the file and line number instead of being seeded.
+
+    Returns: None : This test function does not return any value. It asserts the raised errors.
+    """
+    path = tmp_path / "projects.jsonl"
+    path.write_text('\n{"project_name": "Only a name"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="projects.jsonl:2: missing fields: project_aim"):
+        list(iter_seed_file(path))
+    path.write_text('{"project_name": \n', encoding="utf-8")
+    with pytest.raises(ValueError, match="projects.jsonl:1: invalid JSON"):
+        list(iter_seed_file(path))
+
+
+def test_timed_iterator_counts_items() -> None:
+    """Tests that TimedIterator passes items through and counts them while measuring the time spent producing them.
+
+    Returns: None : This test function does not return any value. It asserts the passed items and counters.
+    """
+    records = TimedIterator(iter(projects_list_full))
+    assert list(records) == projects_list_full
+    assert records.count == len(projects_list_full)
+    assert records.seconds >= 0.0
@@ -0,0 +1,56 @@
+"""Edit Data form fragment tests."""
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy.orm import Session
+from streamlit.testing.v1 import AppTest
+
+import utils.st_utils as st_utils
+from src.audit import ACTOR_KEY
+from src.views import ProjectView, Views
+
+calls: list[tuple[Any, Any]] = []
+
+SHARED_RUN = """
+from src.views import Views
+from tests.test_st_utils import record_form
+from utils.st_utils import form_fragment, shared_form_run
+
+with shared_form_run("page session", Views(("page project",), (), (), ())):
+    form_fragment(record_form, "projects")
+"""
+FRAGMENT_RUN = """
+from tests.test_st_utils import record_form
+from utils.st_utils import form_fragment
+
+form_fragment(record_form, "projects")
+"""
+
+
+def record_form(session: Any, projects: Any) -> None:
+    """A form that records the session and rows it was rendered with."""
+    calls.append((session, projects))
+
+
+def test_form_fragments_share_the_page_run_or_open_their_own(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that a form fragment uses the page's session and rows in a full run, and its own otherwise.
+
+    Returns: None : This test function does not return any value. It asserts the sessions and rows the form got.
+    """
+    own_session = Session()
+    fresh_project = ProjectView(id=1, version=1, project_name="Fresh project", project_aim="", project_budget=0.0)
+
+    @contextmanager
+    def unit_of_work(page: str) -> Iterator[Session]:
+        assert page == "Edit Data: record_form"
+        yield own_session
+
+    monkeypatch.setattr(st_utils, "profiled_unit_of_work", unit_of_work)
+    monkeypatch.setattr(st_utils, "load_form_views", lambda session: Views((fresh_project,), (), (), ()))
+    calls.clear()
+
+    AppTest.from_string(SHARED_RUN).run()
+    AppTest.from_string(FRAGMENT_RUN).run()
+    assert calls == [("page session", ("page project",)), (own_session, (fresh_project,))]
+    assert ACTOR_KEY in own_session.info
@@ -0,0 +1,82 @@
+"""Timeline downsampling tests."""
+import os
+from datetime import date, timedelta
+from typing import Any
+
+import pandas as pd
+import pytest
+from sqlalchemy.orm import Session
+from streamlit.testing.v1 import AppTest
+
+import components.timeline_section as timeline_section
+from src.base import db_engine
+from src.timeline import BUCKET_COLUMNS, LANES_PER_PAGE, TASK_COLUMNS, Timeline, bucket_days, load_timeline, \
+    timeline_extent
+
+SECTION_RUN = """
+from unittest.mock import MagicMock
+from components.timeline_section import timeline_section
+
+timeline_section(MagicMock())
+"""
+
+
+def test_bucket_days_widen_by_whole_weeks() -> None:
+    """Tests that buckets are one week wide while the marks fit and widen by whole weeks when they do not.
+
+    Returns: None : This test function does not return any value. It asserts the bucket widths.
+    """
+    year = (date(2024, 1, 1), date(2024, 12, 31))
+    assert bucket_days(10, year, max_marks=2000) == 7
+    assert bucket_days(40, year, max_marks=2000) == 14
+    assert bucket_days(40, year, max_marks=40) == 53 * 7
+    assert bucket_days(1, (date(2024, 1, 1), date(2024, 1, 1)), max_marks=1) == 7
+    with pytest.raises(ValueError, match="Unknown lane kind 'team'"):
+        load_timeline(Session(), "team", year)
+
+
+def test_section_handles_a_single_day_and_pages_past_the_last(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that a single-day extent shows no date slider and that the lanes page stays within the lane count.
+
+    Returns: None : This test function does not return any value. It asserts the widgets and the pages read.
+    """
+    day = date(2024, 1, 1)
+    pages: list[int] = []
+
+    def load(session: Any, kind: str, window: tuple[date, date], page: int = 0) -> Timeline:
+        pages.append(page)
+        lanes = ("Lane",) if page < 2 else ()
+        return Timeline(lanes, 2 * LANES_PER_PAGE if lanes else 0, 0, pd.DataFrame(columns=TASK_COLUMNS))
+
+    monkeypatch.setattr(timeline_section, "timeline_extent", lambda session: (day, day))
+    monkeypatch.setattr(timeline_section, "load_timeline", load)
+    app = AppTest.from_string(SECTION_RUN).run()
+    assert not app.exception and not app.slider
+    app.number_input[0].set_value(5).run()
+    app.number_input[0].set_value(2).run()
+    assert not app.exception
+    assert pages == [0, 0, 1]
+    assert app.caption[-1].value.startswith("Lanes page 2 of 2")
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+@pytest.mark.parametrize("kind", ["project", "assignee"])
+def test_zoomed_out_timeline_counts_the_tasks_it_does_not_draw(kind: str) -> None:
+    """Tests that a narrow window holds single tasks and that buckets over the whole extent count the same tasks.
+
+    With as many marks as lanes, every lane gets one bucket spanning the window, so its count must equal the
+    number of its tasks read as single marks.
+
+    Returns: None : This test function does not return any value. It asserts the modes, sizes and counts.
+    """
+    with Session(db_engine.engine) as session:
+        extent = timeline_extent(session)
+        narrow = load_timeline(session, kind, (extent[0], extent[0] + timedelta(days=13)), lanes_per_page=5)
+        assert narrow.bucket_days == 0 and list(narrow.marks.columns) == TASK_COLUMNS
+        assert set(narrow.marks["lane"]) <= set(narrow.lanes) and len(narrow.lanes) == 5
+
+        tasks = load_timeline(session, kind, extent, lanes_per_page=5, max_marks=100000)
+        buckets = load_timeline(session, kind, extent, lanes_per_page=5, max_marks=5)
+        assert buckets.bucket_days > 0 and list(buckets.marks.columns) == BUCKET_COLUMNS
+        assert len(buckets.marks) <= 5
+        assert buckets.marks.groupby("lane")["tasks"].sum().to_dict() == tasks.marks["lane"].value_counts().to_dict()
@@ -0,0 +1,96 @@
+"""Upsert write layer tests."""
+from typing import Any
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.models import Assignee
+from src.upserts import create_project_with_manager, upsert_people, assign_tasks, bulk_assign_tasks
+
+
+def compiled_sql(session: MagicMock) -> str:
+    """Compiles the last statement executed on a mocked session with the PostgreSQL dialect."""
+    return str(session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+
+
+def test_create_project_with_manager_is_one_statement() -> None:
+    """Tests that a project and its manager are written by one INSERT with a data-modifying CTE.
+
+    The manager upsert must feed the project insert, and a manager that already runs a project must not raise,
+    so both inserts carry an ON CONFLICT clause.
+
+    Returns: None : This test function does not return any value. It asserts the shape of the executed statement.
+    """
+    session = MagicMock()
+    manager: dict[str, Any] = {'firstname': 'Bernard', 'lastname': 'Shaw', 'salary': 111000,
+                               'email': 'bernard.shaw@ber.com'}
+    create_project_with_manager(session, {'project_name': 'Wind Factory Project', 'project_aim': 'Energy',
+                                          'project_budget': 500000}, manager)
+    session.execute.assert_called_once()
+    sql = compiled_sql(session)
+    assert sql.startswith('WITH new_manager AS')
+    assert 'ON CONFLICT (email) DO NOTHING' in sql
+    assert 'ON CONFLICT (manager_id) DO NOTHING RETURNING projects.id' in sql
+
+
+def test_upsert_people_sends_each_email_once() -> None:
+    """Tests that upsert_people deduplicates emails and resolves a batch of new people in one multi-row statement.
+
+    Returns: None : This test function does not return any value. It asserts the executed statement and result.
+    """
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [(7, 'alice.brown@example.com')]
+    alice = {'firstname': 'Alice', 'lastname': 'Brown', 'salary': 56000, 'email': 'alice.brown@example.com'}
+    result = upsert_people(session, Assignee, [alice, alice])
+    assert result == {'alice.brown@example.com': 7}
+    session.execute.assert_called_once()
+    assert 'ON CONFLICT (email) DO NOTHING RETURNING assignees.id, assignees.email' in compiled_sql(session)
+    assert 'email_m1' not in compiled_sql(session)
+
+
+def test_upsert_people_looks_up_existing_emails() -> None:
+    """Tests that upsert_people resolves people that already exist with a SELECT instead of rewriting their rows.
+
+    Returns: None : This test function does not return any value. It asserts the executed statements and result.
+    """
+    session = MagicMock()
+    session.execute.return_value.all.side_effect = [[(7, 'alice.brown@example.com')],
+                                                    [(3, 'charlie.davis@example.com')]]
+    result = upsert_people(session, Assignee, [
+        {'firstname': 'Alice', 'lastname': 'Brown', 'salary': 56000, 'email': 'alice.brown@example.com'},
+        {'firstname': 'Charlie', 'lastname': 'Davis', 'salary': 70000, 'email': 'charlie.davis@example.com'},
+    ])
+    assert result == {'alice.brown@example.com': 7, 'charlie.davis@example.com': 3}
+    assert session.execute.call_count == 2
+    assert compiled_sql(session).startswith('SELECT assignees.id, assignees.email')
+
+
+def test_assign_tasks_skips_duplicates() -> None:
+    """Tests that assign_tasks inserts each pair once and ignores existing assignments instead of failing.
+
+    Returns: None : This test function does not return any value. It asserts the executed statement.
+    """
+    session = MagicMock()
+    session.execute.return_value.rowcount = 1
+    assert assign_tasks(session, [(1, 2), (1, 2)]) == 1
+    assert assign_tasks(session, []) == 0
+    sql = compiled_sql(session)
+    assert 'ON CONFLICT (assignee_id, task_id) DO NOTHING' in sql
+    assert 'assignee_id_m1' not in sql
+
+
+def test_bulk_assign_tasks_is_one_statement() -> None:
+    """Tests that bulk_assign_tasks writes any number of assignments with one unnest-based INSERT.
+
+    Returns: None : This test function does not return any value. It asserts the statement and its parameters.
+    """
+    session = MagicMock()
+    session.execute.return_value.rowcount = 2
+    assert bulk_assign_tasks(session, [(1, 10), (2, 11), (1, 10)]) == 2
+    session.execute.assert_called_once()
+    statement = session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+    assert 'FROM unnest(' in str(statement)
+    assert 'ON CONFLICT (assignee_id, task_id) DO NOTHING' in str(statement)
+    assert [1, 2] in statement.params.values() and [10, 11] in statement.params.values()
+    assert bulk_assign_tasks(session, []) == 0
+    session.execute.assert_called_once()
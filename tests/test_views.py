@@ -0,0 +1,102 @@
+"""Read-only view rows tests."""
+import os
+from datetime import date, datetime
+from typing import List
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from src.base import Model, db_engine
+from src.change_stamps import table_stamps
+from src.models import Assignee, Manager, Project, Task
+from src.views import PersonRef, ProjectView, TaskRef, cached_views, load_views
+from tests.conftest import test_projects_list
+from utils.utilities import (assignees_to_df, find_assignee_id, find_project_id, find_task_id, find_version,
+                             make_assignees_list, make_managers_list, make_projects_list, make_tasks_list,
+                             managers_to_df, projects_to_df, tasks_to_df)
+
+
+def _session() -> Session:
+    engine = create_engine("sqlite://")
+    Model.metadata.create_all(engine, tables=[Manager.__table__, Project.__table__, Task.__table__,
+                                              Assignee.__table__])
+    session = Session(engine)
+    for number in (1, 2):
+        session.add(Project(project_name=f"Project {number}", project_aim="Aim", project_budget=1000 * number,
+                            manager=Manager(firstname="Max", lastname=f"Manager {number}", salary=300,
+                                            email=f"max{number}@example.com"),
+                            tasks=[Task(task_name=f"Task {number}.{index}", start_date=date(2024, 1, index),
+                                        due_date=date(2024, 2, index), status="not_started") for index in (1, 2)]))
+    session.add_all([Assignee(firstname="Ann", lastname="Lee", salary=100, email="ann@example.com"),
+                     Assignee(firstname="Bob", lastname="Ray", salary=200, email="bob@example.com")])
+    session.commit()
+    return session
+
+
+def test_views_work_with_the_form_helpers_and_frame_builders(test_projects_list: List[Project]) -> None:
+    """Tests that the form helpers and `projects_to_df` give the same results for views as for the models.
+
+    Parameters:
+    test_projects_list : list[Project]
+        A list of Project objects provided by the fixture.
+
+    Returns: None : This test function does not return any value. It asserts that the labels, IDs and frames agree.
+    """
+    with _session() as session:
+        session.execute(update(Project).where(Project.id == 2).values(deleted_at=datetime(2024, 3, 1)))
+        views = load_views(session)
+        projects = session.execute(select(Project).where(Project.deleted_at.is_(None))).scalars().all()
+        tasks = session.execute(select(Task).where(Task.project_id == 1).order_by(Task.id)).scalars().all()
+        assert views.tasks[0].assignees == () and views.projects[0].manager is None
+        assert make_projects_list(views.projects) == make_projects_list(projects) == ["Project 1"]
+        assert make_tasks_list(views.tasks) == ["Task 1.1", "Task 1.2"]
+        assert make_assignees_list(views.assignees) == ["Ann Lee", "Bob Ray"]
+        assert make_managers_list(views.managers) == ["Max Manager 1", "Max Manager 2"]
+        assert find_project_id(views.projects, "Project 1") == projects[0].id
+        assert find_task_id(views.tasks, "Task 1.2") == tasks[1].id
+        assert find_assignee_id(views.assignees, "Bob Ray") == views.assignees[1].id
+        assert find_version(views.projects, projects[0].id) == projects[0].version
+
+    rows = [ProjectView(project.id, 1, project.project_name, project.project_aim, project.project_budget,
+                        PersonRef(project.manager.firstname, project.manager.lastname),
+                        tuple(TaskRef(task.task_name) for task in project.tasks))
+            for project in test_projects_list]
+    assert projects_to_df(rows).equals(projects_to_df(test_projects_list))
+
+
+def test_cached_views_are_read_again_only_after_a_change() -> None:
+    """Tests that cached views are shared until a row of their tables changes.
+
+    Returns: None : This test function does not return any value. It asserts which calls read the rows again.
+    """
+    with _session() as session:
+        views = cached_views(session, stamps=table_stamps(session, [Task]))
+        assert cached_views(session, stamps=table_stamps(session, [Task])) is views
+        session.execute(update(Task).where(Task.id == 1).values(status="done", version=Task.version + 1))
+        changed = cached_views(session, stamps=table_stamps(session, [Task]))
+        assert changed is not views
+        assert (changed.tasks[0].status, changed.tasks[0].version) == ("done", views.tasks[0].version + 1)
+        assert views.tasks[0].status == "not_started"
+
+
+@pytest.mark.skipif(not os.getenv("host"), reason="needs a database")
+def test_related_views_match_the_models() -> None:
+    """Tests that the frames built from views with related rows equal the ones built from eagerly loaded models.
+
+    Returns: None : This test function does not return any value. It asserts that the frames are equal.
+    """
+    with Session(db_engine.engine) as session:
+        views = load_views(session, related=True)
+        projects = session.execute(select(Project).where(Project.deleted_at.is_(None)).order_by(Project.id)
+                                   .options(selectinload(Project.tasks), joinedload(Project.manager))).scalars()
+        assert projects_to_df(views.projects).equals(projects_to_df(projects.all()))
+        tasks = session.execute(select(Task).where(Task.project.has(Project.deleted_at.is_(None))).order_by(Task.id)
+                                .options(selectinload(Task.assignees), joinedload(Task.project))).scalars()
+        assert tasks_to_df(views.tasks).equals(tasks_to_df(tasks.all()))
+        assignees = session.execute(select(Assignee).where(Assignee.deleted_at.is_(None)).order_by(Assignee.id)
+                                    .options(selectinload(Assignee.tasks))).scalars()
+        assert assignees_to_df(views.assignees).equals(assignees_to_df(assignees.all()))
+        managers = session.execute(select(Manager).where(Manager.deleted_at.is_(None)).order_by(Manager.id)
+                                   .options(joinedload(Manager.project))).scalars()
+        assert managers_to_df(views.managers).equals(managers_to_df(managers.all()))
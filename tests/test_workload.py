@@ -0,0 +1,43 @@
+"""Workload analytics tests."""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.workload import ASSIGNMENT_COLUMNS, workload
+
+
+def test_workload_counts_open_overdue_and_upcoming_tasks() -> None:
+    """Tests that the vectorized summary matches counts worked out by hand.
+
+    Assignee 1 has an overdue task, a task due in the second week, a done task and an assignment of an unknown
+    assignee next to it. Assignee 2 has no tasks and gets a row of zeros.
+
+    Returns: None : This test function does not return any value. It asserts the columns of the summary.
+    """
+    assignments = pd.DataFrame([
+        (1, 1, "in_progres", date(2024, 5, 1), date(2024, 5, 31)),
+        (1, 2, "not_started", date(2024, 6, 10), date(2024, 6, 19)),
+        (1, 3, "done", date(2024, 5, 1), date(2024, 6, 3)),
+        (3, 1, "in_progres", date(2024, 5, 1), date(2024, 5, 31)),
+    ], columns=ASSIGNMENT_COLUMNS)
+    assignees = pd.DataFrame({"Full name": ["Alice Brown", "Charlie Davis"], "Salary": [36500.0, 73000.0]},
+                             index=pd.Index([1, 2], name="id"))
+    summary = workload(assignments, assignees, today=date(2024, 6, 10), weeks=2)
+    assert summary.loc[1, ["Not started", "In progress", "Open", "Overdue", "Week 1", "Week 2"]].tolist() == \
+        [1, 1, 2, 1, 0, 1]
+    assert summary.loc[1, "Booked days"] == 31 + 10
+    assert summary.loc[1, "Estimated cost"] == 41 * 100.0
+    assert summary.loc[2, ["Open", "Overdue", "Week 1", "Booked days", "Estimated cost"]].tolist() == [0, 0, 0, 0, 0]
+
+
+def test_workload_of_no_assignments() -> None:
+    """Tests that an empty assignment list still lists every assignee.
+
+    Returns: None : This test function does not return any value. It asserts the shape of the summary.
+    """
+    assignments = pd.DataFrame(columns=ASSIGNMENT_COLUMNS)
+    assignees = pd.DataFrame({"Full name": ["Alice Brown"], "Salary": [36500.0]}, index=pd.Index([1], name="id"))
+    summary = workload(assignments, assignees)
+    assert summary.index.tolist() == [1]
+    assert np.all(summary.drop(columns=["Full name", "Salary"]).to_numpy() == 0)
@@ -0,0 +1,150 @@
+"""Opt-In Memory Profiling of Page Reruns, Enabled With `memory_profile=1` in the .env File."""
+import gc
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+import streamlit as st
+from sqlalchemy.orm import Session
+
+from src.base import db_engine
+from src.queries import compiled_cache_stats
+
+TOP_ALLOCATIONS = 10
+TRACEBACK_FRAMES = 10
+IGNORED_FILES = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", "<unknown>",
+                 tracemalloc.__file__)
+
+_history: dict[str, list[int]] = {}
+_history_lock = threading.Lock()
+
+
+@dataclass
+class RerunProfile:
+    """The memory profile of one page rerun.
+
+    Attributes:
+    page : str
+        The name of the profiled page.
+    rerun : int
+        The number of profiled reruns of the page in this server process, starting with 1.
+    identity_map_size : int
+        The number of ORM instances held in the session's identity map at the end of the run.
+    rerun_growth : int
+        The bytes still allocated after the rerun minus the bytes allocated before it.
+    total_growth : int
+        The bytes allocated after the rerun minus the bytes allocated after the page's first profiled rerun.
+    top_sites : list[str]
+        The source lines that retained the most memory during the rerun, largest first.
+    cache_hit_rate : float, optional
+        The share of the rerun's statements whose SQL came from the compiled cache, None without statements.
+    """
+    page: str
+    rerun: int
+    identity_map_size: int
+    rerun_growth: int
+    total_growth: int
+    top_sites: list[str] = field(default_factory=list)
+    cache_hit_rate: Optional[float] = None
+
+    def __str__(self) -> str:
+        lines = [f"Memory profile of {self.page}, rerun {self.rerun}: identity map {self.identity_map_size} objects, "
+                 f"rerun growth {self.rerun_growth / 1024:+.1f} KiB, growth since first rerun "
+                 f"{self.total_growth / 1024:+.1f} KiB, compiled cache hit rate {_percent(self.cache_hit_rate)}"]
+        lines.extend(f"  {site}" for site in self.top_sites)
+        return "\n".join(lines)
+
+
+def _percent(rate: Optional[float]) -> str:
+    return "n/a" if rate is None else f"{rate:.0%}"
+
+
+def memory_profile_enabled() -> bool:
+    """Tells whether the `memory_profile` environment variable switches the profiling on."""
+    return os.getenv("memory_profile", "").lower() in ("1", "true", "yes")
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    """Collects garbage and takes a snapshot without the allocations of the import machinery and tracemalloc."""
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, file_name) for file_name in IGNORED_FILES])
+
+
+def top_allocation_sites(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot,
+                         limit: int = TOP_ALLOCATIONS) -> list[str]:
+    """Lists the source lines whose retained memory grew the most between two snapshots.
+
+    Returns: list[str]: Lines such as "utils/utilities.py:250: +120.5 KiB (1510 blocks)", largest growth first.
+    """
+    sites = []
+    for stat in after.compare_to(before, "lineno")[:limit]:
+        if stat.size_diff <= 0:
+            break
+        frame = stat.traceback[0]
+        sites.append(f"{frame.filename}:{frame.lineno}: {stat.size_diff / 1024:+.1f} KiB ({stat.count_diff} blocks)")
+    return sites
+
+
+def record_rerun(page: str, traced: int) -> tuple[int, int]:
+    """Records the bytes allocated after a rerun of the page and returns the rerun number and the total growth."""
+    with _history_lock:
+        history = _history.setdefault(page, [])
+        history.append(traced)
+        return len(history), traced - history[0]
+
+
+def show_profile(profile: RerunProfile) -> None:
+    """Prints the profile to the console and shows it in a sidebar expander."""
+    print(profile)
+    with st.sidebar.expander("Memory profile", expanded=False):
+        st.metric("Identity map", f"{profile.identity_map_size} objects")
+        st.metric("Growth since first rerun", f"{profile.total_growth / 1024:.1f} KiB",
+                  f"{profile.rerun_growth / 1024:+.1f} KiB")
+        st.metric("Compiled cache hit rate", _percent(profile.cache_hit_rate))
+        st.caption(f"Rerun {profile.rerun}. Top allocation sites:")
+        st.code("\n".join(profile.top_sites) or "No growth.", language=None)
+
+
+@contextmanager
+def profiled_unit_of_work(page: str, enabled: Optional[bool] = None, read_only: bool = False) -> Iterator[Session]:
+    """Opens the unit of work of a page run and, when profiling is on, profiles the memory the run retains.
+
+    Without profiling this is `db_engine.unit_of_work()`, or its read-only variant. With profiling, `tracemalloc`
+    is started on the first profiled run and snapshots are taken before and after the run. The identity map size
+    is read before the session is committed and closed, and the growth across reruns is kept per page for the
+    server's lifetime. The profile also reports the compiled cache hit rate of the run's statements.
+    The traced memory is process wide, so concurrent sessions of other users show up in the numbers as well.
+
+    Parameters:
+    page : str
+        The name the profiles of the page are reported and accumulated under.
+    enabled : bool, optional
+        Overrides the `memory_profile` environment variable.
+    read_only : bool
+        Opens `db_engine.read_only_unit_of_work()` instead, for pages that only read.
+
+    Yields:
+    session : sqlalchemy.orm.session.Session: The session for the current run.
+    """
+    unit_of_work = db_engine.read_only_unit_of_work if read_only else db_engine.unit_of_work
+    if not (memory_profile_enabled() if enabled is None else enabled):
+        with unit_of_work() as session:
+            yield session
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACEBACK_FRAMES)
+    before = _snapshot()
+    before_size = tracemalloc.get_traced_memory()[0]
+    statements = compiled_cache_stats.snapshot()
+    with unit_of_work() as session:
+        yield session
+        identity_map_size = len(session.identity_map)
+    after = _snapshot()
+    after_size = tracemalloc.get_traced_memory()[0]
+    rerun, total_growth = record_rerun(page, after_size)
+    show_profile(RerunProfile(page, rerun, identity_map_size, after_size - before_size, total_growth,
+                              top_allocation_sites(before, after), compiled_cache_stats.hit_rate(since=statements)))
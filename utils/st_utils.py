@@ -1,13 +1,28 @@
 """Functions that renders Streamlit Page's elements."""
-from typing import List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional, Sequence
 
+import pandas as pd
 import streamlit as st
-from datetime import datetime
-from src.base import db_engine, session
-from src.models import Assignee, Project, Task, Manager, AssigneeTask
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+from src.models import Assignee, Project, Task, Manager
+from src.audit import enable_audit
+from src.views import AssigneeView, ManagerView, ProjectView, TaskView, Views, cached_views
+from src.concurrency import compare_and_swap
+from src.auto_assign import auto_assign_project
+from src.jobs import enqueue_job
+from src.scheduling import Schedule, ScheduleCache, add_dependency, reschedule_task
+from src.purge import project_cascade_size, manager_cascade_size, assignee_cascade_size, mark_deleted
+from src.upserts import create_project_with_manager, insert_person, assign_tasks
 from utils.utilities import (find_project_id, make_assignees_list, make_managers_list, load_lottie_url,
-                             assignees_to_chart, make_projects_list, make_tasks_list, find_task_id,
-                             find_manager_id, find_assignee_id)
+                             make_projects_list, make_tasks_list, find_task_id,
+                             find_manager_id, find_assignee_id, find_version, describe_cascade)
+from utils.profiling import profiled_unit_of_work
+
+_page_forms: ContextVar[Optional[tuple[Session, Views]]] = ContextVar("page_forms", default=None)
 
 
 def page_config() -> None:
@@ -90,25 +105,24 @@ def hero_section() -> None:
             load_lottie_url("https://lottie.host/5b073eca-e11c-4391-8593-b28f39ce0870/q0fz2A3kuN.json")
 
 
-def chart_section(all_assignees_: List[Assignee]) -> None:
+def chart_section(chart: pd.DataFrame) -> None:
     """Displays a bar chart of tasks per assignee in the Streamlit application.
 
     This function creates a section in the Streamlit app that visualizes the distribution
-    of tasks assigned to each assignee. It receives all assignees, processes the data to calculate
-    the number of tasks per assignee, and displays this information in a bar chart.
+    of tasks assigned to each assignee. It receives the number of tasks per assignee and displays
+    this information in a bar chart.
 
-    assignees_from_query : list[Assignee]
-        A list of assignee objects or names obtained from a database query. This list populates the dropdown
-        menu where the user selects the assignee to be assigned to the selected task.
+    chart : pd.DataFrame
+        The "firstname", "lastname" and "tasks" of every assignee, as in `DashboardMetrics.chart` or the output of
+        `assignees_to_chart`. The frame is not modified.
 
     Returns: None: This function does not return any value; it directly modifies the Streamlit UI.
     """
     st.divider()
     st.write("Tasks per assignee:")
-    df = assignees_to_chart(all_assignees_)
-    df['full_name'] = df['firstname'] + ' ' + df['lastname']
-    df.set_index('full_name', inplace=True)
-    tasks_per_assignee = df['tasks']
+    if chart.empty:
+        return
+    tasks_per_assignee = chart.set_index(chart['firstname'] + ' ' + chart['lastname'])['tasks']
     st.bar_chart(tasks_per_assignee)
 
 
@@ -144,15 +158,101 @@ def header_section(section_title: str, section_description: str) -> None:
         st.write(section_description)
 
 
-def edit_project_budget(projects_from_query: list[Project]) -> None:
+def current_actor() -> Optional[str]:
+    """Names the user of the current script run for the audit log.
+
+    Returns: str | None: The viewer's email on Streamlit Community Cloud, otherwise the ID of the browser session,
+    or None outside a script run.
+    """
+    email = st.experimental_user.get("email")
+    if email:
+        return email
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+
+def seen_versions(form_key: str, items: Sequence[Any]) -> dict[int, int]:
+    """Returns the row versions a form displayed in the previous script run and remembers the current ones.
+
+    A form is submitted in the rerun after the one that rendered it. By then the page has already reloaded its
+    data, so the versions the user actually edited are taken from the previous run stored in the session state.
+
+    Parameters:
+    form_key : str
+        The key of the form the versions belong to.
+    items : Sequence
+        The rows rendered by the form in the current run.
+
+    Returns: dict[int, int]: A mapping of row ID to the version displayed in the previous run.
+    """
+    previous = st.session_state.get(f"{form_key}_versions", {})
+    st.session_state[f"{form_key}_versions"] = {item.id: item.version for item in items}
+    return dict(previous)
+
+
+def load_form_views(session: Session) -> Views:
+    """Reads the rows the Edit Data forms offer with `cached_views`, or no rows if reading them fails."""
+    try:
+        return cached_views(session)
+    except Exception as e:
+        session.rollback()
+        print(f"Error: {e}")
+        return Views((), (), (), ())
+
+
+@contextmanager
+def shared_form_run(session: Session, views: Views) -> Iterator[None]:
+    """Lets the form fragments rendered inside the block use the session and rows of the page run."""
+    token = _page_forms.set((session, views))
+    try:
+        yield
+    finally:
+        _page_forms.reset(token)
+
+
+@st.fragment
+def form_fragment(form: Callable[..., None], *lists: str) -> None:
+    """Renders a form as a Streamlit fragment, so that submitting it reruns only this form.
+
+    In a full run of the page the form uses the session and rows the page shares with `shared_form_run`. When a
+    submit reruns the fragment alone, it opens an audited unit of work of its own and reads the rows with
+    `load_form_views`, which reads only the tables' change counters unless a row changed; the rest of the page is
+    neither rerun nor re-read. The other forms keep showing the rows of their last run until they or the page rerun, so
+    a change made here reaches their lists on their next run, and the edit forms' version checks reject writes
+    based on outdated rows as they do for concurrent users.
+
+    Streamlit keeps the arguments of a fragment's first run for its later reruns, so the form gets the names of
+    the `Views` lists it needs rather than the rows themselves.
+
+    Parameters:
+    form : Callable[..., None]
+        The form function, called with the session and the named lists of rows.
+    lists : str
+        The names of the `Views` lists the form takes, in the order of its parameters, e.g. "tasks", "assignees".
+    """
+    shared = _page_forms.get()
+    if shared is not None:
+        session, views = shared
+        form(session, *(getattr(views, name) for name in lists))
+        return
+    with profiled_unit_of_work(f"Edit Data: {form.__name__}") as session:
+        enable_audit(session, current_actor())
+        views = load_form_views(session)
+        form(session, *(getattr(views, name) for name in lists))
+
+
+def edit_project_budget(session: Session, projects_from_query: Sequence[ProjectView]) -> None:
     """Creates a form in the Streamlit application to edit the budget of a selected project.
 
     This function generates a form within a Streamlit app that allows users to update the budget of an existing project.
     Users can select a project from a dropdown menu, provide a new budget amount, and submit the form to save the
-    changes. Once submitted, the project's budget is updated in the database.
+    changes. Once submitted, the project's budget is updated in the database with a compare-and-swap on its version,
+    so a budget changed by someone else since the form was displayed is not overwritten; the user is told instead.
 
     Parameters:
-    projects_from_query : list[Project]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    projects_from_query : Sequence[ProjectView]
         A list of project objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the project they want to update.
 
@@ -164,18 +264,27 @@ def edit_project_budget(projects_from_query: list[Project]) -> None:
         selected_project = st.selectbox('Select a Project task is for:', make_projects_list(projects_from_query),
                                         index=None, placeholder="Select a project...", label_visibility="collapsed")
         provided_budget = st.number_input('Provide budget value, $')
+        selected_project_id = (find_project_id(projects_from_query, selected_project)
+                               if selected_project is not None else None)
+        versions = seen_versions('project_budget', projects_from_query)
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            session.query(Project).filter(Project.project_name == selected_project).update(
-                {Project.project_budget: provided_budget}, synchronize_session=False)
-            session.commit()
-            db_engine.close_session()
-            st.write(f"The project _'{selected_project}'_ budget was set to {provided_budget}$.")
+            current_version = find_version(projects_from_query, selected_project_id)
+            if selected_project_id is None:
+                st.write(f"The project _'{selected_project}'_ could not be found.")
+            elif compare_and_swap(session, Project, selected_project_id,
+                                  versions.get(selected_project_id, current_version),
+                                  {"project_budget": provided_budget}):
+                st.write(f"The project _'{selected_project}'_ budget was set to {provided_budget}$.")
+            else:
+                st.write(f"The project _'{selected_project}'_ was changed by someone else in the meantime. "
+                         f"Please check its current budget and submit again.")
         else:
             st.write('To succeed please select and fill inputs and smash a Submit button.')
 
 
-def assign_task_assignee(tasks_from_query: list[Task], assignees_from_query: list[Assignee]) -> None:
+def assign_task_assignee(session: Session, tasks_from_query: Sequence[TaskView],
+                         assignees_from_query: Sequence[AssigneeView]) -> None:
     """Creates a form in the Streamlit application to assign an assignee to a selected task.
 
     This function generates a form within a Streamlit app that allows users to assign an existing task to an assignee.
@@ -184,10 +293,12 @@ def assign_task_assignee(tasks_from_query: list[Task], assignees_from_query: lis
     database.
 
     Parameters:
-    tasks_from_query : list[Task]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    tasks_from_query : Sequence[TaskView]
         A list of task objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the task to be assigned to an assignee.
-    assignees_from_query : list[Assignee]
+    assignees_from_query : Sequence[AssigneeView]
         A list of assignee objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the assignee to be assigned to the selected task.
 
@@ -200,28 +311,71 @@ def assign_task_assignee(tasks_from_query: list[Task], assignees_from_query: lis
                                      index=None, placeholder="Select a task...")
         selected_assignee = st.selectbox('Select a Assignee to assign:', make_assignees_list(assignees_from_query),
                                          index=None, placeholder="Select a Assignee...")
-        selected_assignee_id = find_assignee_id(assignees_from_query, selected_assignee)
-        selected_task_id = find_task_id(tasks_from_query, selected_task)
+        selected_assignee_id = (find_assignee_id(assignees_from_query, selected_assignee)
+                                if selected_assignee is not None else None)
+        selected_task_id = find_task_id(tasks_from_query, selected_task) if selected_task is not None else None
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            assignee_task_to_add = AssigneeTask(task_id=selected_task_id, assignee_id=selected_assignee_id)
-            session.add(assignee_task_to_add)
-            session.commit()
-            db_engine.close_session()
-            st.write(f"The task _'{selected_task}'_ was assigned to _'{selected_assignee}'_.")
+            if selected_task_id is None or selected_assignee_id is None:
+                st.write("The task or the assignee could not be found.")
+            elif assign_tasks(session, [(selected_assignee_id, selected_task_id)]):
+                st.write(f"The task _'{selected_task}'_ was assigned to _'{selected_assignee}'_.")
+            else:
+                st.write(f"The task _'{selected_task}'_ is already assigned to _'{selected_assignee}'_.")
+        else:
+            st.write('To succeed please select and fill inputs and smash a Submit button.')
+
+
+def auto_assign_tasks(session: Session, projects_from_query: Sequence[ProjectView]) -> None:
+    """Creates a form in the Streamlit application to assign all unassigned tasks of a selected project at once.
+
+    The open tasks of the project that nobody is assigned to are distributed over all assignees by
+    `auto_assign_project`, which balances the assignees' open-task load and avoids overlapping dates, and are
+    written with one bulk insert.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    projects_from_query : Sequence[ProjectView]
+        A list of project objects obtained from a database query. This list populates the dropdown menu where
+        the user selects the project whose tasks are assigned.
+
+    Returns: None : This function does not return any value. It directly modifies the Streamlit UI and writes the
+    assignments to the database upon form submission.
+    """
+    with st.form('auto_assign', clear_on_submit=True):
+        st.write('Auto-assign Unassigned Tasks:')
+        selected_project = st.selectbox('Select a project to assign its tasks:',
+                                        make_projects_list(projects_from_query), index=None,
+                                        placeholder="Select a project...")
+        selected_project_id = (find_project_id(projects_from_query, selected_project)
+                               if selected_project is not None else None)
+        submit_button = st.form_submit_button(label='Submit')
+        if submit_button:
+            if selected_project_id is None:
+                st.write(f"The project _'{selected_project}'_ could not be found.")
+            else:
+                assigned, assignees = auto_assign_project(session, selected_project_id)
+                if assigned:
+                    st.write(f"{assigned} tasks of _'{selected_project}'_ were assigned to {assignees} assignees.")
+                else:
+                    st.write(f"The project _'{selected_project}'_ has no open unassigned tasks.")
         else:
             st.write('To succeed please select and fill inputs and smash a Submit button.')
 
 
-def change_task_status(tasks_from_query: list[Task]) -> None:
+def change_task_status(session: Session, tasks_from_query: Sequence[TaskView]) -> None:
     """Creates a form in the Streamlit application to change the status of a selected task.
 
     This function generates a form within a Streamlit app that allows users to update the status of an existing task.
     Users can select a task from a dropdown menu, choose a new status from predefined options, and submit the form
-    to apply the changes. Upon submission, the selected task's status is updated in the database.
+    to apply the changes. Upon submission, the selected task's status is updated in the database unless the task
+    was changed by someone else since the form was displayed, which is detected by its version counter.
 
     Parameters:
-    tasks_from_query : list[Task]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    tasks_from_query : Sequence[TaskView]
         A list of task objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the task whose status they want to change.
 
@@ -234,26 +388,141 @@ def change_task_status(tasks_from_query: list[Task]) -> None:
                                      index=None, placeholder="Select task...")
         selected_status = st.selectbox('Select a Task status to set', ['not_started', 'in_progres', 'done'],
                                        index=None, placeholder="Select status...")
+        selected_task_id = find_task_id(tasks_from_query, selected_task) if selected_task is not None else None
+        versions = seen_versions('change_status', tasks_from_query)
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            session.query(Task).filter(Task.task_name == selected_task).update(
-                {Task.status: selected_status}, synchronize_session=False)
-            session.commit()
-            db_engine.close_session()
-            st.write(f"The task _'{selected_task}'_ status was changed to _'{selected_status}'_.")
+            current_version = find_version(tasks_from_query, selected_task_id)
+            if selected_task_id is None:
+                st.write(f"The task _'{selected_task}'_ could not be found.")
+            elif compare_and_swap(session, Task, selected_task_id, versions.get(selected_task_id, current_version),
+                                  {"status": selected_status}):
+                st.write(f"The task _'{selected_task}'_ status was changed to _'{selected_status}'_.")
+            else:
+                st.write(f"The task _'{selected_task}'_ was changed by someone else in the meantime. "
+                         f"Please check its current status and submit again.")
         else:
             st.write('To succeed please select input and smash a Submit button.')
 
 
-def set_salary(assignees_from_query: list[Assignee]) -> None:
+def project_schedules() -> ScheduleCache:
+    """Returns the schedule cache of the current browser session, kept in its session state between reruns."""
+    schedules: ScheduleCache = st.session_state.setdefault("project_schedules", ScheduleCache())
+    return schedules
+
+
+def describe_schedule(schedule: Schedule) -> str:
+    """Formats the end of a project's schedule and the length of its critical path as a short sentence."""
+    return (f"The project now ends on {date.fromordinal(schedule.end)}, "
+            f"with {len(schedule.critical_path())} tasks on its critical path.")
+
+
+def reschedule_task_dates(session: Session, tasks_from_query: Sequence[TaskView]) -> None:
+    """Creates a form in the Streamlit application to move the planned dates of a selected task.
+
+    The dates are saved with a compare-and-swap on the task's version. The project's schedule is kept in the
+    session's `project_schedules` cache, so the slip is propagated only through the tasks it moves, and the form
+    shows the project's new end date and critical path.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    tasks_from_query : Sequence[TaskView]
+        A list of task objects obtained from a database query. This list populates the dropdown menu where the
+        user selects the task to reschedule.
+
+    Returns: None : This function does not return any value. It directly modifies the Streamlit UI and updates
+    the task's dates in the database upon form submission.
+    """
+    with st.form('reschedule_task', clear_on_submit=True):
+        st.write('Reschedule Task:')
+        selected_task = st.selectbox('Select a task to reschedule:', make_tasks_list(tasks_from_query),
+                                     index=None, placeholder="Select task...")
+        provided_start_date = st.date_input('Provide start date:', value=None, format="YYYY/MM/DD")
+        provided_due_date = st.date_input('Provide due date:', value=None, format="YYYY/MM/DD")
+        selected_task_id = find_task_id(tasks_from_query, selected_task) if selected_task is not None else None
+        versions = seen_versions('reschedule_task', tasks_from_query)
+        submit_button = st.form_submit_button(label='Submit')
+        if submit_button:
+            current_version = find_version(tasks_from_query, selected_task_id)
+            if selected_task_id is None or current_version is None:
+                st.write(f"The task _'{selected_task}'_ could not be found.")
+            elif not isinstance(provided_start_date, date) or not isinstance(provided_due_date, date):
+                st.write("Please provide both the start and the due date.")
+            elif provided_due_date < provided_start_date:
+                st.write("The due date cannot be before the start date.")
+            else:
+                schedule = reschedule_task(session, selected_task_id,
+                                           versions.get(selected_task_id, current_version), provided_start_date,
+                                           provided_due_date, project_schedules())
+                if schedule is None:
+                    st.write(f"The task _'{selected_task}'_ was changed by someone else in the meantime. "
+                             f"Please check its current dates and submit again.")
+                else:
+                    st.write(f"The task _'{selected_task}'_ now runs from {provided_start_date} to "
+                             f"{provided_due_date}. {describe_schedule(schedule)}")
+        else:
+            st.write('To succeed please select and fill inputs and smash a Submit button.')
+
+
+def add_task_dependency(session: Session, tasks_from_query: Sequence[TaskView]) -> None:
+    """Creates a form in the Streamlit application to make a task wait for another task of its project.
+
+    Dependencies across projects and ones that would close a cycle are rejected. The project's schedule is kept in
+    the session's `project_schedules` cache and updated incrementally, and the form shows the project's new end
+    date and critical path.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    tasks_from_query : Sequence[TaskView]
+        A list of task objects obtained from a database query. This list populates the dropdown menus where the
+        user selects the dependent task and the task it waits for.
+
+    Returns: None : This function does not return any value. It directly modifies the Streamlit UI and stores the
+    dependency in the database upon form submission.
+    """
+    with st.form('add_dependency', clear_on_submit=True):
+        st.write('Add Task Dependency:')
+        tasks = make_tasks_list(tasks_from_query)
+        selected_task = st.selectbox('Select a task that has to wait:', tasks, index=None,
+                                     placeholder="Select task...")
+        selected_predecessor = st.selectbox('Select the task it waits for:', tasks, index=None,
+                                            placeholder="Select task...")
+        selected_task_id = find_task_id(tasks_from_query, selected_task) if selected_task is not None else None
+        selected_predecessor_id = (find_task_id(tasks_from_query, selected_predecessor)
+                                   if selected_predecessor is not None else None)
+        submit_button = st.form_submit_button(label='Submit')
+        if submit_button:
+            if selected_task_id is None or selected_predecessor_id is None:
+                st.write("The tasks could not be found.")
+            else:
+                try:
+                    schedule = add_dependency(session, selected_task_id, selected_predecessor_id, project_schedules())
+                except ValueError as e:
+                    st.write(f"The dependency was not added: {e}")
+                else:
+                    if schedule is None:
+                        st.write(f"The task _'{selected_task}'_ could not be found.")
+                    else:
+                        st.write(f"The task _'{selected_task}'_ now waits for _'{selected_predecessor}'_. "
+                                 f"{describe_schedule(schedule)}")
+        else:
+            st.write('To succeed please select inputs and smash a Submit button.')
+
+
+def set_salary(session: Session, assignees_from_query: Sequence[AssigneeView]) -> None:
     """Creates a form in the Streamlit application to set or update the salary of a selected assignee.
 
     This function generates a form within a Streamlit app that allows users to set or update the salary of an existing
     assignee. Users can select an assignee from a dropdown menu, input a new salary value, and submit the form to apply
-    the changes. Upon submission, the selected assignee's salary is updated in the database.
+    the changes. Upon submission, the selected assignee's salary is updated in the database unless the assignee
+    was changed by someone else since the form was displayed, which is detected by its version counter.
 
     Parameters:
-    assignees_from_query : list[Any]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    assignees_from_query : Sequence[AssigneeView]
         A list of assignee objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the assignee whose salary they want to set or update.
 
@@ -265,24 +534,35 @@ def set_salary(assignees_from_query: list[Assignee]) -> None:
         selected_assignee = st.selectbox('Select a Assignee to assign:', make_assignees_list(assignees_from_query),
                                          index=None, placeholder="Select a assignee...")
         provided_salary = st.number_input('Provide salary value, $')
-        selected_assignee_id = find_assignee_id(assignees_from_query, selected_assignee)
+        selected_assignee_id = (find_assignee_id(assignees_from_query, selected_assignee)
+                                if selected_assignee is not None else None)
+        versions = seen_versions('set_salary', assignees_from_query)
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            session.query(Assignee).filter(Assignee.id == selected_assignee_id).update(
-                {Assignee.salary: provided_salary}, synchronize_session=False)
-            session.commit()
-            db_engine.close_session()
-            st.write(f"The _{selected_assignee}\'s_ salary was set to _{provided_salary}$_.")
+            current_version = find_version(assignees_from_query, selected_assignee_id)
+            if selected_assignee_id is None:
+                st.write(f"The assignee _'{selected_assignee}'_ could not be found.")
+            elif compare_and_swap(session, Assignee, selected_assignee_id,
+                                  versions.get(selected_assignee_id, current_version), {"salary": provided_salary}):
+                st.write(f"The _{selected_assignee}\'s_ salary was set to _{provided_salary}$_.")
+            else:
+                st.write(f"The _{selected_assignee}\'s_ record was changed by someone else in the meantime. "
+                         f"Please check the current salary and submit again.")
         else:
             st.write('To succeed please select and fill inputs and smash a Submit button.')
 
 
-def add_new_project() -> None:
+def add_new_project(session: Session) -> None:
     """Creates a form in the Streamlit application to add a new project along with its manager.
 
     This function generates a form within a Streamlit app that allows users to input details for creating a new project.
     Users can provide the project's name, aim, budget, and details about the manager (first name, last name, email,
-    and salary). Upon submission, the function adds the new manager and project to the database.
+    and salary). Upon submission, the function adds the new manager and project to the database in a single
+    upsert statement; a manager that already exists is reused, and one that already runs a project is reported.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
 
     Returns: None : This function does not return any value. It directly modifies the Streamlit UI and updates
     the database by adding the new project and assigning the specified manager to it.
@@ -301,22 +581,24 @@ def add_new_project() -> None:
                                           max_value=100000.0, step=10.0, value=50000.0)
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            manager_to_add = Manager(firstname=provided_firstname, lastname=provided_lastname,
-                                     salary=provided_salary, email=provided_email)
-            session.add(manager_to_add)
-            session.commit()
-            project_to_add = Project(project_name=project_name, project_aim=project_aim,
-                                     project_budget=project_budget, manager=manager_to_add)
-            session.add(project_to_add)
-            session.commit()
-            db_engine.close_session()
-            st.write(f"The project _'{project_name}'_ was created and manager "
-                     f"was _'{provided_firstname} {provided_lastname}'_ assigned to.")
+            project_id = create_project_with_manager(
+                session,
+                {"project_name": project_name, "project_aim": project_aim, "project_budget": project_budget},
+                {"firstname": provided_firstname, "lastname": provided_lastname, "salary": provided_salary,
+                 "email": provided_email}
+            )
+            if project_id is None:
+                st.write(f"The manager _'{provided_firstname} {provided_lastname}'_ already runs a project, "
+                         f"the project _'{project_name}'_ was not created.")
+            else:
+                st.write(f"The project _'{project_name}'_ was created and manager "
+                         f"was _'{provided_firstname} {provided_lastname}'_ assigned to.")
         else:
             st.write('To succeed please fill and select inputs and smash a Submit button.')
 
 
-def add_new_task(assignees_from_query: list[Assignee], projects_from_query: list[Project]) -> None:
+def add_new_task(session: Session, assignees_from_query: Sequence[AssigneeView],
+                 projects_from_query: Sequence[ProjectView]) -> None:
     """Creates a form in the Streamlit application to add a new task and assign it to a project and assignee.
 
     This function generates a form within a Streamlit app that allows users to input details for creating a new task.
@@ -325,10 +607,12 @@ def add_new_task(assignees_from_query: list[Assignee], projects_from_query: list
     assigns it to the selected assignee.
 
     Parameters:
-    assignees_from_query : list[Assignee]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    assignees_from_query : Sequence[AssigneeView]
         A list of assignee objects or names obtained from a database query. This list populates the dropdown menu where
         the user selects the assignee to whom the task will be assigned.
-    projects_from_query : list[Project]
+    projects_from_query : Sequence[ProjectView]
         A list of project objects or names obtained from a database query. This list populates the dropdown menu where
         the user selects the project to which the task will be associated.
 
@@ -343,7 +627,8 @@ def add_new_task(assignees_from_query: list[Assignee], projects_from_query: list
         provided_due_date = st.date_input('Provide due date:', value=None, format="YYYY/MM/DD")
         selected_project = st.selectbox('Select a Project task is for:', make_projects_list(projects_from_query),
                                         index=None, placeholder="Select a project...")
-        selected_project_id = find_project_id(projects_from_query, selected_project)
+        selected_project_id = (find_project_id(projects_from_query, selected_project)
+                               if selected_project is not None else None)
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
             task_to_add = Task(task_name=provided_task, start_date=provided_start_date,
@@ -351,19 +636,23 @@ def add_new_task(assignees_from_query: list[Assignee], projects_from_query: list
                                project_id=selected_project_id)
 
             session.add(task_to_add)
-            session.commit()
-            db_engine.close_session()
+            session.flush()
             st.write(f"The task _'{provided_task}'_ to the project {selected_project} was created.")
         else:
             st.write('To succeed please select and fill inputs and smash a Submit button.')
 
 
-def add_new_assignee() -> None:
+def add_new_assignee(session: Session) -> None:
     """Creates a form in the Streamlit application to add a new assignee to the system.
 
     This function generates a form within a Streamlit app that allows users to input details for creating a new
     assignee. Users can provide the assignee's first name, last name, email, and salary. Upon submission,
-    the function adds the new assignee to the database.
+    the function adds the new assignee to the database, or reports that the email is already taken without
+    aborting the transaction.
+
+    Parameters:
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
 
     Returns: None : This function does not return any value. It directly modifies the Streamlit UI and updates
     the database by adding the new assignee to the system upon form submission.
@@ -377,26 +666,29 @@ def add_new_assignee() -> None:
                                           max_value=100000.0, step=10.0, value=50000.0)
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            assignee_to_add = Assignee(firstname=provided_firstname, lastname=provided_lastname,
-                                       salary=provided_salary, email=provided_email)
-            session.add(assignee_to_add)
-            session.commit()
-            db_engine.close_session()
-            st.write(f"The assignee _'{provided_firstname} {provided_lastname}'_ was added.")
+            assignee_id = insert_person(session, Assignee, {"firstname": provided_firstname,
+                                                            "lastname": provided_lastname,
+                                                            "salary": provided_salary, "email": provided_email})
+            if assignee_id is None:
+                st.write(f"An assignee with the email _'{provided_email}'_ already exists.")
+            else:
+                st.write(f"The assignee _'{provided_firstname} {provided_lastname}'_ was added.")
         else:
             st.write('To succeed please fill inputs and smash a Submit button.')
 
 
-def delete_project(projects_from_query: list[Project]) -> None:
+def delete_project(session: Session, projects_from_query: Sequence[ProjectView]) -> None:
     """Creates a form in the Streamlit application to delete an existing project from the system.
 
     This function generates a form within a Streamlit app that allows users to delete an existing project.
-    Users can select a project from a dropdown menu and submit the form to remove the project from the database.
-    The function handles the deletion process, including error handling in case the project cannot be found or if
-    an issue occurs during deletion.
+    Users can select a project from a dropdown menu and submit the form to see how many tasks and assignments
+    the deletion cascades to. Once the deletion is confirmed, the project is marked as deleted and a purge job is
+    queued that removes its children in bounded batches, so a large project does not block the UI.
 
     Parameters:
-    projects_from_query : list[Project]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    projects_from_query : Sequence[ProjectView]
         A list of project objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the project they want to delete.
 
@@ -407,37 +699,43 @@ def delete_project(projects_from_query: list[Project]) -> None:
         st.write("Delete Project:")
         selected_project = st.selectbox('Select a Project to delete', make_projects_list(projects_from_query),
                                         index=None, placeholder="Select a project...")
-        selected_project_id = find_project_id(projects_from_query, selected_project)
+        selected_project_id = (find_project_id(projects_from_query, selected_project)
+                               if selected_project is not None else None)
+        confirmed = st.checkbox('I understand that the project tasks and assignments are deleted as well.')
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            project_to_delete = session.query(Project).filter(Project.id == selected_project_id).first()
-            if project_to_delete:
-                try:
-                    # Delete the project from the session and commit the transaction
-                    session.query(Project).filter(Project.id == selected_project_id).delete(synchronize_session='fetch')
-                    session.commit()
-                    st.write(f"The project _'{selected_project}'_ was successfully deleted.")
-                except Exception as e:
-                    session.rollback()
-                    st.write(f"An error occurred: {e}")
-                finally:
-                    db_engine.close_session()
-            else:
+            if selected_project_id is None:
                 st.write(f"The project _'{selected_project}'_ could not be found.")
+                return
+            try:
+                cascade_size = project_cascade_size(session, selected_project_id)
+                if not confirmed:
+                    st.write(f"{describe_cascade(cascade_size)} Please confirm and submit again.")
+                elif mark_deleted(session, Project, selected_project_id):
+                    enqueue_job(session, "purge_project", {"id": selected_project_id})
+                    st.write(f"The project _'{selected_project}'_ was deleted, "
+                             f"{cascade_size['tasks']} tasks are being purged by a background job.")
+                else:
+                    st.write(f"The project _'{selected_project}'_ could not be found.")
+            except Exception as e:
+                session.rollback()
+                st.write(f"An error occurred: {e}")
         else:
             st.write('To succeed please select input and smash a Submit button.')
 
 
-def delete_manager(managers_from_query: list[Manager]) -> None:
+def delete_manager(session: Session, managers_from_query: Sequence[ManagerView]) -> None:
     """Creates a form in the Streamlit application to delete an existing manager from the system.
 
     This function generates a form within a Streamlit app that allows users to delete an existing manager.
-    Users can select a manager from a dropdown menu and submit the form to remove the manager from the database.
-    The function handles the deletion process, including error handling in case the manager cannot be found or if
-    an issue occurs during deletion.
+    Users can select a manager from a dropdown menu and submit the form to see how many rows the deletion cascades
+    to, since deleting a manager deletes the managed project as well. Once the deletion is confirmed, the manager
+    and the project are marked as deleted and a purge job is queued that removes them in bounded batches.
 
     Parameters:
-    managers_from_query : list[Manager]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    managers_from_query : Sequence[ManagerView]
         A list of manager objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the manager they want to delete.
 
@@ -448,27 +746,34 @@ def delete_manager(managers_from_query: list[Manager]) -> None:
         st.write("Delete manager:")
         selected_manager = st.selectbox('Select a Manager to delete', make_managers_list(managers_from_query),
                                         index=None, placeholder="Select a manager...")
-        selected_manager_id = find_manager_id(managers_from_query, selected_manager)
+        selected_manager_id = (find_manager_id(managers_from_query, selected_manager)
+                               if selected_manager is not None else None)
+        confirmed = st.checkbox('I understand that the managed project is deleted as well.')
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            manager_to_delete = session.query(Manager).filter(Manager.id == selected_manager_id).first()
-            if manager_to_delete:
-                try:
-                    session.query(Manager).filter(Manager.id == selected_manager_id).delete(synchronize_session='fetch')
-                    session.commit()
-                    st.write(f"The manager _'{selected_manager}'_ was successfully deleted.")
-                except Exception as e:
-                    session.rollback()
-                    st.write(f"An error occurred: {e}")
-                finally:
-                    db_engine.close_session()
-            else:
+            if selected_manager_id is None:
                 st.write(f"The manager _'{selected_manager}'_ could not be found.")
+                return
+            try:
+                cascade_size = manager_cascade_size(session, selected_manager_id)
+                if not confirmed:
+                    st.write(f"{describe_cascade(cascade_size)} Please confirm and submit again.")
+                elif mark_deleted(session, Manager, selected_manager_id):
+                    session.query(Project).filter(Project.manager_id == selected_manager_id).update(
+                        {Project.deleted_at: datetime.now()}, synchronize_session=False)
+                    enqueue_job(session, "purge_manager", {"id": selected_manager_id})
+                    st.write(f"The manager _'{selected_manager}'_ was deleted, "
+                             f"{cascade_size['tasks']} tasks are being purged by a background job.")
+                else:
+                    st.write(f"The manager _'{selected_manager}'_ could not be found.")
+            except Exception as e:
+                session.rollback()
+                st.write(f"An error occurred: {e}")
         else:
             st.write('To succeed please select input and smash a Submit button.')
 
 
-def delete_task(tasks_from_query: list[Task]) -> None:
+def delete_task(session: Session, tasks_from_query: Sequence[TaskView]) -> None:
     """Creates a form in the Streamlit application to delete an existing task from the system.
 
     This function generates a form within a Streamlit app that allows users to delete an existing task.
@@ -477,7 +782,9 @@ def delete_task(tasks_from_query: list[Task]) -> None:
     an issue occurs during deletion.
 
     Parameters:
-    tasks_from_query : list[Task]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    tasks_from_query : Sequence[TaskView]
         A list of task objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the task they want to delete.
 
@@ -488,36 +795,35 @@ def delete_task(tasks_from_query: list[Task]) -> None:
         st.write("Delete task:")
         selected_task = st.selectbox('Select a Task to delete', make_tasks_list(tasks_from_query),
                                      index=None, placeholder="Select a task...")
-        selected_task_id = find_task_id(tasks_from_query, selected_task)
+        selected_task_id = find_task_id(tasks_from_query, selected_task) if selected_task is not None else None
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
             task_to_delete = session.query(Task).filter(Task.id == selected_task_id).first()
             if task_to_delete:
                 try:
                     session.query(Task).filter(Task.id == selected_task_id).delete(synchronize_session='fetch')
-                    session.commit()
                     st.write(f"The task _'{selected_task}'_ was successfully deleted.")
                 except Exception as e:
                     session.rollback()
                     st.write(f"An error occurred: {e}")
-                finally:
-                    db_engine.close_session()
             else:
                 st.write(f"The task _'{selected_task}'_ could not be found.")
         else:
             st.write('To succeed please select input and smash a Submit button.')
 
 
-def delete_assignee(assignees_from_query: list[Assignee]) -> None:
+def delete_assignee(session: Session, assignees_from_query: Sequence[AssigneeView]) -> None:
     """Creates a form in the Streamlit application to delete an existing assignee from the system.
 
     This function generates a form within a Streamlit app that allows users to delete an existing assignee.
-    Users can select an assignee from a dropdown menu and submit the form to remove the assignee from the database.
-    The function handles the deletion process, including error handling in case the assignee cannot be found or if
-    an issue occurs during deletion.
+    Users can select an assignee from a dropdown menu and submit the form to see how many task assignments the
+    deletion cascades to. Once the deletion is confirmed, the assignee is marked as deleted and a purge job is
+    queued that removes the assignments in bounded batches.
 
     Parameters:
-    assignees_from_query : list[Assignee]
+    session : sqlalchemy.orm.session.Session
+        The session of the current script run. Changes are committed once when the run finishes.
+    assignees_from_query : Sequence[AssigneeView]
         A list of assignee objects or names obtained from a database query. This list populates the dropdown
         menu where the user selects the assignee they want to delete.
 
@@ -528,22 +834,26 @@ def delete_assignee(assignees_from_query: list[Assignee]) -> None:
         st.write("Delete assignee:")
         selected_assignee = st.selectbox('Select a Assignee to delete', make_assignees_list(assignees_from_query),
                                          index=None, placeholder="Select a assignee...")
-        selected_assignee_id = find_assignee_id(assignees_from_query, selected_assignee)
+        selected_assignee_id = (find_assignee_id(assignees_from_query, selected_assignee)
+                                if selected_assignee is not None else None)
+        confirmed = st.checkbox('I understand that the assignee task assignments are deleted as well.')
         submit_button = st.form_submit_button(label='Submit')
         if submit_button:
-            assignee_to_delete = session.query(Assignee).filter(Assignee.id == selected_assignee_id).first()
-            if assignee_to_delete:
-                try:
-                    session.query(Assignee).filter(Assignee.id == selected_assignee_id).delete(
-                        synchronize_session='fetch')
-                    session.commit()
-                    st.write(f"The assignee _'{selected_assignee}'_ was successfully deleted.")
-                except Exception as e:
-                    session.rollback()
-                    st.write(f"An error occurred: {e}")
-                finally:
-                    db_engine.close_session()
-            else:
+            if selected_assignee_id is None:
                 st.write(f"The assignee _'{selected_assignee}'_ could not be found.")
+                return
+            try:
+                cascade_size = assignee_cascade_size(session, selected_assignee_id)
+                if not confirmed:
+                    st.write(f"{describe_cascade(cascade_size)} Please confirm and submit again.")
+                elif mark_deleted(session, Assignee, selected_assignee_id):
+                    enqueue_job(session, "purge_assignee", {"id": selected_assignee_id})
+                    st.write(f"The assignee _'{selected_assignee}'_ was deleted, "
+                             f"{cascade_size['assignee_tasks']} assignments are being purged by a background job.")
+                else:
+                    st.write(f"The assignee _'{selected_assignee}'_ could not be found.")
+            except Exception as e:
+                session.rollback()
+                st.write(f"An error occurred: {e}")
         else:
             st.write('To succeed please select input and smash a Submit button.')
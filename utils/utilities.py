@@ -1,10 +1,13 @@
 """Utility Functions."""
-from typing import Union
+from typing import Any, Optional, Sequence, Union
 
 import streamlit_lottie as lto
 import requests
 import pandas as pd
-from src.models import Manager, Assignee, Project, Task
+from src.models import Manager, Assignee, Project, Task, Job
+from src.views import AssigneeView, ManagerView, ProjectView, TaskView
+
+LOTTIE_TIMEOUT = 5.0
 
 
 def load_lottie_url(url: str) -> None | lto.st_lottie:
@@ -12,20 +15,24 @@ def load_lottie_url(url: str) -> None | lto.st_lottie:
 
     This function sends a GET request to the specified URL to retrieve a Lottie animation file in JSON format.
     If the request is successful (status code 200), the function parses the JSON and returns the Lottie animation
-    object for use in a Streamlit application. If the request fails, it returns `None`.
+    object for use in a Streamlit application. If the request fails, times out or the host cannot be reached, it
+    returns `None`, so the page renders without the animation.
 
     :param url: The URL of the Lottie animation file to load.
 
     :return: The Lottie animation object if the request is successful, otherwise `None`.
     """
-    r = requests.get(url)
+    try:
+        r = requests.get(url, timeout=LOTTIE_TIMEOUT)
+    except requests.RequestException:
+        return None
     if r.status_code != 200:
         return None
     animation = lto.st_lottie(r.json())
     return animation
 
 
-def make_tasks_list(source: list[Task]) -> list[str]:
+def make_tasks_list(source: Sequence[Union[Task, TaskView]]) -> list[str]:
     """Extracts and returns a list of elements from the second position in each record of a given list.
 
     This function processes a list of records (each represented as a list or tuple) and extracts
@@ -44,7 +51,7 @@ def make_tasks_list(source: list[Task]) -> list[str]:
     return result
 
 
-def find_task_id(source: list[Task], selected_task: str) -> Union[Task.id, None]:
+def find_task_id(source: Sequence[Union[Task, TaskView]], selected_task: str) -> Union[Task.id, None]:
     """Finds and returns the ID of a task from a list of records based on the task's name.
 
     This function iterates through a list of records (each represented as a list or tuple),
@@ -66,7 +73,7 @@ def find_task_id(source: list[Task], selected_task: str) -> Union[Task.id, None]
     return None
 
 
-def make_projects_list(source: list[Project]) -> list[str]:
+def make_projects_list(source: Sequence[Union[Project, ProjectView]]) -> list[str]:
     """Creates and returns a list of full names from a list of records.
 
     This function processes a list of records (each represented as a list or tuple),
@@ -88,7 +95,7 @@ def make_projects_list(source: list[Project]) -> list[str]:
     return result
 
 
-def find_project_id(source: list[Project], selected_project: str) -> Union[Project.id, None]:
+def find_project_id(source: Sequence[Union[Project, ProjectView]], selected_project: str) -> Union[Project.id, None]:
     """Finds and returns the ID of a project from a list of records based on the project's name.
 
     This function iterates through a list of records (each represented as a list or tuple),
@@ -110,7 +117,7 @@ def find_project_id(source: list[Project], selected_project: str) -> Union[Proje
     return None
 
 
-def make_assignees_list(source: list[Assignee]) -> list[str]:
+def make_assignees_list(source: Sequence[Union[Assignee, AssigneeView]]) -> list[str]:
     """Creates and returns a list of full names from a list of records.
 
     This function processes a list of records (each represented as a list or tuple),
@@ -132,7 +139,7 @@ def make_assignees_list(source: list[Assignee]) -> list[str]:
     return result
 
 
-def find_assignee_id(source: list[Assignee], selected_person: str) -> Union[Assignee.id, None]:
+def find_assignee_id(source: Sequence[Union[Assignee, AssigneeView]], selected_person: str) -> Union[Assignee.id, None]:
     """Finds and returns the ID of a person from a list of records based on the person's full name.
 
     This function iterates through a list of records (each represented as a list or tuple),
@@ -156,7 +163,7 @@ def find_assignee_id(source: list[Assignee], selected_person: str) -> Union[Assi
     return None
 
 
-def make_managers_list(source: list[Manager]) -> list[str]:
+def make_managers_list(source: Sequence[Union[Manager, ManagerView]]) -> list[str]:
     """Creates and returns a list of full names from a list of records.
 
     This function processes a list of records (each represented as a list or tuple),
@@ -178,7 +185,7 @@ def make_managers_list(source: list[Manager]) -> list[str]:
     return result
 
 
-def find_manager_id(source: list[Manager], selected_person: str) -> Union[Manager.id, None]:
+def find_manager_id(source: Sequence[Union[Manager, ManagerView]], selected_person: str) -> Union[Manager.id, None]:
     """Finds and returns the ID of a person from a list of records based on the person's full name.
 
     This function iterates through a list of records (each represented as a list or tuple),
@@ -202,14 +209,41 @@ def find_manager_id(source: list[Manager], selected_person: str) -> Union[Manage
     return None
 
 
-def assignees_to_df(all_assignees: list[Assignee]) -> pd.DataFrame:
+def find_version(source: Sequence[Any], selected_id: Optional[int]) -> Optional[int]:
+    """Finds and returns the version counter of a record from a list of records based on the record's ID.
+
+    Parameters: source (list): A list of records with `id` and `version` attributes.
+    selected_id (int): The ID of the record to find.
+
+    Returns: int: The version of the record if a match is found; otherwise None.
+    """
+    for item in source:
+        if item.id == selected_id:
+            return int(item.version)
+    return None
+
+
+def describe_cascade(cascade_size: dict[str, int]) -> str:
+    """Formats the number of rows a delete cascades to as a short human-readable sentence.
+
+    Parameters:
+    cascade_size : dict[str, int]
+        A mapping of table name to the number of rows that would be removed.
+
+    Returns: str: A sentence listing the affected tables and their row counts.
+    """
+    parts = [f"{count} {table.replace('_', ' ')}" for table, count in cascade_size.items()]
+    return "Deleting it removes " + ", ".join(parts) + "."
+
+
+def assignees_to_df(all_assignees: Sequence[Union[Assignee, AssigneeView]]) -> pd.DataFrame:
     """Converts a list of Assignee objects into a pandas DataFrame.
 
     This function processes a list of Assignee instances, extracting relevant information to construct a DataFrame.
     Each row in the DataFrame represents an assignee, with columns for the assignee's ID, first name, last name,
     salary, email, associated project name and a list of task names assigned to the assignee.
 
-    Parameters: all_assignees (list): A list of Assignee instances.
+    Parameters: all_assignees (list): A list of Assignee instances or `AssigneeView` rows read with related rows.
 
     Returns: pd.DataFrame: A pandas DataFrame.
     """
@@ -226,7 +260,7 @@ def assignees_to_df(all_assignees: list[Assignee]) -> pd.DataFrame:
     return df
 
 
-def managers_to_df(all_managers: list[Manager]) -> pd.DataFrame:
+def managers_to_df(all_managers: Sequence[Union[Manager, ManagerView]]) -> pd.DataFrame:
     """Converts a list of Manager objects who are project managers into a pandas DataFrame.
 
     This function processes a list of Manager instances, filtering out those who
@@ -235,7 +269,7 @@ def managers_to_df(all_managers: list[Manager]) -> pd.DataFrame:
     with columns for their ID, first name, last name, salary, email, and the name of
     the project they are managing.
 
-    Parameters: all_managers (list): A list of Manager instances.
+    Parameters: all_managers (list): A list of Manager instances or `ManagerView` rows read with related rows.
 
     Returns: pd.DataFrame: A pandas DataFrame.
     """
@@ -253,7 +287,7 @@ def managers_to_df(all_managers: list[Manager]) -> pd.DataFrame:
     return df
 
 
-def projects_to_df(all_projects: list[Project]) -> pd.DataFrame:
+def projects_to_df(all_projects: Sequence[Union[Project, ProjectView]]) -> pd.DataFrame:
     """Converts a list of Project objects into a pandas DataFrame.
 
     This function processes a list of Project instances, extracting key details
@@ -261,7 +295,7 @@ def projects_to_df(all_projects: list[Project]) -> pd.DataFrame:
     represents a project, with columns for the project's ID, name, aim, budget,
     and the name of the person managing the project.
 
-    Parameters: all_projects (list): A list of Project instances.
+    Parameters: all_projects (list): A list of Project instances or `ProjectView` rows read with related rows.
 
     Returns: pd.DataFrame: A pandas DataFrame.
     """
@@ -283,7 +317,7 @@ def projects_to_df(all_projects: list[Project]) -> pd.DataFrame:
     return df
 
 
-def tasks_to_df(all_tasks: list[Task]) -> pd.DataFrame:
+def tasks_to_df(all_tasks: Sequence[Union[Task, TaskView]]) -> pd.DataFrame:
     """Converts a list of Task objects into a pandas DataFrame.
 
     This function takes a list of Task instances and extracts relevant information to
@@ -291,7 +325,7 @@ def tasks_to_df(all_tasks: list[Task]) -> pd.DataFrame:
     for the task's ID, name, start date, due date, status, associated project name,
     and a list of assignees (persons assigned to the task).
 
-    Parameters: all_tasks (list): A list of Task instances.
+    Parameters: all_tasks (list): A list of Task instances or `TaskView` rows read with related rows.
 
     Returns: pd.DataFrame: A pandas DataFrame.
     """
@@ -310,7 +344,7 @@ def tasks_to_df(all_tasks: list[Task]) -> pd.DataFrame:
     return df
 
 
-def assignees_to_chart(all_assignees: list[Assignee]) -> pd.DataFrame:
+def assignees_to_chart(all_assignees: Sequence[Union[Assignee, AssigneeView]]) -> pd.DataFrame:
     """Converts a list of Assignee objects into a pandas DataFrame for charting tasks per assignee.
 
     This function processes a list of assignee instances and compiles relevant details into a structured DataFrame.
@@ -318,7 +352,7 @@ def assignees_to_chart(all_assignees: list[Assignee]) -> pd.DataFrame:
     of tasks they are assigned. This DataFrame is specifically designed to be used for generating charts that
     visualize the distribution of tasks among assignees.
 
-    Parameters: all_assignees (list): A list of Assignee instances.
+    Parameters: all_assignees (list): A list of Assignee instances or `AssigneeView` rows read with related rows.
 
     Returns:pd.DataFrame: A pandas DataFrame.
     """
@@ -332,3 +366,30 @@ def assignees_to_chart(all_assignees: list[Assignee]) -> pd.DataFrame:
         })
     df = pd.DataFrame(data)
     return df
+
+
+def jobs_to_df(all_jobs: list[Job]) -> pd.DataFrame:
+    """Converts a list of Job objects into a pandas DataFrame.
+
+    Each row in the DataFrame represents a job, with columns for the job's ID, kind, status, progress as a fraction
+    of the expected total, last message, worker and the start and finish times.
+
+    Parameters: all_jobs (list): A list of Job instances.
+
+    Returns: pd.DataFrame: A pandas DataFrame.
+    """
+    data = []
+    for job in all_jobs:
+        data.append({
+            "id": job.id,
+            "Kind": job.kind,
+            "Status": job.status,
+            "Progress": min(job.progress / job.total, 1.0) if job.total else (1.0 if job.status == "done" else 0.0),
+            "Done": f"{job.progress}/{job.total}" if job.total else f"{job.progress}",
+            "Message": job.message,
+            "Worker": job.worker,
+            "Started": job.started_at,
+            "Finished": job.finished_at
+        })
+    df = pd.DataFrame(data)
+    return df